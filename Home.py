@@ -13,6 +13,6 @@ st.info("Utilize o menu de navegação na **barra lateral** à esquerda para ace
 st.markdown("""
 ## 📋 Páginas Disponíveis
 * **⚽ Visão Time:** Análise detalhada por time, incluindo evolução de posição, pontos, e sequências de resultados.
-* **🏆 Visão Ranking:** Classificação atual dos times, com indicadores de performance e filtros de local de jogo (casa/ fora).
+* **🏆 Visão Ranking:** Classificação dos times (atual ou ao fim de qualquer rodada), com indicadores de performance, tabela de forma (últimos 3/5/10 jogos), filtros de local de jogo (casa/ fora) e as maiores sequências da liga.
 * **⚔️ Duelo Times:** Indicadores dos times selecionados e resultados do 1º e 2º Turno entre os mesmos. 
 """)
\ No newline at end of file
@@ -0,0 +1 @@
+"""Benchmarks de desempenho do Dashboard (executar com `python -m benchmarks.<modulo>`)."""
@@ -0,0 +1,137 @@
+"""
+Teste de carga local da API JSON (brasileirao.api): o servidor roda em um processo à parte e
+`--clientes` threads fazem requisições com conexões persistentes, sorteando entre as rotas
+(tabelas de todas as rodadas/locais/rankings, times, sequências e confrontos).
+
+Cenários, com requisições/s, p50 e p99 da latência vista pelo cliente:
+- sem cache de respostas: cada requisição consulta o motor e serializa o JSON;
+- cache de respostas: corpo já pronto (200);
+- polling com ETag: o cliente manda If-None-Match e recebe 304 sem corpo.
+
+Uso: python -m benchmarks.bench_api [--clientes 8] [--requisicoes 4000] [--fonte df.xlsx]
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import quote
+
+from brasileirao.metrics import LOCAL_FILTERS
+from brasileirao.profiling import percentile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RANKINGS = ['pontos', 'ataque', 'defesa', 'ppj', 'gpj']
+
+
+def start_server(source, cached=True):
+    """Processo do servidor numa porta livre: (processo, porta)."""
+    command = [sys.executable, '-m', 'brasileirao.api', '--porta', '0', '--fonte', source,
+               '--raiz', os.path.join(ROOT, 'dados')]
+    if not cached:
+        command.append('--sem-cache')
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.PIPE, text=True)
+    port = int(process.stdout.readline().strip().rstrip('/').rsplit(':', 1)[1])
+    return process, port
+
+
+def request(connection, target, etag=None):
+    headers = {'If-None-Match': etag} if etag else {}
+    connection.request('GET', target, headers=headers)
+    response = connection.getresponse()
+    response.read()
+    return response.status, response.getheader('ETag')
+
+
+def route_mix(port):
+    """Rotas da carga, a partir dos times e do número de rodadas que a própria API informa."""
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    connection.request('GET', '/times')
+    teams = json.loads(connection.getresponse().read())['times']
+    connection.request('GET', '/tabela')
+    max_round = json.loads(connection.getresponse().read())['rodada']
+    connection.close()
+
+    routes = [f"/tabela?rodada={r}&ranking={ranking}" + (f"&local={local}" if local else '')
+              for r in range(1, max_round + 1) for local in LOCAL_FILTERS for ranking in RANKINGS]
+    routes += [f"/times/{quote(team)}" for team in teams]
+    routes += [f"/confronto/{quote(a)}/{quote(b)}" for a in teams for b in teams if a != b]
+    routes += [f"/sequencias?tipo={kind}&top=10" for kind in ('V', 'E', 'D', 'invicto', 'sem_vencer')]
+    return routes
+
+
+def load_test(port, routes, clients, total, etags=None, seed=0):
+    """
+    (requisições/s, p50_ms, p99_ms, {status: contagem}). Com `etags` ({rota: ETag}), cada
+    requisição manda If-None-Match, como um cliente que já tem a resposta.
+    """
+    latencies = []
+    statuses = {}
+    lock = threading.Lock()
+    per_client = total // clients
+
+    def worker(index):
+        rng = random.Random(seed + index)
+        connection = http.client.HTTPConnection('127.0.0.1', port)
+        samples, counts = [], {}
+        for _ in range(per_client):
+            target = rng.choice(routes)
+            start = time.perf_counter()
+            status, _ = request(connection, target, etags.get(target) if etags else None)
+            samples.append((time.perf_counter() - start) * 1000)
+            counts[status] = counts.get(status, 0) + 1
+        connection.close()
+        with lock:
+            latencies.extend(samples)
+            for status, count in counts.items():
+                statuses[status] = statuses.get(status, 0) + count
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return len(latencies) / elapsed, percentile(latencies, 50), percentile(latencies, 99), statuses
+
+
+def warm(port, routes):
+    """Uma passada por todas as rotas: motor montado e (com cache) respostas prontas."""
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    etags = {target: request(connection, target)[1] for target in routes}
+    connection.close()
+    return etags
+
+
+def run(source, clients=8, total=4000):
+    """[(cenário, req/s, p50, p99, status)]."""
+    rows = []
+    for name, cached, conditional in [('sem cache de respostas', False, False),
+                                      ('cache de respostas (200)', True, False),
+                                      ('polling com ETag (304)', True, True)]:
+        process, port = start_server(source, cached)
+        try:
+            routes = route_mix(port)
+            etags = warm(port, routes)
+            rows.append((name, *load_test(port, routes, clients, total, etags if conditional else None)))
+        finally:
+            process.terminate()
+            process.wait()
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--clientes', type=int, default=8)
+    parser.add_argument('--requisicoes', type=int, default=4000)
+    parser.add_argument('--fonte', default=os.path.join(ROOT, 'df.xlsx'))
+    args = parser.parse_args()
+
+    print(f"{'cenário':<28}{'req/s':>10}{'p50 (ms)':>10}{'p99 (ms)':>10}  status")
+    for name, rate, p50, p99, statuses in run(os.path.abspath(args.fonte), args.clientes, args.requisicoes):
+        print(f"{name:<28}{rate:>10.0f}{p50:>10.2f}{p99:>10.2f}  {statuses}")
@@ -0,0 +1,134 @@
+"""
+Tamanho serializado e tempo de geração dos gráficos de evolução da página Visão Time.
+
+- antes: os três gráficos Altair recebem o `df_team` inteiro (todas as colunas, inclusive
+  as auxiliares) e são convertidos a cada troca de time;
+- depois: specs enxutos (só as colunas codificadas, dataset nomeado compartilhado pelas
+  camadas), gerados uma vez por time e reaproveitados.
+
+O tamanho é o do proto enviado ao navegador (spec JSON + datasets em Arrow), montado com
+as mesmas funções internas que o st.altair_chart / st.vega_lite_chart usam.
+
+Uso: python -m benchmarks.bench_charts [caminho_do_xlsx] [repeticoes] 2>/dev/null
+"""
+import json
+import statistics
+import sys
+import time
+
+import altair as alt
+import numpy as np
+import pandas as pd
+from streamlit.elements import vega_charts
+from streamlit.proto.ArrowVegaLiteChart_pb2 import ArrowVegaLiteChart
+
+from brasileirao.charts import team_chart_specs
+from brasileirao.dataset import MatchDataset
+from brasileirao.metrics import add_match_columns
+from brasileirao.storage import load_matches
+
+CONSISTENT_BLUE = '#1f77b4'
+
+
+def _baseline_charts(df_team, all_teams_size):
+    """Os três gráficos como eram montados na página (df_team completo em cada camada)."""
+    df_team['Pontos_Acumulados_Calc'] = df_team['Pontos_Jogo'].cumsum()
+    df_team['Destaque_Posicao'] = np.where(
+        df_team['Posicao_Jogo'] == df_team['Posicao_Jogo'].min(), 'Melhor Posição',
+        np.where(df_team['Posicao_Jogo'] == df_team['Posicao_Jogo'].max(), 'Pior Posição', 'Normal')
+    )
+    base = alt.Chart(df_team).encode(
+        x=alt.X('Ordem_Jogo', title='Rodada'),
+        y=alt.Y('Posicao_Jogo', title='Posição no Ranking', scale=alt.Scale(domain=[1, all_teams_size], reverse=True)),
+        tooltip=['Ordem_Jogo', 'Posicao_Jogo', 'Time1', 'Adversario', 'Resultado']
+    )
+    highlight = base.mark_circle(size=100, opacity=1).encode(
+        color=alt.Color('Destaque_Posicao', scale=alt.Scale(domain=['Melhor Posição', 'Pior Posição', 'Normal'],
+                                                             range=['#198754', '#dc3545', 'transparent']),
+                        legend=alt.Legend(title="Performance", orient='bottom')),
+        strokeWidth=alt.value(2)
+    ).transform_filter(alt.FieldOneOfPredicate(field='Destaque_Posicao', oneOf=['Melhor Posição', 'Pior Posição']))
+    posicao = (base.mark_line(color=CONSISTENT_BLUE, point=True).interactive() + highlight).properties(
+        title="Evolução da Posição no Ranking").interactive()
+
+    pontos = alt.Chart(df_team).mark_line(point=True, color=CONSISTENT_BLUE).encode(
+        x=alt.X('Ordem_Jogo', title='Rodada'),
+        y=alt.Y('Pontos_Acumulados_Calc', title='Pontos Acumulados'),
+        tooltip=['Ordem_Jogo', 'Pontos_Acumulados_Calc', 'Adversario', 'Resultado']
+    ).properties(title="Evolução dos Pontos Acumulados").interactive()
+
+    df_team['Saldo_Gols_Acumulado'] = df_team['Saldo_Jogo'].cumsum()
+    df_team['Performance_Saldo'] = df_team['Saldo_Gols_Acumulado'].apply(lambda x: 'Positivo' if x >= 0 else 'Negativo')
+    color_scale = alt.Scale(domain=['Positivo', 'Negativo'], range=['#198754', '#dc3545'])
+    base = alt.Chart(df_team).encode(
+        x=alt.X('Ordem_Jogo', title='Rodada'),
+        y=alt.Y('Saldo_Gols_Acumulado', title='Saldo de Gols Acumulado', scale=alt.Scale(zero=False)),
+        tooltip=['Ordem_Jogo', 'Saldo_Gols_Acumulado', 'Adversario']
+    )
+    rule = alt.Chart(pd.DataFrame({'y': [0]})).mark_rule(color='gray', strokeDash=[3, 3]).encode(y='y')
+    area = base.mark_area(opacity=0.3, line=False).encode(
+        y2=alt.value(0), color=alt.Color('Performance_Saldo:N', scale=color_scale, legend=None))
+    points = base.mark_circle(size=60).encode(
+        color=alt.Color('Performance_Saldo:N', scale=color_scale, legend=alt.Legend(title='Saldo Acumulado', orient='bottom')))
+    saldo = (rule + area + base.mark_line(color='gray') + points).properties(title="Evolução do Saldo de Gols").interactive()
+    return [posicao, pontos, saldo]
+
+
+def _payload(spec):
+    """Proto serializado (bytes enviados ao navegador) para um spec Vega-Lite."""
+    proto = ArrowVegaLiteChart()
+    spec = vega_charts._prepare_vega_lite_spec(spec, True)
+    vega_charts._marshall_chart_data(proto, spec)
+    proto.spec = vega_charts._stabilize_vega_json_spec(json.dumps(spec))
+    return proto.SerializeToString()
+
+
+def _before(dataset, team):
+    df_team = add_match_columns(dataset.team_rows(team).copy(), team)
+    charts = _baseline_charts(df_team, len(dataset.teams))
+    return [_payload(vega_charts._convert_altair_to_vega_lite_spec(chart)) for chart in charts]
+
+
+def _after(specs, team):
+    return [_payload(spec) for spec in specs[team].values()]
+
+
+def _measure(fn, teams, repeats):
+    """Mediana (ms) de uma troca de time."""
+    timings = []
+    for _ in range(repeats):
+        for team in teams:
+            start = time.perf_counter()
+            fn(team)
+            timings.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(timings)
+
+
+def run(file_path='df.xlsx', repeats=3):
+    """Retorna {cenário: (bytes por troca de time, mediana_ms)} e o tempo de gerar os specs."""
+    dataset = MatchDataset(load_matches(file_path))
+    teams = list(dataset.teams)
+
+    start = time.perf_counter()
+    specs = {team: team_chart_specs(dataset.team_rows(team), team, len(dataset.teams)) for team in teams}
+    build_ms = (time.perf_counter() - start) * 1e3 / len(teams)
+
+    before_bytes = statistics.mean(sum(map(len, _before(dataset, team))) for team in teams)
+    after_bytes = statistics.mean(sum(map(len, _after(specs, team))) for team in teams)
+    results = {
+        'antes (Altair + df_team)': (before_bytes, _measure(lambda team: _before(dataset, team), teams, repeats)),
+        'depois (spec em cache)': (after_bytes, _measure(lambda team: _after(specs, team), teams, repeats)),
+    }
+    return results, build_ms
+
+
+if __name__ == '__main__':
+    file_path = sys.argv[1] if len(sys.argv) > 1 else 'df.xlsx'
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    results, build_ms = run(file_path, repeats)
+
+    print(f"geração dos specs enxutos: {build_ms:.1f} ms por time (uma vez por versão do dataset)\n")
+    before_bytes, before_ms = results['antes (Altair + df_team)']
+    print(f"{'3 gráficos por troca de time':<30}{'payload (KiB)':>15}{'tempo (ms)':>12}{'redução':>10}{'speedup':>10}")
+    for name, (size, millis) in results.items():
+        print(f"{name:<30}{size / 1024:>15.1f}{millis:>12.2f}{before_bytes / size:>9.1f}x{before_ms / millis:>9.1f}x")
@@ -0,0 +1,62 @@
+"""
+Tempo de parede da CLI (`python -m brasileirao tabela --rodada N --local C`) em processos
+novos, do início do interpretador até a resposta impressa:
+- snapshot do cubo: consulta respondida pelo .npz (caminho só com NumPy);
+- sem snapshot: pasta de cache vazia a cada execução (lê o Excel, monta o cubo e grava);
+- referências: interpretador vazio e só `import pandas` (piso do caminho com pandas).
+
+Uso: python -m benchmarks.bench_cli [--fonte df.xlsx] [--repeticoes 7]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def wall_ms(command, repeats, prepare=None):
+    """Mediana (ms) do tempo de parede de `command` em processos novos."""
+    samples = []
+    for _ in range(repeats):
+        if prepare is not None:
+            prepare()
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run(source, repeats=7, round_number=10):
+    """[(medição, mediana_ms)]."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = os.path.join(tmp, 'cache')
+        table = [sys.executable, '-m', 'brasileirao', 'tabela', '--rodada', str(round_number), '--local', 'C',
+                 '--fonte', source, '--cache', cache]
+
+        def empty_cache():
+            for name in os.listdir(cache) if os.path.isdir(cache) else []:
+                os.remove(os.path.join(cache, name))
+
+        rows = [
+            ('interpretador vazio', wall_ms([sys.executable, '-c', 'pass'], repeats)),
+            ('import pandas', wall_ms([sys.executable, '-c', 'import pandas'], repeats)),
+            ('tabela sem snapshot', wall_ms(table, repeats, prepare=empty_cache)),
+        ]
+        subprocess.run(table, cwd=ROOT, check=True, stdout=subprocess.DEVNULL) # grava o snapshot
+        rows.append(('tabela com snapshot', wall_ms(table, repeats)))
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--fonte', default=os.path.join(ROOT, 'df.xlsx'))
+    parser.add_argument('--repeticoes', type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'medição':<24}{'mediana (ms)':>14}")
+    for name, median_ms in run(os.path.abspath(args.fonte), args.repeticoes):
+        print(f"{name:<24}{median_ms:>14.1f}")
@@ -0,0 +1,94 @@
+"""
+Latência por interação nas páginas Duelo Times e Visão Time, a partir do log de tempos
+(brasileirao.profiling) gravado a cada rerun.
+
+Cada interação (trocar um time, a janela de jogos, ligar/desligar uma seção) é repetida
+com valores diferentes. Para cada uma, o relatório mostra o custo do rerun da página inteira
+e, quando o widget está dentro de um st.fragment, o custo do fragmento (o que de fato reroda
+no navegador: a página fora do fragmento é mantida). O AppTest sempre reexecuta o script
+inteiro, então o tempo do fragmento vem do registro que ele mesmo grava.
+
+Uso: python -m benchmarks.bench_fragments [--repeticoes 8] [--raiz pasta_do_app]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+
+CHARTS_TOGGLE = '**📊 Gráficos de Evolução**'
+
+# (página, rótulo do widget, tipo, registro do fragmento que contém o widget, preparação)
+# A preparação são toggles (rótulo, valor) ajustados antes das medições.
+INTERACTIONS = [
+    ('pages/3_Duelo Times.py', 'Time da Casa (Time 1):', 'selectbox', 'Duelo Times › duelo', []),
+    ('pages/3_Duelo Times.py', 'Time Visitante (Time 2):', 'selectbox', 'Duelo Times › duelo', []),
+    ('pages/3_Duelo Times.py', 'Desempenho Recente (Últimos Jogos):', 'radio', 'Duelo Times › duelo', []),
+    ('pages/1_Visão Time.py', 'Selecione o Time para Análise:', 'selectbox', None, []),
+    ('pages/1_Visão Time.py', 'Selecione o Time para Análise:', 'selectbox', None, [(CHARTS_TOGGLE, False)]),
+    ('pages/1_Visão Time.py', CHARTS_TOGGLE, 'toggle', 'Visão Time › gráficos', []),
+    ('pages/1_Visão Time.py', '**✨ Destaques de Performance e Sequências**', 'toggle', 'Visão Time › destaques', []),
+]
+
+
+def _widget(at, kind, label):
+    return next((w for w in getattr(at, kind) if w.label == label), None)
+
+
+def _next_value(widget, kind, step):
+    if kind == 'toggle':
+        return not widget.value
+    options = list(widget.options)
+    return options[(options.index(str(widget.value)) + 1 + step) % len(options)]
+
+
+def measure_interactions(root, repeats, log_path):
+    """{(página, widget, preparação): {'pagina_ms', 'fragmento_ms'}} (fragmento vazio se não houver)."""
+    from streamlit.testing.v1 import AppTest
+
+    from brasileirao.profiling import read_log
+
+    results = {}
+    for page, label, kind, fragment, setup in INTERACTIONS:
+        at = AppTest.from_file(os.path.join(root, page), default_timeout=120).run()
+        page_name = read_log(log_path)[-1]['pagina']
+        toggles = [(_widget(at, 'toggle', toggle_label), value) for toggle_label, value in setup]
+        if _widget(at, kind, label) is None or any(toggle is None for toggle, _ in toggles):
+            continue # widget não existe nesta versão da página
+        for toggle, value in toggles:
+            at = toggle.set_value(value).run()
+        description = ', '.join(f"{toggle_label.strip('*')}={value}" for toggle_label, value in setup)
+        samples = results.setdefault((page, label, description), {'pagina_ms': [], 'fragmento_ms': []})
+        for step in range(repeats):
+            start = len(read_log(log_path))
+            widget = _widget(at, kind, label)
+            value = _next_value(widget, kind, step)
+            widget.set_value(value).run()
+            records = read_log(log_path)[start:]
+            samples['pagina_ms'].extend(r['total_ms'] for r in records if r['pagina'] == page_name)
+            samples['fragmento_ms'].extend(r['total_ms'] for r in records if r['pagina'] == fragment)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeticoes', type=int, default=8)
+    parser.add_argument('--raiz', default='.', help='pasta do app (ex.: outra versão em um git worktree)')
+    args = parser.parse_args()
+
+    root = os.path.abspath(args.raiz)
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, 'reruns.jsonl')
+        # O log é lido pelo common.py na importação: precisa estar definido antes do AppTest
+        os.environ['BRASILEIRAO_TIMING_LOG'] = log_path
+        os.chdir(root)
+        sys.path.insert(0, root)
+        results = measure_interactions(root, args.repeticoes, log_path)
+
+    print(f"{'página':<24}{'interação':<60}{'página p50':>12}{'fragmento p50':>15}")
+    for (page, label, description), samples in results.items():
+        if description:
+            label = f"{label} ({description})"
+        page_p50 = statistics.median(samples['pagina_ms']) if samples['pagina_ms'] else float('nan')
+        fragment = f"{statistics.median(samples['fragmento_ms']):.1f} ms" if samples['fragmento_ms'] else '-'
+        print(f"{os.path.basename(page)[:-3]:<24}{label:<60}{page_p50:>9.1f} ms{fragment:>15}")
@@ -0,0 +1,62 @@
+"""
+Verificação e benchmark do cache HTTP do scraper contra o stub local da CBF.
+
+Roda a coleta (tabela + históricos) três vezes com o mesmo cache em disco:
+1. cache vazio (tudo baixado e processado);
+2. servidor com suporte a requisições condicionais (respostas 304, parse reutilizado);
+3. servidor sem ETag/Last-Modified (200 com o mesmo conteúdo: hash igual, parse reutilizado).
+
+Uso: python -m benchmarks.bench_http_cache [caminho_do_xlsx]
+"""
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.fake_cbf import StubCBFServer, pages_from_dataset, render_table_page
+from brasileirao.http_cache import HTTPCache
+from brasileirao.scraper import buscar_dicionario_times, buscar_historicos
+from brasileirao.storage import load_matches
+
+
+def collect(stub, cache):
+    """Coleta completa: dicionário de times + histórico de cada time."""
+    dicionario_times = buscar_dicionario_times(stub.table_url, cache=cache)
+    frames = buscar_historicos(dicionario_times, base_url=stub.history_url, max_workers=4,
+                               requests_per_second=100.0, burst=4, cache=cache)
+    return pd.concat(frames, ignore_index=True)
+
+
+def main(file_path='df.xlsx'):
+    pages = pages_from_dataset(load_matches(file_path))
+    html = {id_time: page for id_time, (_, page) in pages.items()}
+    table = render_table_page({id_time: nome for id_time, (nome, _) in pages.items()})
+
+    # Porta fixa: as URLs (chaves do cache) precisam ser as mesmas entre as execuções
+    with StubCBFServer() as probe:
+        port = int(probe.base_url.rsplit(':', 1)[1])
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        reference = None
+        for name, conditional in [('1. cache vazio', True), ('2. com 304', True), ('3. sem ETag (mesmo hash)', False)]:
+            cache = HTTPCache(cache_dir)
+            with StubCBFServer(html, table_page=table, conditional=conditional, port=port) as stub:
+                start = time.perf_counter()
+                df = collect(stub, cache)
+                elapsed = time.perf_counter() - start
+                not_modified = stub.not_modified
+            reference = df if reference is None else reference
+            print(f"\n{name}: {elapsed * 1000:.0f} ms | 304 enviados pelo stub: {not_modified} | "
+                  f"mesmo resultado: {df.equals(reference)}")
+            print(cache.report())
+
+        # Política de remoção: limite pequeno força o descarte das entradas mais antigas
+        cache = HTTPCache(cache_dir, max_entries=5)
+        with StubCBFServer(html, table_page=table, port=port) as stub:
+            collect(stub, cache)
+        print(f"\nCom max_entries=5: {cache.report()}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else 'df.xlsx')
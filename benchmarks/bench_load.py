@@ -0,0 +1,54 @@
+"""
+Benchmark de carga do df.xlsx: caminho antigo (pd.read_excel) x snapshot Parquet.
+
+- read_excel: o que cada página fazia antes (parse do XLSX via openpyxl).
+- cold: primeira carga após deploy / mudança do arquivo (hash + parse + gravação do snapshot).
+- warm: cargas seguintes (hash + leitura do Parquet).
+
+Uso: python -m benchmarks.bench_load [caminho_do_xlsx] [repeticoes]
+"""
+import statistics
+import sys
+import tempfile
+import time
+
+from brasileirao.storage import load_matches, read_excel_typed
+
+
+def _measure(fn, repeats):
+    """Executa a função N vezes e retorna os tempos em milissegundos."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run(file_path='df.xlsx', repeats=10):
+    """Roda os três cenários e retorna {cenário: (mediana_ms, min_ms)}."""
+    results = {}
+    results['read_excel'] = _measure(lambda: read_excel_typed(file_path), repeats)
+
+    def cold():
+        # Diretório novo a cada execução: nunca existe snapshot
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            load_matches(file_path, snapshot_dir=snapshot_dir)
+
+    results['cold'] = _measure(cold, repeats)
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        load_matches(file_path, snapshot_dir=snapshot_dir)  # Aquece o snapshot
+        results['warm'] = _measure(lambda: load_matches(file_path, snapshot_dir=snapshot_dir), repeats)
+
+    return {name: (statistics.median(t), min(t)) for name, t in results.items()}
+
+
+if __name__ == '__main__':
+    file_path = sys.argv[1] if len(sys.argv) > 1 else 'df.xlsx'
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    summary = run(file_path, repeats)
+    baseline = summary['read_excel'][0]
+    print(f"{'cenário':<12}{'mediana (ms)':>14}{'mín (ms)':>12}{'speedup':>10}")
+    for name, (median_ms, min_ms) in summary.items():
+        print(f"{name:<12}{median_ms:>14.2f}{min_ms:>12.2f}{baseline / median_ms:>9.1f}x")
@@ -0,0 +1,84 @@
+"""
+Peso de página e requisições de imagem por render: logos remotos (Wikimedia, em tamanho
+cheio) x miniaturas locais de 20/50/200px embutidas como data URI.
+
+Sem uma pasta de logos reais, o benchmark gera arquivos de origem sintéticos com as
+dimensões das imagens remotas (largura tirada da URL, 1000px quando não informada) para
+ter uma ordem de grandeza do "antes"; com `pasta_de_logos` usa os arquivos informados.
+
+- Visão Ranking: 20 logos de 20px (tabela);
+- Duelo Times: 2 logos de 50px (cabeçalho);
+- Visão Time: 1 logo de 200px.
+
+Uso: python -m benchmarks.bench_logos [pasta_de_logos]
+"""
+import os
+import re
+import sys
+import tempfile
+
+from brasileirao.logos import TEAM_LOGOS, LogoCatalog, build_thumbnails, team_slug
+
+# Imagens exibidas por render de cada página: (tamanho, quantidade de times)
+PAGE_LOGOS = {
+    'Visão Ranking': (20, len(TEAM_LOGOS)),
+    'Duelo Times': (50, 2),
+    'Visão Time': (200, 1),
+}
+
+
+def _synthetic_sources(source_dir):
+    """Um PNG por time com a largura da imagem remota (gradiente + escudo desenhado)."""
+    from PIL import Image, ImageDraw
+
+    for index, (team, url) in enumerate(TEAM_LOGOS.items()):
+        match = re.search(r'/(\d+)px-', url)
+        width = int(match.group(1)) if match else 1000
+        image = Image.linear_gradient('L').resize((width, width)).convert('RGBA')
+        draw = ImageDraw.Draw(image)
+        draw.ellipse((width // 10, width // 10, width * 9 // 10, width * 9 // 10),
+                     fill=(40 + index * 10, 80, 200 - index * 5, 255), outline=(0, 0, 0, 255), width=max(1, width // 50))
+        draw.text((width // 3, width // 2), team, fill=(255, 255, 255, 255))
+        image.save(os.path.join(source_dir, team_slug(team) + '.png'))
+
+
+def _source_bytes(source_dir, team):
+    return os.path.getsize(os.path.join(source_dir, team_slug(team) + '.png'))
+
+
+def run(source_dir=None):
+    """Retorna {página: (requisições_antes, bytes_antes, requisições_depois, bytes_depois)}."""
+    with tempfile.TemporaryDirectory() as tmp:
+        if source_dir is None:
+            source_dir = os.path.join(tmp, 'origem')
+            os.makedirs(source_dir)
+            _synthetic_sources(source_dir)
+        thumb_dir = os.path.join(tmp, 'thumbs')
+        build_thumbnails(source_dir, thumb_dir)
+
+        remote = LogoCatalog({})
+        local = LogoCatalog.from_directory(thumb_dir)
+        teams = list(TEAM_LOGOS)
+
+        results = {}
+        for page, (size, count) in PAGE_LOGOS.items():
+            shown = teams[:count]
+            # Antes: uma requisição por logo (imagem em tamanho cheio) + as URLs no HTML
+            before_requests = len({remote.url(team, size) for team in shown})
+            before_bytes = sum(_source_bytes(source_dir, team) + len(remote.url(team, size)) for team in shown)
+            # Depois: nenhuma requisição; o peso é o data URI embutido no HTML
+            after_requests = sum(1 for team in shown if not local.url(team, size).startswith('data:'))
+            after_bytes = sum(len(local.url(team, size)) for team in shown)
+            results[page] = (before_requests, before_bytes, after_requests, after_bytes)
+        return results
+
+
+if __name__ == '__main__':
+    source_dir = sys.argv[1] if len(sys.argv) > 1 else None
+    results = run(source_dir)
+
+    print("origem: " + (source_dir or "logos sintéticos com as dimensões das imagens remotas"))
+    print(f"{'por render':<16}{'req. antes':>12}{'KiB antes':>12}{'req. depois':>13}{'KiB depois':>12}{'redução':>10}")
+    for page, (before_requests, before_bytes, after_requests, after_bytes) in results.items():
+        print(f"{page:<16}{before_requests:>12}{before_bytes / 1024:>12.1f}{after_requests:>13}"
+              f"{after_bytes / 1024:>12.1f}{before_bytes / after_bytes:>9.1f}x")
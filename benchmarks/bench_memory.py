@@ -0,0 +1,117 @@
+"""
+Orçamento de memória da camada de dados (tracemalloc) nas ligas sintéticas: falha (código
+de saída 1) quando algum cenário passa do orçamento configurado.
+
+Cenários, com o pico durante a execução e o que fica retido (o que o cache guarda):
+- load_data: carga da última temporada de um histórico particionado de S temporadas
+  (load_season, como as páginas) até o MatchDataset: não deve crescer com S;
+- ranking: cubo de classificação + tabelas de forma + HTML das 15 combinações padrão;
+- graficos: specs Vega-Lite de todos os times (o cache depois de visitar cada time).
+
+Os orçamentos ficam em benchmarks/memory_budgets.json ({tamanho: {cenário: {pico_kib,
+retido_kib}}}); tamanhos sem orçamento são só medidos.
+
+Uso: python -m benchmarks.bench_memory [--orcamentos arquivo.json] [--tamanhos 20x38x1 ...]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+from benchmarks.bench_suite import parse_size
+from benchmarks.synthetic import FIRST_SEASON, write_synthetic_history
+from brasileirao.charts import team_chart_specs
+from brasileirao.dataset import MatchDataset
+from brasileirao.form import FormTable
+from brasileirao.metrics import RANKING_CRITERIA
+from brasileirao.partitions import load_season
+from brasileirao.profiling import MemoryProfiler
+from brasileirao.render import ranking_render_cache
+from brasileirao.standings import StandingsCube
+
+BUDGETS_PATH = os.path.join(os.path.dirname(__file__), 'memory_budgets.json')
+DEFAULT_SIZES = ['20x38x1', '20x38x5', '20x38x20']
+
+
+def _ranking(df):
+    cube = StandingsCube.from_matches(df)
+    renders = ranking_render_cache(cube, FormTable.from_matches(df), {})
+    renders.prebuild([(option, local, cube.max_round, None)
+                      for option in RANKING_CRITERIA for local in (None, 'C', 'F')])
+    return cube, renders
+
+
+def _charts(dataset):
+    return {team: team_chart_specs(dataset.team_rows(team), team, len(dataset.teams)) for team in dataset.teams}
+
+
+def warm_up():
+    """
+    Roda os cenários numa liga mínima fora do tracemalloc: imports tardios e caches de
+    biblioteca (pyarrow, esquema do Vega-Lite) não entram na conta do cenário.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        write_synthetic_history(tmp, 4, 6)
+        dataset = MatchDataset(load_season(FIRST_SEASON, root=tmp))
+        _ranking(dataset.frame)
+        _charts(dataset)
+
+
+def run_scenarios(size):
+    """{cenário: {'pico_kib', 'retido_kib'}} para um tamanho de liga sintética."""
+    n_teams, n_rounds, seasons = parse_size(size)
+    profiler = MemoryProfiler()
+    with tempfile.TemporaryDirectory() as tmp:
+        write_synthetic_history(tmp, n_teams, n_rounds, seasons)
+        season = FIRST_SEASON + seasons - 1
+
+        with profiler:
+            dataset = profiler.measure('load_data', lambda: MatchDataset(load_season(season, root=tmp)))
+            ranking = profiler.measure('ranking', _ranking, dataset.frame)
+            charts = profiler.measure('graficos', _charts, dataset)
+        del ranking, charts
+    return profiler.stats
+
+
+def check(stats, budgets):
+    """[(cenário, métrica, medido, orçamento, estourou)] dos cenários com orçamento."""
+    rows = []
+    for scenario, measured in stats.items():
+        for metric, limit in budgets.get(scenario, {}).items():
+            rows.append((scenario, metric, measured[metric], limit, measured[metric] > limit))
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--orcamentos', default=BUDGETS_PATH)
+    parser.add_argument('--tamanhos', nargs='+', default=DEFAULT_SIZES, help='NxMxS (times x rodadas x temporadas)')
+    args = parser.parse_args()
+
+    with open(args.orcamentos, encoding='utf-8') as f:
+        all_budgets = json.load(f)
+
+    warm_up()
+    failures = 0
+    print(f"{'tamanho':<10}{'cenário':<12}{'pico (KiB)':>12}{'retido (KiB)':>14}  orçamento")
+    for size in args.tamanhos:
+        stats = run_scenarios(size)
+        budgets = all_budgets.get(size, {})
+        exceeded = {(scenario, metric) for scenario, metric, _, _, over in check(stats, budgets) if over}
+        failures += len(exceeded)
+        for scenario, measured in stats.items():
+            limits = budgets.get(scenario)
+            if limits is None:
+                status = 'sem orçamento'
+            else:
+                status = ', '.join(
+                    f"{metric} {measured[metric]:.0f}/{limit:.0f}" + (' ESTOUROU' if (scenario, metric) in exceeded else ' ok')
+                    for metric, limit in limits.items()
+                )
+            print(f"{size:<10}{scenario:<12}{measured['pico_kib']:>12.1f}{measured['retido_kib']:>14.1f}  {status}")
+
+    if failures:
+        print(f"\n{failures} orçamento(s) de memória estourado(s)")
+        sys.exit(1)
+    print("\nTodos os cenários dentro do orçamento")
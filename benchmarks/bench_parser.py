@@ -0,0 +1,98 @@
+"""
+Benchmark do parse dos cards de partida: BeautifulSoup (html.parser) x lxml + XPath.
+
+- fixtures: as 20 páginas de histórico geradas a partir do df.xlsx (38 cards cada).
+- sintética: uma única página com milhares de cards, incluindo cards incompletos
+  (jogo sem placar, time sem title, card sem bloco de placar) que devem ser ignorados.
+
+Os dois parsers precisam devolver exatamente a mesma lista; o script falha caso contrário.
+
+Uso: python -m benchmarks.bench_parser [caminho_do_xlsx] [cards_sinteticos] [repeticoes]
+"""
+import statistics
+import sys
+import time
+
+from benchmarks.fake_cbf import pages_from_dataset, render_history_page
+from brasileirao.parser import extrair_placares, extrair_placares_bs4
+from brasileirao.storage import load_matches
+
+CARD_OPEN = '<div class="styles_gameCardContainer__x1Y2z">'
+
+# Cards fora do padrão que os dois parsers devem descartar
+MALFORMED_CARDS = (
+    # Jogo ainda não realizado: placar sem número
+    '<div class="styles_gameCardContainer__x1Y2z"><div class="styles_score__q9W8e">'
+    '<div><strong title="Bahia">BAH</strong><span class="styles_gol__k3L4">-</span></div>'
+    '<div><strong title="Vitória">VIT</strong><span class="styles_gol__k3L4">-</span></div>'
+    '</div></div>'
+    # Mandante sem title
+    '<div class="styles_gameCardContainer__x1Y2z"><div class="styles_score__q9W8e">'
+    '<div><strong>BAH</strong><span class="styles_gol__k3L4">1</span></div>'
+    '<div><strong title="Vitória">VIT</strong><span class="styles_gol__k3L4">0</span></div>'
+    '</div></div>'
+    # Card sem bloco de placar
+    '<div class="styles_gameCardContainer__x1Y2z"><div class="styles_header__a1b2">Adiado</div></div>'
+)
+
+
+def synthetic_page(n_cards):
+    """Página com `n_cards` jogos válidos intercalados com cards incompletos a cada 100."""
+    matches = [
+        {'Time_Casa': f'Time {i % 20}', 'Placar_Casa': i % 5,
+         'Placar_Fora': (i * 7) % 4, 'Time_Fora': f'Time {(i + 1) % 20}'}
+        for i in range(n_cards)
+    ]
+    html = render_history_page(matches)
+    # Insere os cards incompletos antes de cada centésimo card, sem alterar os válidos
+    head, *cards = html.split(CARD_OPEN)
+    parts = [head]
+    for i, card in enumerate(cards):
+        if i and i % 100 == 0:
+            parts.append(MALFORMED_CARDS)
+        parts.append(CARD_OPEN + card)
+    return ''.join(parts), n_cards
+
+
+def _measure(parse, pages, repeats):
+    """Tempo (s) de cada repetição do parse de todas as páginas, e o resultado da última."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = [parse(html) for html in pages]
+        timings.append(time.perf_counter() - start)
+    return timings, result
+
+
+def run(file_path='df.xlsx', n_cards=5000, repeats=5):
+    """Retorna {cenário: {parser: (cards/s mediana, ms mediana)}} e valida a igualdade."""
+    fixtures = [html for _, html in pages_from_dataset(load_matches(file_path)).values()]
+    synthetic, expected = synthetic_page(n_cards)
+    scenarios = {'fixtures': fixtures, 'sintética': [synthetic]}
+
+    summary = {}
+    for name, pages in scenarios.items():
+        summary[name] = {}
+        outputs = {}
+        for parser_name, parse in (('bs4', extrair_placares_bs4), ('lxml', extrair_placares)):
+            timings, outputs[parser_name] = _measure(parse, pages, repeats)
+            n_parsed = sum(len(r) for r in outputs[parser_name])
+            median_s = statistics.median(timings)
+            summary[name][parser_name] = (n_parsed / median_s, median_s * 1000)
+        if outputs['bs4'] != outputs['lxml']:
+            raise AssertionError(f"Parsers divergem no cenário '{name}'")
+        if name == 'sintética' and len(outputs['lxml'][0]) != expected:
+            raise AssertionError(f"Esperados {expected} cards válidos, obtidos {len(outputs['lxml'][0])}")
+    return summary
+
+
+if __name__ == '__main__':
+    file_path = sys.argv[1] if len(sys.argv) > 1 else 'df.xlsx'
+    n_cards = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    summary = run(file_path, n_cards, repeats)
+    print(f"{'cenário':<12}{'parser':<8}{'cards/s':>12}{'mediana (ms)':>14}{'speedup':>10}")
+    for name, parsers in summary.items():
+        baseline = parsers['bs4'][0]
+        for parser_name, (cards_per_s, median_ms) in parsers.items():
+            print(f"{name:<12}{parser_name:<8}{cards_per_s:>12,.0f}{median_ms:>14.1f}{cards_per_s / baseline:>9.1f}x")
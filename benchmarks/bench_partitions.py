@@ -0,0 +1,81 @@
+"""
+Carga de uma temporada com o histórico particionado (brasileirao.partitions) conforme
+temporadas arquivadas são acrescentadas, contra um arquivo único com todas as temporadas.
+
+Cada temporada é uma liga sintética 20x38 com posições guardadas (como a importação do
+df.xlsx). Medições por número de temporadas arquivadas:
+- particionado: temporada: load_season da última temporada (só a partição dela é aberta);
+- particionado: time/rodada: jogos de um time até a rodada 19, com duas colunas;
+- arquivo único: o Parquet com todas as temporadas lido inteiro e filtrado depois.
+
+Uso: python -m benchmarks.bench_partitions [--temporadas 1 10 50 100] [--repeticoes 7]
+"""
+import argparse
+import os
+import tempfile
+
+import pandas as pd
+
+from benchmarks.bench_suite import measure
+from benchmarks.synthetic import FIRST_SEASON, team_names, write_synthetic_history
+from brasileirao.fixtures import team_perspective
+from brasileirao.partitions import load_season, read_fixtures
+
+DEFAULT_SEASONS = [1, 10, 50, 100]
+
+
+def build_history(root, seasons, n_teams=20, n_rounds=38):
+    """Grava `seasons` temporadas sintéticas particionadas; retorna a tabela única equivalente."""
+    history = write_synthetic_history(root, n_teams, n_rounds, seasons)
+    return pd.concat([fixtures.assign(temporada=season) for season, fixtures in history.items()],
+                     ignore_index=True)
+
+
+def _single_file_season(path, season):
+    df = pd.read_parquet(path)
+    season_fixtures = df[df['temporada'] == season].drop(columns=['temporada'])
+    return team_perspective(season_fixtures.reset_index(drop=True))
+
+
+def run(season_counts=DEFAULT_SEASONS, repeats=7):
+    """[(temporadas, medição, mediana_ms, pico_kib)]."""
+    team = team_names(20)[0]
+    rows = []
+    for seasons in season_counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, 'dados')
+            single_path = os.path.join(tmp, 'todas.parquet')
+            build_history(root, seasons).to_parquet(single_path, index=False)
+            latest = FIRST_SEASON + seasons - 1
+
+            cases = {
+                'particionado: temporada': lambda: load_season(latest, root=root),
+                'particionado: time/rodada': lambda: read_fixtures(
+                    root, [latest], times=[team], rodadas=(1, 19), columns=['Mandante', 'Visitante']),
+                'arquivo único': lambda: _single_file_season(single_path, latest),
+            }
+            for fn in cases.values():
+                fn() # aquecimento: imports tardios e cache de disco fora da medição
+            for name, fn in cases.items():
+                median_ms, _, peak_kib = measure(fn, repeats)
+                rows.append((seasons, name, median_ms, peak_kib))
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--temporadas', nargs='+', type=int, default=DEFAULT_SEASONS)
+    parser.add_argument('--repeticoes', type=int, default=7)
+    args = parser.parse_args()
+
+    rows = run(args.temporadas, args.repeticoes)
+    print(f"{'temporadas':>10}  {'medição':<28}{'mediana (ms)':>14}{'pico (KiB)':>12}")
+    for seasons, name, median_ms, peak_kib in rows:
+        print(f"{seasons:>10}  {name:<28}{median_ms:>14.2f}{peak_kib:>12.1f}")
+
+    # Razão entre o maior e o menor histórico: perto de 1x = custo independente do arquivo
+    first, last = min(args.temporadas), max(args.temporadas)
+    by_key = {(seasons, name): median_ms for seasons, name, median_ms, _ in rows}
+    print(f"\n{last} vs {first} temporada(s):")
+    for name in dict.fromkeys(name for _, name, _, _ in rows):
+        print(f"  {name:<28}{by_key[(last, name)] / by_key[(first, name)]:>6.2f}x")
@@ -0,0 +1,78 @@
+"""
+Latência por interação na página de Ranking: renderizar a tabela HTML a cada troca de
+filtro (consulta ao cubo + Styler.to_html) x consultar o cache de HTML já renderizado.
+
+Cada "interação" é uma troca do selectbox/radio na rodada final, percorrendo as 15
+combinações (5 rankings x 3 locais) e as janelas da tabela de forma.
+
+Uso: python -m benchmarks.bench_ranking_render [caminho_do_xlsx] [repeticoes]
+"""
+import statistics
+import sys
+import time
+
+from brasileirao.form import FORM_WINDOWS, FormTable
+from brasileirao.render import FORM_OPTION, create_ranking_dataframe, ranking_html, ranking_render_cache
+from brasileirao.metrics import RANKING_CRITERIA
+from brasileirao.standings import StandingsCube
+from brasileirao.storage import load_matches
+
+LOCAL_FILTERS = (None, 'C', 'F')
+
+
+def _interactions(round_number):
+    """Combinações (tipo, local, rodada, janela) percorridas pelo usuário."""
+    keys = [(option, local, round_number, None) for option in RANKING_CRITERIA for local in LOCAL_FILTERS]
+    keys += [(FORM_OPTION, local, round_number, window) for window in FORM_WINDOWS for local in LOCAL_FILTERS]
+    return keys
+
+
+def _measure(fn, keys, repeats):
+    """Mediana e p95 (µs) de uma interação, medindo cada chave `repeats` vezes."""
+    timings = []
+    for _ in range(repeats):
+        for key in keys:
+            start = time.perf_counter()
+            fn(*key)
+            timings.append((time.perf_counter() - start) * 1e6)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95)]
+
+
+def run(file_path='df.xlsx', repeats=20):
+    """Retorna ({cenário: (mediana_µs, p95_µs)}, tempo_ms para pré-renderizar tudo, nº de chaves)."""
+    df = load_matches(file_path)
+    cube = StandingsCube.from_matches(df)
+    form_table = FormTable.from_matches(df)
+    keys = _interactions(cube.max_round)
+
+    def render(ranking_option, local_filter, round_number, form_window):
+        ranking_df = create_ranking_dataframe(cube, form_table, round_number, local_filter, ranking_option, form_window)
+        return ranking_html(ranking_df, {})
+
+    cache = ranking_render_cache(cube, form_table, {})
+    start = time.perf_counter()
+    cache.prebuild(keys)
+    prebuild_ms = (time.perf_counter() - start) * 1e3
+
+    for key in keys:
+        if cache.get(*key) != render(*key):
+            raise AssertionError(f"HTML do cache diverge da renderização direta em {key}")
+
+    results = {
+        'renderizar a cada troca': _measure(render, keys, repeats),
+        'cache de HTML': _measure(cache.get, keys, repeats),
+    }
+    return results, prebuild_ms, len(keys)
+
+
+if __name__ == '__main__':
+    file_path = sys.argv[1] if len(sys.argv) > 1 else 'df.xlsx'
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    results, prebuild_ms, n_keys = run(file_path, repeats)
+
+    print(f"pré-renderização de {n_keys} combinações: {prebuild_ms:.1f} ms (uma vez por versão do dataset)\n")
+    baseline = results['renderizar a cada troca'][0]
+    print(f"{'por interação':<26}{'mediana (µs)':>14}{'p95 (µs)':>12}{'speedup':>10}")
+    for name, (median, p95) in results.items():
+        print(f"{name:<26}{median:>14.1f}{p95:>12.1f}{baseline / median:>9.0f}x")
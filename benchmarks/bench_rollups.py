@@ -0,0 +1,79 @@
+"""
+Consultas de todos os tempos pelos agregados materializados (brasileirao.rollups) contra a
+varredura dos jogos de todas as temporadas, conforme o histórico cresce.
+
+Medições por número de temporadas (ligas sintéticas 20x38 particionadas):
+- tabela de todos os tempos: soma das parciais x métricas de cada temporada recalculadas;
+- confronto: retrospecto de um par somado nas parciais x jogos do par em cada temporada;
+- atualização de 1 temporada (relê só ela) x reconstrução de todos os agregados.
+
+Uso: python -m benchmarks.bench_rollups [--temporadas 1 10 50] [--repeticoes 5]
+"""
+import argparse
+import os
+import tempfile
+
+from benchmarks.bench_partitions import FIRST_SEASON, build_history
+from benchmarks.bench_suite import measure
+from benchmarks.synthetic import team_names
+from brasileirao.metrics import SUM_COLUMNS, add_derived_metrics, calculate_all_team_metrics, ranking_table, team_games
+from brasileirao.partitions import DEFAULT_DIVISION, load_season, read_fixtures
+from brasileirao.rollups import FIXTURE_COLUMNS, AllTimeRollup
+
+DEFAULT_SEASONS = [1, 10, 50]
+
+
+def _scan_all_time(root, seasons):
+    total = None
+    for season in seasons:
+        metrics = calculate_all_team_metrics(load_season(season, root=root))[SUM_COLUMNS]
+        total = metrics if total is None else total.add(metrics, fill_value=0)
+    return ranking_table(add_derived_metrics(total))
+
+
+def _scan_head_to_head(root, seasons, team_a, team_b):
+    total = None
+    for season in seasons:
+        games = team_games(load_season(season, root=root))
+        pair = games[(games['Time1'] == team_a) & (games['Time2'] == team_b)]
+        metrics = calculate_all_team_metrics(pair, [team_a])[SUM_COLUMNS]
+        total = metrics if total is None else total.add(metrics, fill_value=0)
+    return total
+
+
+def run(season_counts=DEFAULT_SEASONS, repeats=5):
+    """[(temporadas, medição, mediana_ms)]."""
+    team_a, team_b = team_names(20)[:2]
+    rows = []
+    for n_seasons in season_counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, 'dados')
+            build_history(root, n_seasons)
+            seasons = list(range(FIRST_SEASON, FIRST_SEASON + n_seasons))
+            rollup = AllTimeRollup()
+            rollup.refresh(root)
+            latest = read_fixtures(root, [seasons[-1]], [DEFAULT_DIVISION], columns=FIXTURE_COLUMNS)
+
+            cases = {
+                'todos os tempos: parciais': lambda: rollup.all_time_table(),
+                'todos os tempos: varredura': lambda: _scan_all_time(root, seasons),
+                'confronto: parciais': lambda: rollup.head_to_head(team_a, team_b),
+                'confronto: varredura': lambda: _scan_head_to_head(root, seasons, team_a, team_b),
+                'atualização: 1 temporada': lambda: rollup.update_season(seasons[-1], DEFAULT_DIVISION, latest),
+                'atualização: reconstrução': lambda: AllTimeRollup().refresh(root),
+            }
+            for name, fn in cases.items():
+                median_ms, _, _ = measure(fn, repeats)
+                rows.append((n_seasons, name, median_ms))
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--temporadas', nargs='+', type=int, default=DEFAULT_SEASONS)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'temporadas':>10}  {'medição':<30}{'mediana (ms)':>14}")
+    for n_seasons, name, median_ms in run(args.temporadas, args.repeticoes):
+        print(f"{n_seasons:>10}  {name:<30}{median_ms:>14.2f}")
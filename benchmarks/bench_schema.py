@@ -0,0 +1,83 @@
+"""
+Esquema compacto (categorias + inteiros pequenos) x frame original (object/int64).
+
+- memória: memory_usage(deep=True) do frame de uma temporada e de N temporadas empilhadas.
+- filtro por time: `df[df['Time1'] == nome]` no frame original x o mesmo filtro na coluna
+  categórica, comparação direta dos códigos inteiros e a fatia contígua do MatchDataset.
+
+Uso: python -m benchmarks.bench_schema [caminho_do_xlsx] [temporadas] [repeticoes]
+"""
+import statistics
+import sys
+import time
+
+import pandas as pd
+
+from brasileirao.dataset import MatchDataset
+from brasileirao.schema import apply_schema
+from brasileirao.storage import read_excel_typed
+
+
+def _measure(fn, repeats):
+    """Mediana do tempo de execução em microssegundos."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(timings)
+
+
+def _stack_seasons(df, seasons):
+    """Empilha cópias da temporada com rodadas deslocadas (simula um histórico de N temporadas)."""
+    frames = []
+    for season in range(seasons):
+        frame = df.copy()
+        frame['Ordem_Jogo'] = frame['Ordem_Jogo'] + season * int(df['Ordem_Jogo'].max())
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def run(file_path='df.xlsx', seasons=10, repeats=200):
+    """Retorna (memória {cenário: (original, compacto)}, filtros {método: µs})."""
+    original = read_excel_typed(file_path)
+    stacked = _stack_seasons(original, seasons)
+
+    memory = {}
+    for name, frame in (('1 temporada', original), (f'{seasons} temporadas', stacked)):
+        memory[name] = (frame.memory_usage(deep=True).sum(), apply_schema(frame).memory_usage(deep=True).sum())
+
+    compact = apply_schema(stacked)
+    dataset = MatchDataset(stacked)
+    team = compact['Time1'].cat.categories[0]
+    team_id = dataset.team_id(team)
+    codes = compact['Time1'].cat.codes.to_numpy()
+
+    filters = {
+        'object ==': lambda: stacked[stacked['Time1'] == team],
+        'categoria ==': lambda: compact[compact['Time1'] == team],
+        'códigos ==': lambda: compact[codes == team_id],
+        'fatia do dataset': lambda: dataset.team_rows(team),
+    }
+    expected = len(stacked[stacked['Time1'] == team])
+    for name, fn in filters.items():
+        if len(fn()) != expected:
+            raise AssertionError(f"Filtro '{name}' retornou um número diferente de linhas")
+    return memory, {name: _measure(fn, repeats) for name, fn in filters.items()}, len(stacked)
+
+
+if __name__ == '__main__':
+    file_path = sys.argv[1] if len(sys.argv) > 1 else 'df.xlsx'
+    seasons = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    repeats = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    memory, filters, n_rows = run(file_path, seasons, repeats)
+
+    print(f"{'memória':<16}{'original (KiB)':>16}{'compacto (KiB)':>16}{'redução':>10}")
+    for name, (before, after) in memory.items():
+        print(f"{name:<16}{before / 1024:>16.1f}{after / 1024:>16.1f}{before / after:>9.1f}x")
+
+    print(f"\nfiltro por time ({n_rows} linhas)")
+    baseline = filters['object ==']
+    print(f"{'método':<20}{'mediana (µs)':>14}{'speedup':>10}")
+    for name, micros in filters.items():
+        print(f"{name:<20}{micros:>14.1f}{baseline / micros:>9.1f}x")
@@ -0,0 +1,66 @@
+"""
+Benchmark do scraper contra o stub local da CBF: loop sequencial antigo (uma requisição
+por vez + pausa fixa) x busca concorrente com limite de taxa.
+
+As páginas são geradas a partir do df.xlsx. A pausa do loop antigo (15 s) e a latência
+do servidor são reduzidas pela mesma escala para o benchmark rodar em segundos.
+
+Uso: python -m benchmarks.bench_scraper [caminho_do_xlsx]
+"""
+import sys
+import time
+
+import pandas as pd
+
+from benchmarks.fake_cbf import StubCBFServer, pages_from_dataset
+from brasileirao.scraper import buscar_historicos, processar_historico_time
+from brasileirao.storage import load_matches
+
+# Escala de tempo: 15 s de pausa viram 0,15 s
+OLD_SLEEP = 0.15
+LATENCY = 0.05
+RATE = 10.0  # Requisições por segundo permitidas (equivalente ao limite real escalado)
+
+
+def run_sequential(stub, dicionario_times):
+    """Loop antigo do notebook: uma requisição por vez seguida de pausa fixa."""
+    frames = []
+    for id_time, nome_time in dicionario_times.items():
+        df_time = processar_historico_time(id_time, nome_time, base_url=stub.history_url)
+        if df_time is not None:
+            frames.append(df_time)
+        time.sleep(OLD_SLEEP)
+    return frames
+
+
+def run_concurrent(stub, dicionario_times):
+    """Busca concorrente com token bucket (o parse acontece conforme as respostas chegam)."""
+    return buscar_historicos(dicionario_times, base_url=stub.history_url, max_workers=4,
+                             requests_per_second=RATE, burst=1, backoff=0.05)
+
+
+def main(file_path='df.xlsx'):
+    pages = pages_from_dataset(load_matches(file_path))
+    dicionario_times = {id_time: nome for id_time, (nome, _) in pages.items()}
+    html = {id_time: page for id_time, (_, page) in pages.items()}
+
+    results = {}
+    for name, runner, fail_first in [('sequencial', run_sequential, 0),
+                                     ('concorrente', run_concurrent, 0),
+                                     ('concorrente (1ª tentativa 503)', run_concurrent, 1)]:
+        with StubCBFServer(html, latency=LATENCY, fail_first=fail_first) as stub:
+            start = time.perf_counter()
+            frames = runner(stub, dicionario_times)
+            elapsed = time.perf_counter() - start
+        results[name] = (elapsed, pd.concat(frames, ignore_index=True), len(stub.requests))
+
+    reference = results['sequencial'][1]
+    min_time = len(dicionario_times) / RATE
+    print(f"\n{len(dicionario_times)} times | limite {RATE:.0f} req/s -> mínimo teórico {min_time:.2f}s")
+    for name, (elapsed, df, n_requests) in results.items():
+        same = df.equals(reference)
+        print(f"{name:<32}{elapsed:>8.2f}s  requisições={n_requests:<4} mesmo resultado={same}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) > 1 else 'df.xlsx')
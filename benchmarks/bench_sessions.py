@@ -0,0 +1,108 @@
+"""
+Memória por sessão: st.cache_data (uma cópia desserializada por chamada) x st.cache_resource
+(um dataset somente leitura compartilhado pelo processo).
+
+Cada "sessão" simulada chama os loaders que as páginas usam e mantém o que eles devolvem,
+como um rerun em andamento. A memória alocada (tracemalloc) é medida após 1, 10, 25 e 50
+sessões; com cache_resource o custo por sessão deve ficar praticamente zero.
+
+Uso: python -m benchmarks.bench_sessions [caminho_do_xlsx] [sessoes] 2>/dev/null
+(fora de um `streamlit run` o Streamlit emite avisos de 'bare mode' no stderr)
+"""
+import sys
+import tracemalloc
+
+import streamlit as st
+
+from brasileirao.dataset import MatchDataset
+from brasileirao.head_to_head import HeadToHeadIndex
+from brasileirao.metrics import calculate_all_team_metrics
+from brasileirao.standings import StandingsCube
+from brasileirao.storage import load_matches
+from brasileirao.streaks import StreakIndex
+
+CHECKPOINTS = (1, 10, 25, 50)
+
+
+# Cenário antigo: tudo em st.cache_data (cópia por chamada)
+@st.cache_data
+def _data_frame(file_path):
+    return load_matches(file_path)
+
+
+@st.cache_data
+def _data_metrics(file_path):
+    return calculate_all_team_metrics(_data_frame(file_path))
+
+
+@st.cache_data
+def _data_cube(file_path):
+    return StandingsCube.from_matches(_data_frame(file_path))
+
+
+@st.cache_data
+def _data_streaks(file_path):
+    return StreakIndex.from_matches(_data_frame(file_path))
+
+
+@st.cache_data
+def _data_head_to_head(file_path):
+    return HeadToHeadIndex.from_matches(_data_frame(file_path))
+
+
+# Cenário atual: st.cache_resource (uma instância por processo)
+@st.cache_resource
+def _resource_dataset(file_path):
+    return MatchDataset(load_matches(file_path))
+
+
+@st.cache_resource
+def _resource_metrics(file_path):
+    return calculate_all_team_metrics(_resource_dataset(file_path).frame)
+
+
+@st.cache_resource
+def _resource_cube(file_path):
+    return StandingsCube.from_matches(_resource_dataset(file_path).frame)
+
+
+@st.cache_resource
+def _resource_streaks(file_path):
+    return StreakIndex.from_matches(_resource_dataset(file_path).frame)
+
+
+@st.cache_resource
+def _resource_head_to_head(file_path):
+    return HeadToHeadIndex.from_matches(_resource_dataset(file_path).frame)
+
+
+SCENARIOS = {
+    'cache_data': (_data_frame, _data_metrics, _data_cube, _data_streaks, _data_head_to_head),
+    'cache_resource': (lambda path: _resource_dataset(path).frame, _resource_metrics, _resource_cube,
+                       _resource_streaks, _resource_head_to_head),
+}
+
+
+def measure(loaders, file_path, sessions):
+    """Memória alocada (bytes) mantida pelas sessões em cada checkpoint."""
+    for loader in loaders:
+        loader(file_path)  # Aquece o cache: o custo único não entra na conta
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    held, samples = [], {}
+    for n in range(1, sessions + 1):
+        held.append([loader(file_path) for loader in loaders])
+        if n in CHECKPOINTS or n == sessions:
+            samples[n] = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return samples
+
+
+if __name__ == '__main__':
+    file_path = sys.argv[1] if len(sys.argv) > 1 else 'df.xlsx'
+    sessions = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    print(f"{'cenário':<16}{'sessões':>8}{'total (KiB)':>14}{'por sessão (KiB)':>18}")
+    for name, loaders in SCENARIOS.items():
+        for n, used in measure(loaders, file_path, sessions).items():
+            print(f"{name:<16}{n:>8}{used / 1024:>14.1f}{used / 1024 / n:>18.2f}")
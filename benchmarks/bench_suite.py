@@ -0,0 +1,192 @@
+"""
+Escala das funções quentes em ligas sintéticas (N times x M rodadas x S temporadas), com
+tempo e pico de memória de cada uma e relatório JSON para comparar versões.
+
+As S temporadas são gravadas particionadas e as funções rodam sobre a última, carregada
+como as páginas carregam a temporada escolhida (load_season): N e M mudam o tamanho da
+temporada; S só muda o histórico arquivado ao lado dela.
+
+Funções medidas (nomes das páginas/notebook -> implementação atual):
+- load_data: carga do xlsx da temporada (fria: parse + snapshot Parquet; quente: snapshot);
+- load_season: carga da temporada a partir do histórico particionado;
+- create_ranking_dataframe: cubo de classificação + tabela da última rodada;
+- calculate_game_metrics: jogos de um time com GS/GC/saldo/pontos acumulados;
+- get_max_streak_rounds: índice de sequências + maior sequência de vitórias;
+- tabela_de_forma: janelas de últimos 3/5/10 jogos de todos os times e rodadas;
+- ranking_por_rodada: posição de todos os times em todas as rodadas (cbf.ipynb).
+
+Uso:
+  python -m benchmarks.bench_suite [--tamanhos 20x38x1 20x38x5 ...] [--repeticoes 5]
+                                   [--saida relatorio.json] [--comparar relatorio_antigo.json]
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import FIRST_SEASON, write_synthetic_history, write_synthetic_xlsx
+from brasileirao.dataset import MatchDataset
+from brasileirao.form import FormTable
+from brasileirao.metrics import add_match_columns
+from brasileirao.partitions import load_season
+from brasileirao.ranking import round_positions
+from brasileirao.render import create_ranking_dataframe
+from brasileirao.standings import StandingsCube
+from brasileirao.storage import load_matches
+from brasileirao.streaks import StreakIndex
+
+DEFAULT_SIZES = ['20x38x1', '20x38x5', '20x38x20', '40x78x5']
+
+
+def parse_size(text):
+    """'20x38x5' -> (20 times, 38 rodadas, 5 temporadas)."""
+    n_teams, n_rounds, seasons = (int(part) for part in text.lower().split('x'))
+    return n_teams, n_rounds, seasons
+
+
+def _calculate_game_metrics(dataset, team):
+    df_team = add_match_columns(dataset.team_rows(team).copy(), team)
+    df_team['Pontos_Acumulados_Calc'] = df_team['Pontos_Jogo'].cumsum()
+    return df_team
+
+
+def _max_streak(df, team):
+    return StreakIndex.from_matches(df).longest(team, 'V')
+
+
+def _ranking(df):
+    cube = StandingsCube.from_matches(df)
+    return create_ranking_dataframe(cube, None, cube.max_round)
+
+
+def hot_functions(df, xlsx_path, snapshot_dir, root, season):
+    """{nome: função sem argumentos} para a temporada `season` (já carregada em `df`)."""
+    dataset = MatchDataset(df)
+    team = dataset.teams[0]
+    return {
+        'load_data (fria)': lambda: load_matches(xlsx_path, snapshot_dir=tempfile.mkdtemp(dir=snapshot_dir)),
+        'load_data (quente)': lambda: load_matches(xlsx_path, snapshot_dir=snapshot_dir),
+        'load_season': lambda: load_season(season, root=root),
+        'create_ranking_dataframe': lambda: _ranking(df),
+        'calculate_game_metrics': lambda: _calculate_game_metrics(dataset, team),
+        'get_max_streak_rounds': lambda: _max_streak(df, team),
+        'tabela_de_forma': lambda: FormTable.from_matches(df),
+        'ranking_por_rodada': lambda: round_positions(df, 'Time1', 'Ordem_Jogo', 'notebook'),
+    }
+
+
+def measure(fn, repeats):
+    """(mediana_ms, min_ms, pico_kib): tempos sem tracemalloc e o pico numa execução à parte."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1e3)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return statistics.median(timings), min(timings), peak / 1024
+
+
+def run(sizes=DEFAULT_SIZES, repeats=5, seed=0):
+    """Lista de resultados (um por função e tamanho)."""
+    results = []
+    for size in sizes:
+        n_teams, n_rounds, seasons = parse_size(size)
+        with tempfile.TemporaryDirectory() as tmp:
+            root = os.path.join(tmp, 'dados')
+            write_synthetic_history(root, n_teams, n_rounds, seasons, seed)
+            season = FIRST_SEASON + seasons - 1
+            df = load_season(season, root=root)
+
+            # A mesma temporada como df.xlsx (mesma semente), para a carga pelo Excel
+            xlsx_path = os.path.join(tmp, 'liga.xlsx')
+            write_synthetic_xlsx(xlsx_path, n_teams, n_rounds, seed + seasons - 1)
+            load_matches(xlsx_path, snapshot_dir=tmp) # snapshot para a carga quente
+
+            for name, fn in hot_functions(df, xlsx_path, tmp, root, season).items():
+                median_ms, min_ms, peak_kib = measure(fn, repeats)
+                results.append({
+                    'funcao': name, 'tamanho': size, 'times': n_teams, 'rodadas': n_rounds,
+                    'temporadas': seasons, 'linhas': len(df),
+                    'mediana_ms': round(median_ms, 3), 'min_ms': round(min_ms, 3), 'pico_kib': round(peak_kib, 1),
+                })
+    return results
+
+
+def _git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def report(results, repeats, seed):
+    """Relatório JSON: metadados da execução (versão, ambiente) + resultados."""
+    return {
+        'meta': {
+            'data': datetime.datetime.now().isoformat(timespec='seconds'),
+            'revisao': _git_revision(),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'plataforma': platform.platform(),
+            'repeticoes': repeats,
+            'semente': seed,
+            'escopo': 'última temporada de um histórico particionado de S temporadas (linhas: da temporada)',
+        },
+        'resultados': results,
+    }
+
+
+def compare(old_report, results):
+    """[(funcao, tamanho, ms_antes, ms_agora, razão)] para as medições presentes nos dois."""
+    old = {(r['funcao'], r['tamanho']): r for r in old_report['resultados']}
+    rows = []
+    for r in results:
+        before = old.get((r['funcao'], r['tamanho']))
+        if before is not None:
+            rows.append((r['funcao'], r['tamanho'], before['mediana_ms'], r['mediana_ms'],
+                         r['mediana_ms'] / before['mediana_ms'] if before['mediana_ms'] else float('nan')))
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--tamanhos', nargs='+', default=DEFAULT_SIZES, help='NxMxS (times x rodadas x temporadas)')
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--saida', default='bench_report.json', help='arquivo JSON do relatório')
+    parser.add_argument('--comparar', help='relatório anterior para comparar as medianas')
+    args = parser.parse_args()
+
+    results = run(args.tamanhos, args.repeticoes, args.semente)
+    with open(args.saida, 'w', encoding='utf-8') as f:
+        json.dump(report(results, args.repeticoes, args.semente), f, ensure_ascii=False, indent=2)
+
+    print(f"{'função':<26}{'tamanho':>10}{'linhas':>8}{'mediana (ms)':>14}{'pico (KiB)':>12}")
+    for r in results:
+        print(f"{r['funcao']:<26}{r['tamanho']:>10}{r['linhas']:>8}{r['mediana_ms']:>14.2f}{r['pico_kib']:>12.1f}")
+    print(f"\nrelatório gravado em {args.saida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as f:
+            rows = compare(json.load(f), results)
+        print(f"\n{'comparação':<26}{'tamanho':>10}{'antes (ms)':>12}{'agora (ms)':>12}{'razão':>8}")
+        for name, size, before, now, ratio in rows:
+            flag = '  <- regressão' if ratio > 1.2 else ''
+            print(f"{name:<26}{size:>10}{before:>12.2f}{now:>12.2f}{ratio:>7.2f}x{flag}")
@@ -0,0 +1,195 @@
+"""
+Páginas falsas da CBF e servidor HTTP local (stub) para testar e medir o scraper sem
+acessar o site real.
+
+As páginas seguem a estrutura que o scraper lê (cards `styles_gameCardContainer`,
+placar em `styles_score`, nomes em `<strong title>` e gols em `styles_gol`). O servidor
+também pode servir páginas salvas (`<pasta>/<id_time>.html`), simular latência, falhas
+temporárias (503) e limite de taxa (429), e responde 304 a requisições condicionais
+(ETag / Last-Modified).
+"""
+import hashlib
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pandas as pd
+
+# Caminhos servidos pelo stub (mesmo formato do URL_CBF e do BASE_URL_HISTORICO)
+TABLE_PATH = "/futebol-brasileiro/tabelas/campeonato-brasileiro/serie-a/2025"
+HISTORY_PATH = "/futebol-brasileiro/times/campeonato-brasileiro/serie-a/2025/{id_time}"
+
+LAST_MODIFIED = "Mon, 01 Dec 2025 12:00:00 GMT"
+
+CARD_TEMPLATE = (
+    '<div class="styles_gameCardContainer__x1Y2z">'
+    '<div class="styles_header__a1b2"><span>Rodada {rodada}</span></div>'
+    '<div class="styles_score__q9W8e">'
+    '<div><strong title="{casa}">{sigla_casa}</strong><span class="styles_gol__k3L4">{gols_casa}</span></div>'
+    '<div><strong title="{fora}">{sigla_fora}</strong><span class="styles_gol__k3L4">{gols_fora}</span></div>'
+    '</div></div>'
+)
+
+
+def render_history_page(matches):
+    """
+    Gera o HTML da aba 'histórico de partidas' a partir de uma lista de dicionários com
+    Time_Casa, Placar_Casa, Placar_Fora e Time_Fora (do jogo mais recente para o mais antigo).
+    """
+    cards = [
+        CARD_TEMPLATE.format(
+            rodada=len(matches) - i, casa=m['Time_Casa'], fora=m['Time_Fora'],
+            sigla_casa=m['Time_Casa'][:3].upper(), sigla_fora=m['Time_Fora'][:3].upper(),
+            gols_casa=m['Placar_Casa'], gols_fora=m['Placar_Fora'],
+        )
+        for i, m in enumerate(matches)
+    ]
+    return (
+        '<!DOCTYPE html><html><head><title>Histórico de partidas</title></head><body>'
+        '<main><section class="styles_history__z0">' + ''.join(cards) + '</section></main></body></html>'
+    )
+
+
+def render_table_page(dicionario_times):
+    """Gera o HTML da tabela do campeonato com os links dos times ({id: nome})."""
+    rows = ''.join(
+        f'<tr><td><a href="/futebol-brasileiro/times/campeonato-brasileiro/serie-a/2025/{id_time}">'
+        f'<strong>{nome}</strong></a></td></tr>'
+        for id_time, nome in dicionario_times.items()
+    )
+    return f'<!DOCTYPE html><html><body><table><tbody>{rows}</tbody></table></body></html>'
+
+
+def pages_from_dataset(df):
+    """Monta {id_time: (nome, html)} a partir do DataFrame no formato do df.xlsx."""
+    pages = {}
+    for id_time, df_time in df.drop_duplicates(subset=['Time_Foco_ID', 'Ordem_Jogo']).groupby('Time_Foco_ID', sort=False):
+        df_time = df_time.sort_values('Ordem_Jogo', ascending=False)
+        em_casa = df_time['Local'] == 'C'
+        matches = pd.DataFrame({
+            'Time_Casa': df_time['Time1'].where(em_casa, df_time['Time2']),
+            'Placar_Casa': df_time['Gols1'].where(em_casa, df_time['Gols2']),
+            'Placar_Fora': df_time['Gols2'].where(em_casa, df_time['Gols1']),
+            'Time_Fora': df_time['Time2'].where(em_casa, df_time['Time1']),
+        }).to_dict('records')
+        pages[int(id_time)] = (df_time['Time1'].iloc[0], render_history_page(matches))
+    return pages
+
+
+class StubCBFServer:
+    """
+    Servidor HTTP local que responde como a CBF. `pages` é {id_time: html}; `pages_dir`
+    permite servir páginas salvas. `latency` (s) simula a rede e `fail_first` faz as N
+    primeiras requisições de cada time responderem `fail_status`.
+    """
+
+    def __init__(self, pages=None, pages_dir=None, latency=0.0, fail_first=0, fail_status=503,
+                 table_page=None, conditional=True, port=0):
+        self.pages = dict(pages or {})
+        self.table_page = table_page
+        self.conditional = conditional
+        self.port = port  # 0 = porta livre qualquer
+        self.pages_dir = pages_dir
+        self.latency = latency
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        self.requests = []  # (instante, caminho) de cada requisição recebida
+        self.not_modified = 0  # Respostas 304 enviadas
+        self._attempts = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def table_url(self):
+        """URL no formato de URL_CBF apontando para o stub."""
+        return self.base_url + TABLE_PATH
+
+    @property
+    def history_url(self):
+        """URL no formato de BASE_URL_HISTORICO apontando para o stub."""
+        return self.base_url + HISTORY_PATH + "?tab=historico-de-partidas"
+
+    def _page(self, id_time):
+        if id_time in self.pages:
+            return self.pages[id_time]
+        if self.pages_dir:
+            path = os.path.join(self.pages_dir, f"{id_time}.html")
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as f:
+                    return f.read()
+        return None
+
+    def handle(self, handler):
+        """Responde uma requisição GET (chamado pelo handler HTTP)."""
+        path = urlparse(handler.path).path
+        with self._lock:
+            self.requests.append((time.monotonic(), path))
+            attempt = self._attempts[path] = self._attempts.get(path, 0) + 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if attempt <= self.fail_first:
+            handler.send_response(self.fail_status)
+            handler.send_header('Content-Length', '0')
+            handler.end_headers()
+            return
+
+        last_part = path.rstrip('/').rsplit('/', 1)[-1]
+        if path == TABLE_PATH:
+            body = self.table_page
+        else:
+            body = self._page(int(last_part)) if last_part.isdigit() else None
+        if body is None:
+            handler.send_response(404)
+            handler.send_header('Content-Length', '0')
+            handler.end_headers()
+            return
+
+        data = body.encode('utf-8')
+        etag = '"' + hashlib.sha256(data).hexdigest()[:16] + '"'
+        if self.conditional and (handler.headers.get('If-None-Match') == etag
+                                 or handler.headers.get('If-Modified-Since') == LAST_MODIFIED):
+            with self._lock:
+                self.not_modified += 1
+            handler.send_response(304)
+            handler.send_header('ETag', etag)
+            handler.end_headers()
+            return
+
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/html; charset=utf-8')
+        handler.send_header('Content-Length', str(len(data)))
+        if self.conditional:
+            handler.send_header('ETag', etag)
+            handler.send_header('Last-Modified', LAST_MODIFIED)
+        handler.end_headers()
+        handler.wfile.write(data)
+
+    def __enter__(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', self.port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,112 @@
+"""
+Gerador determinístico de ligas sintéticas no mesmo esquema do df.xlsx, para medir como
+as funções quentes escalam com N times x M rodadas x S temporadas.
+
+A tabela de jogos segue um turno e returno (método do círculo) repetido até completar as
+M rodadas da temporada; os placares vêm de uma Poisson com semente fixa. A visão por time
+(acumulados, resultado e posição por rodada) é derivada da tabela canônica com
+`team_perspective`, como o app faz com o df.xlsx.
+
+Um histórico de S temporadas é gravado como o app o lê: uma partição por temporada
+(brasileirao.partitions), cada uma com a numeração dos jogos começando em 1 e semente
+própria (`seed + i`).
+"""
+import numpy as np
+import pandas as pd
+
+from brasileirao.fixtures import fixtures_from_perspective, team_perspective
+from brasileirao.partitions import write_partition
+
+# Médias de gols do mandante e do visitante (próximas às do Brasileirão)
+HOME_GOALS = 1.4
+AWAY_GOALS = 1.1
+
+# Primeira temporada dos históricos sintéticos
+FIRST_SEASON = 2000
+
+
+def team_names(n_teams):
+    return [f'Time {i:03d}' for i in range(1, n_teams + 1)]
+
+
+def round_robin(n_teams):
+    """
+    Rodadas de um turno e returno pelo método do círculo: lista de rodadas, cada uma com
+    pares (mandante, visitante) de índices. Com N ímpar, um time folga a cada rodada.
+    """
+    slots = list(range(n_teams)) + ([None] if n_teams % 2 else [])
+    half = len(slots) // 2
+    first_leg = []
+    for r in range(len(slots) - 1):
+        pairs = []
+        for i in range(half):
+            a, b = slots[i], slots[-1 - i]
+            if a is not None and b is not None:
+                # Alterna o mando para não concentrar jogos em casa
+                pairs.append((a, b) if (r + i) % 2 == 0 else (b, a))
+        first_leg.append(pairs)
+        slots = [slots[0]] + [slots[-1]] + slots[1:-1]
+    return first_leg + [[(b, a) for a, b in pairs] for pairs in first_leg]
+
+
+def synthetic_fixtures(n_teams=20, n_rounds=38, seed=0):
+    """Tabela canônica (uma linha por jogo) de uma temporada com M rodadas."""
+    rng = np.random.default_rng(seed)
+    schedule = round_robin(n_teams)
+    names = np.array(team_names(n_teams), dtype=object)
+
+    home, away = [], []
+    for r in range(n_rounds):
+        for a, b in schedule[r % len(schedule)]:
+            home.append(a)
+            away.append(b)
+    home, away = np.array(home, dtype=np.int64), np.array(away, dtype=np.int64)
+
+    # Número do jogo de cada time: contador por time na ordem das rodadas
+    played = np.zeros(n_teams, dtype=np.int64)
+    game_home, game_away = np.empty(len(home), dtype=np.int64), np.empty(len(home), dtype=np.int64)
+    for i, (a, b) in enumerate(zip(home, away)):
+        played[a] += 1
+        played[b] += 1
+        game_home[i], game_away[i] = played[a], played[b]
+
+    fixtures = pd.DataFrame({
+        'Mandante': names[home],
+        'Visitante': names[away],
+        'Mandante_ID': (1000 + home).astype(np.int32),
+        'Visitante_ID': (1000 + away).astype(np.int32),
+        'Gols_Mandante': np.minimum(rng.poisson(HOME_GOALS, len(home)), 9).astype(np.int8),
+        'Gols_Visitante': np.minimum(rng.poisson(AWAY_GOALS, len(home)), 9).astype(np.int8),
+        'Jogo_Mandante': game_home.astype(np.int16),
+        'Jogo_Visitante': game_away.astype(np.int16),
+    })
+    teams = pd.CategoricalDtype(np.sort(names))
+    fixtures[['Mandante', 'Visitante']] = fixtures[['Mandante', 'Visitante']].astype(teams)
+    return fixtures
+
+
+def synthetic_league(n_teams=20, n_rounds=38, seed=0):
+    """DataFrame por time (duas linhas por jogo) de uma temporada, no esquema do df.xlsx."""
+    return team_perspective(synthetic_fixtures(n_teams, n_rounds, seed))
+
+
+def write_synthetic_history(root, n_teams=20, n_rounds=38, seasons=1, seed=0):
+    """
+    Grava S temporadas particionadas em `root` (com as posições guardadas, como a importação
+    do df.xlsx) e retorna {temporada: tabela canônica gravada}.
+    """
+    history = {}
+    for i in range(seasons):
+        fixtures = fixtures_from_perspective(synthetic_league(n_teams, n_rounds, seed + i))
+        write_partition(fixtures, FIRST_SEASON + i, root=root)
+        history[FIRST_SEASON + i] = fixtures
+    return history
+
+
+def write_synthetic_xlsx(path, n_teams=20, n_rounds=38, seed=0):
+    """Grava uma temporada sintética como o notebook grava o df.xlsx (com a coluna de índice)."""
+    df = synthetic_league(n_teams, n_rounds, seed)
+    for column in ('Local', 'Time1', 'Time2', 'Resultado'):
+        df[column] = df[column].astype(object)
+    df.to_excel(path)
+    return df
@@ -0,0 +1,32 @@
+"""
+Núcleo de dados e cálculos do Dashboard do Brasileirão (sem dependência do Streamlit).
+
+Os nomes abaixo são importados sob demanda (PEP 562): `import brasileirao` não carrega
+pandas, pyarrow nem Altair, só o módulo da classe pedida.
+
+    from brasileirao import LeagueEngine
+    engine = LeagueEngine.from_source('df.xlsx')
+    engine.table(round_number=10, local_filter='C')
+
+Linha de comando: python -m brasileirao --help
+"""
+import importlib
+
+_EXPORTS = {
+    'LeagueEngine': 'brasileirao.engine',
+    'load_source': 'brasileirao.engine',
+    'MatchDataset': 'brasileirao.dataset',
+    'StandingsCube': 'brasileirao.standings',
+    'FormTable': 'brasileirao.form',
+    'StreakIndex': 'brasileirao.streaks',
+    'HeadToHeadIndex': 'brasileirao.head_to_head',
+    'AllTimeRollup': 'brasileirao.rollups',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'brasileirao' has no attribute {name!r}")
+    return getattr(importlib.import_module(_EXPORTS[name]), name)
@@ -0,0 +1,166 @@
+"""
+Consultas pela linha de comando, sobre a mesma fonte de dados das páginas (a temporada mais
+recente do histórico particionado ou, sem ele, o df.xlsx):
+
+    python -m brasileirao tabela --rodada 10 --local C [--ranking ataque]
+    python -m brasileirao time Flamengo
+    python -m brasileirao sequencias --tipo invicto [--atual]
+    python -m brasileirao confronto Flamengo Palmeiras
+
+A tabela responde a partir do snapshot .npz do cubo (brasileirao.cube), só com NumPy: sem
+pandas, a resposta sai em uma fração de segundo. Sem snapshot para a versão do arquivo, o
+cubo é montado pelo caminho completo (brasileirao.engine) e gravado para as próximas.
+Os subcomandos também aceitam os nomes em inglês (table --round N, team, streaks, h2h).
+"""
+import argparse
+import os
+import sys
+
+from brasileirao.cube import load_cube_snapshot, standings_rows
+from brasileirao.metrics import METRIC_COLUMNS, RANKING_ALIASES
+from brasileirao.partitions import PARTITION_DIR, resolve_source
+from brasileirao.storage import SNAPSHOT_DIR
+
+DEFAULT_FILE = 'df.xlsx'
+
+# Casas decimais das métricas derivadas (as demais são inteiras)
+DECIMALS = {'AP': 1, 'GPJ': 2, 'PPJ': 2}
+
+LOCAL_NAMES = {None: 'Geral', 'C': 'Casa', 'F': 'Fora'}
+
+
+def load_engine(source, args):
+    from brasileirao.engine import LeagueEngine
+
+    return LeagueEngine.from_source(source, args.cache)
+
+
+def find_team(teams, name):
+    """Nome do time como está no dataset (sem diferenciar maiúsculas)."""
+    matches = [team for team in teams if team.casefold() == name.casefold()]
+    if not matches:
+        sys.exit(f"Time '{name}' não encontrado. Times: {', '.join(teams)}")
+    return matches[0]
+
+
+def format_value(column, value):
+    return f"{value:.{DECIMALS[column]}f}" if column in DECIMALS else str(int(value))
+
+
+def print_rows(header, rows):
+    """Tabela de texto alinhada (primeiras colunas à esquerda, números à direita)."""
+    widths = [max(len(str(cell)) for cell in column) for column in zip(header, *rows)]
+    for row in [header, *rows]:
+        cells = [str(cell).ljust(width) if i == 1 else str(cell).rjust(width)
+                 for i, (cell, width) in enumerate(zip(row, widths))]
+        print('  '.join(cells))
+
+
+def command_table(args, source):
+    teams, values = load_cube_snapshot(source, lambda: load_engine(source, args).cube, args.cache)
+    ranking_option = RANKING_ALIASES[args.ranking]
+    teams, columns = standings_rows(teams, values, args.rodada, args.local, ranking_option)
+
+    rodada = values.shape[0] - 1 if args.rodada is None else min(max(args.rodada, 0), values.shape[0] - 1)
+    print(f"{ranking_option} - rodada {rodada} - {LOCAL_NAMES[args.local]} ({source})")
+    rows = [[pos, team] + [format_value(column, columns[column][i]) for column in METRIC_COLUMNS]
+            for i, (pos, team) in enumerate(zip(range(1, len(teams) + 1), teams))]
+    print_rows(['Pos', 'Time'] + METRIC_COLUMNS, rows[:args.top])
+
+
+def command_team(args, source):
+    from brasileirao.streaks import STREAK_TYPES
+
+    engine = load_engine(source, args)
+    team = find_team(engine.teams, args.time)
+    print(f"{team} - {engine.positions.get(team, 'N/A')}º colocado ({source})\n")
+
+    rows = []
+    for local in LOCAL_NAMES:
+        metrics = engine.team_metrics(team, local)
+        rows.append(['', LOCAL_NAMES[local]] + [format_value(column, metrics[column]) for column in METRIC_COLUMNS])
+    print_rows(['', 'Local'] + METRIC_COLUMNS, rows)
+
+    print()
+    rows = []
+    for kind, (name, _) in STREAK_TYPES.items():
+        cells = ['', name]
+        for current in (False, True):
+            size, start, end = engine.streak(team, kind, current=current)
+            cells.append(f"{size} ({start}-{end})" if size else '0')
+        rows.append(cells)
+    print_rows(['', 'Sequência', 'Maior', 'Atual'], rows)
+
+
+def command_streaks(args, source):
+    from brasileirao.streaks import STREAK_TYPES
+
+    if args.tipo not in STREAK_TYPES:
+        sys.exit(f"Tipo de sequência inválido: {args.tipo}. Tipos: {', '.join(STREAK_TYPES)}")
+    engine = load_engine(source, args)
+    board = engine.streaks.leaderboard(args.tipo, args.local, current=args.atual, top=args.top)
+    which = 'atuais' if args.atual else 'maiores'
+    print(f"Sequências {which} - {STREAK_TYPES[args.tipo][0]} - {LOCAL_NAMES[args.local]} ({source})")
+    print(board.to_string())
+
+
+def command_h2h(args, source):
+    engine = load_engine(source, args)
+    team_a, team_b = find_team(engine.teams, args.time_a), find_team(engine.teams, args.time_b)
+    meetings = engine.meetings(team_a, team_b)
+    print(f"{team_a} x {team_b}: {len(meetings)} jogo(s) ({source})")
+    if not meetings.empty:
+        print(meetings[['Ordem_Jogo', 'Turno', 'Local', 'Gols1', 'Gols2', 'Resultado']].to_string(index=False))
+
+
+def build_parser():
+    options = argparse.ArgumentParser(add_help=False)
+    options.add_argument('--fonte', help='df.xlsx ou pasta de partição (padrão: temporada mais recente ou df.xlsx)')
+    options.add_argument('--temporada', type=int, help='temporada do histórico particionado')
+    options.add_argument('--raiz', default=os.environ.get('BRASILEIRAO_DATA_DIR', PARTITION_DIR),
+                         help='raiz do histórico particionado')
+    options.add_argument('--cache', default=SNAPSHOT_DIR, help='pasta dos snapshots (Parquet e cubo .npz)')
+
+    local = argparse.ArgumentParser(add_help=False)
+    local.add_argument('--local', choices=['C', 'F'], help='só jogos em Casa (C) ou Fora (F)')
+
+    parser = argparse.ArgumentParser(prog='python -m brasileirao', description=__doc__.split('\n\n')[0].strip())
+    commands = parser.add_subparsers(dest='comando', required=True)
+
+    table = commands.add_parser('tabela', aliases=['table'], parents=[options, local], help='classificação na rodada')
+    table.add_argument('--rodada', '--round', type=int, help='rodada (padrão: última)')
+    table.add_argument('--ranking', choices=list(RANKING_ALIASES), default='pontos')
+    table.add_argument('--top', type=int)
+    table.set_defaults(run=command_table)
+
+    team = commands.add_parser('time', aliases=['team'], parents=[options], help='métricas e sequências de um time')
+    team.add_argument('time')
+    team.set_defaults(run=command_team)
+
+    streaks = commands.add_parser('sequencias', aliases=['streaks'], parents=[options, local],
+                                  help='maiores sequências da liga')
+    streaks.add_argument('--tipo', default='V', help='V, E, D, invicto ou sem_vencer')
+    streaks.add_argument('--atual', action='store_true', help='sequências em andamento')
+    streaks.add_argument('--top', type=int, default=10)
+    streaks.set_defaults(run=command_streaks)
+
+    h2h = commands.add_parser('confronto', aliases=['h2h'], parents=[options], help='jogos entre dois times')
+    h2h.add_argument('time_a')
+    h2h.add_argument('time_b')
+    h2h.set_defaults(run=command_h2h)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        source = args.fonte or resolve_source(args.temporada, args.raiz, DEFAULT_FILE)
+    except ValueError as e:
+        sys.exit(str(e))
+    if not os.path.exists(source):
+        sys.exit(f"Fonte de dados não encontrada: {source}")
+    args.run(args, source)
+
+
+if __name__ == '__main__':
+    main()
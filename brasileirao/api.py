@@ -0,0 +1,306 @@
+"""
+API HTTP somente leitura (JSON) sobre o mesmo motor das páginas (brasileirao.engine), para
+consumidores que hoje raspam o dashboard. Só a biblioteca padrão (http.server).
+
+Rotas (GET; `temporada=` escolhe a partição, padrão: a mais recente ou o df.xlsx):
+
+    /                                  rotas e contadores do cache
+    /temporadas                        temporadas gravadas
+    /tabela?rodada=&local=&ranking=    classificação (ranking: pontos, ataque, defesa, ppj, gpj)
+    /times                             times da fonte
+    /times/<time>                      métricas Geral/Casa/Fora, posição e sequências
+    /sequencias?tipo=&local=&atual=&top=
+    /confronto/<time_a>/<time_b>       jogos e retrospecto de time_a contra time_b
+
+Cada resposta fica em memória por versão do dataset (tamanho + data do arquivo de dados):
+quando o arquivo muda, o motor é remontado e as respostas antigas são descartadas. O ETag é
+o hash do corpo; com If-None-Match igual, a resposta é 304 sem corpo.
+
+Uso: python -m brasileirao.api [--porta 8502] [--host 127.0.0.1] [--raiz dados]
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from brasileirao.engine import LeagueEngine
+from brasileirao.metrics import METRIC_COLUMNS, RANKING_ALIASES
+from brasileirao.partitions import DEFAULT_DIVISION, PARTITION_DIR, available_seasons, resolve_source, source_file
+from brasileirao.rollups import partition_version
+from brasileirao.streaks import SCOPES, STREAK_TYPES
+
+DEFAULT_FILE = 'df.xlsx'
+DEFAULT_PORT = 8502
+
+LOCAL_KEYS = {None: 'geral', 'C': 'casa', 'F': 'fora'}
+
+# Colunas de cada jogo no retrospecto de um confronto
+MEETING_COLUMNS = ['Ordem_Jogo', 'Turno', 'Local', 'Gols1', 'Gols2', 'Resultado']
+
+
+class ApiError(Exception):
+    """Erro de consulta: vira uma resposta JSON {'erro': ...} com o status HTTP."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _param(query, name, convert=str, choices=None):
+    values = query.get(name)
+    if not values or values[0] == '':
+        return None
+    try:
+        value = convert(values[0])
+    except ValueError:
+        raise ApiError(400, f"Parâmetro inválido: {name}={values[0]}")
+    if choices is not None and value not in choices:
+        raise ApiError(400, f"Parâmetro inválido: {name}={value} (opções: {', '.join(map(str, choices))})")
+    return value
+
+
+def _local(query):
+    return _param(query, 'local', str.upper, ['C', 'F'])
+
+
+def _flag(value):
+    return value.lower() in ('1', 'true', 'sim')
+
+
+def _streak(size, start, end):
+    return {'jogos': size, 'inicio': start, 'fim': end}
+
+
+class StatsApi:
+    """
+    Respostas da API sem o servidor HTTP (`get` recebe o caminho com a query). Guarda um
+    motor por fonte e as respostas já serializadas por (fonte, versão, caminho), com no
+    máximo `max_entries` respostas (as menos usadas recentemente saem primeiro).
+    """
+
+    def __init__(self, root=None, default_file=DEFAULT_FILE, snapshot_dir=None, max_entries=4096):
+        self.root = root or PARTITION_DIR
+        self.default_file = default_file
+        self.snapshot_dir = snapshot_dir
+        self.max_entries = max_entries
+        self.stats = {'hits': 0, 'misses': 0, 'not_modified': 0, 'reloads': 0}
+        self._engines = {}  # fonte -> (versão, motor)
+        self._responses = OrderedDict()  # (fonte, versão, caminho) -> (ETag, corpo)
+        self._lock = threading.Lock()
+        self._build_locks = {}
+
+    # --- Fontes e motores ---
+
+    def _source(self, query):
+        try:
+            source = resolve_source(_param(query, 'temporada', int), self.root, self.default_file)
+        except ValueError as e:
+            raise ApiError(404, str(e))
+        if not os.path.exists(source):
+            raise ApiError(404, f"Fonte de dados não encontrada: {source}")
+        return source
+
+    def _engine(self, source):
+        """(versão, motor) da fonte; remonta o motor quando o arquivo de dados muda."""
+        version = partition_version(source_file(source))
+        cached = self._engines.get(source)
+        if cached is not None and cached[0] == version:
+            return cached
+
+        with self._lock:
+            build_lock = self._build_locks.setdefault(source, threading.Lock())
+        with build_lock:  # uma montagem por fonte; as demais requisições esperam por ela
+            cached = self._engines.get(source)
+            if cached is None or cached[0] != version:
+                cached = (version, LeagueEngine.from_source(source, self.snapshot_dir))
+                with self._lock:
+                    self._engines[source] = cached
+                    # Respostas de versões anteriores da fonte não valem mais
+                    for key in [key for key in self._responses if key[0] == source and key[1] != version]:
+                        del self._responses[key]
+                    self.stats['reloads'] += 1
+        return cached
+
+    # --- Respostas ---
+
+    def get(self, target, if_none_match=None):
+        """(status, ETag, corpo JSON em bytes) da requisição GET `target` (caminho + query)."""
+        parts = urlsplit(target)
+        path = '/' + '/'.join(unquote(part) for part in parts.path.split('/') if part)
+        query = parse_qs(parts.query)
+        try:
+            if path == '/':
+                return 200, None, self._encode(self._index())
+            source = self._source(query)
+            version, engine = self._engine(source)
+            key = (source, version, path + '?' + '&'.join(f"{k}={v}" for k, v in sorted(query.items())))
+
+            with self._lock:
+                cached = self._responses.get(key)
+                if cached is not None:
+                    self._responses.move_to_end(key)
+                    self.stats['hits'] += 1
+            if cached is None:
+                body = self._encode(self._route(engine, source, path, query))
+                cached = (f'"{hashlib.sha256(body).hexdigest()[:32]}"', body)
+                with self._lock:
+                    self.stats['misses'] += 1
+                    if self.max_entries:
+                        self._responses[key] = cached
+                        while len(self._responses) > self.max_entries:
+                            self._responses.popitem(last=False)
+        except ApiError as e:
+            return e.status, None, self._encode({'erro': str(e)})
+
+        etag, body = cached
+        if if_none_match is not None and etag in [tag.strip() for tag in if_none_match.split(',')]:
+            with self._lock:
+                self.stats['not_modified'] += 1
+            return 304, etag, b''
+        return 200, etag, body
+
+    @staticmethod
+    def _encode(payload):
+        return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def _index(self):
+        return {
+            'rotas': ['/temporadas', '/tabela', '/times', '/times/<time>', '/sequencias', '/confronto/<time_a>/<time_b>'],
+            'cache': dict(self.stats, respostas=len(self._responses)),
+        }
+
+    def _route(self, engine, source, path, query):
+        segments = path.strip('/').split('/')
+        if path == '/temporadas':
+            return {'temporadas': available_seasons(self.root, DEFAULT_DIVISION), 'fonte': source}
+        if path == '/tabela':
+            return self._table(engine, query)
+        if path == '/times':
+            return {'times': engine.teams}
+        if segments[0] == 'times' and len(segments) == 2:
+            return self._team(engine, self._team_name(engine, segments[1]))
+        if path == '/sequencias':
+            return self._streaks(engine, query)
+        if segments[0] == 'confronto' and len(segments) == 3:
+            return self._h2h(engine, self._team_name(engine, segments[1]), self._team_name(engine, segments[2]))
+        raise ApiError(404, f"Rota não encontrada: {path}")
+
+    @staticmethod
+    def _team_name(engine, name):
+        """Nome do time como está no dataset (sem diferenciar maiúsculas)."""
+        for team in engine.teams:
+            if team.casefold() == name.casefold():
+                return team
+        raise ApiError(404, f"Time não encontrado: {name}")
+
+    def _table(self, engine, query):
+        round_number = _param(query, 'rodada', int)
+        local_filter = _local(query)
+        ranking = _param(query, 'ranking', str.lower, list(RANKING_ALIASES)) or 'pontos'
+        table = engine.table(round_number, local_filter, RANKING_ALIASES[ranking])
+        max_round = engine.cube.max_round
+        return {
+            'rodada': max_round if round_number is None else min(max(round_number, 0), max_round),
+            'local': LOCAL_KEYS[local_filter],
+            'ranking': ranking,
+            'tabela': table.reset_index()[['Pos', 'Time'] + METRIC_COLUMNS].to_dict('records'),
+        }
+
+    def _team(self, engine, team):
+        return {
+            'time': team,
+            'posicao': engine.positions.get(team),
+            'metricas': {LOCAL_KEYS[local]: engine.team_metrics(team, local) for local in SCOPES},
+            'sequencias': {
+                kind: {
+                    'maior': _streak(*engine.streak(team, kind)),
+                    'atual': _streak(*engine.streak(team, kind, current=True)),
+                }
+                for kind in STREAK_TYPES
+            },
+        }
+
+    def _streaks(self, engine, query):
+        kind = _param(query, 'tipo', str, list(STREAK_TYPES)) or 'V'
+        local_filter = _local(query)
+        current = _flag(query.get('atual', ['0'])[0])
+        top = _param(query, 'top', int)
+        board = engine.streaks.leaderboard(kind, local_filter, current=current, top=top)
+        return {
+            'tipo': kind,
+            'local': LOCAL_KEYS[local_filter],
+            'atual': current,
+            'sequencias': board.reset_index().to_dict('records'),
+        }
+
+    def _h2h(self, engine, team_a, team_b):
+        meetings = engine.meetings(team_a, team_b)[MEETING_COLUMNS]
+        results = meetings['Resultado'].astype(str)
+        return {
+            'time_a': team_a,
+            'time_b': team_b,
+            'retrospecto': {
+                'jogos': len(meetings),
+                'vitorias': int((results == 'V').sum()),
+                'empates': int((results == 'E').sum()),
+                'derrotas': int((results == 'D').sum()),
+                'gols_pro': int(meetings['Gols1'].sum()),
+                'gols_contra': int(meetings['Gols2'].sum()),
+            },
+            'jogos': meetings.astype({'Local': str, 'Resultado': str}).to_dict('records'),
+        }
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    """Handler HTTP/1.1 (conexões persistentes) que delega para `server.api`."""
+
+    protocol_version = 'HTTP/1.1'
+    # Cabeçalhos e corpo saem em escritas separadas: sem TCP_NODELAY, o Nagle + ACK atrasado
+    # do cliente seguram o corpo por ~40 ms em conexões persistentes
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        status, etag, body = self.server.api.get(self.path, self.headers.get('If-None-Match'))
+        self.send_response(status)
+        if status != 304:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        if etag is not None:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')  # o cliente revalida com If-None-Match
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_server(api, host='127.0.0.1', port=DEFAULT_PORT):
+    """Servidor (uma thread por conexão) da `api`; porta 0 escolhe uma porta livre."""
+    server = ThreadingHTTPServer((host, port), ApiHandler)
+    server.daemon_threads = True
+    server.api = api
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="API JSON somente leitura do Dashboard do Brasileirão.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--raiz', default=os.environ.get('BRASILEIRAO_DATA_DIR', PARTITION_DIR),
+                        help='raiz do histórico particionado')
+    parser.add_argument('--fonte', default=DEFAULT_FILE, help='df.xlsx usado sem histórico particionado')
+    parser.add_argument('--sem-cache', action='store_true', help='não guarda respostas (comparação)')
+    args = parser.parse_args()
+
+    api = StatsApi(args.raiz, args.fonte, max_entries=0 if args.sem_cache else 4096)
+    server = make_server(api, args.host, args.porta)
+    print(f"API em http://{args.host}:{server.server_address[1]}/", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
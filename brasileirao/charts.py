@@ -0,0 +1,145 @@
+"""
+Gráficos de evolução da página Visão Time (Vega-Lite via Altair), em versão enxuta:
+cada gráfico recebe só as colunas que codifica, as camadas compartilham um único dataset
+nomeado e o spec gerado pode ser reaproveitado entre reruns (o dado vai em `datasets`).
+"""
+import altair as alt
+import numpy as np
+import pandas as pd
+
+from brasileirao.metrics import add_match_columns
+
+CONSISTENT_BLUE = '#1f77b4' # Tom de azul consistente para os gráficos
+COLOR_POSITIVE = '#198754' # Verde
+COLOR_NEGATIVE = '#dc3545' # Vermelho
+
+# Colunas enviadas ao navegador por gráfico (só o que está nas codificações/tooltips)
+CHART_COLUMNS = {
+    'posicao': ['Ordem_Jogo', 'Posicao_Jogo', 'Time1', 'Adversario', 'Resultado', 'Destaque_Posicao'],
+    'pontos': ['Ordem_Jogo', 'Pontos_Acumulados_Calc', 'Adversario', 'Resultado'],
+    'saldo': ['Ordem_Jogo', 'Saldo_Gols_Acumulado', 'Adversario', 'Performance_Saldo'],
+}
+
+
+def chart_frame(df_team, team_name):
+    """Jogos do time (em ordem cronológica) com as colunas derivadas usadas pelos gráficos."""
+    df_team = add_match_columns(df_team.copy(), team_name)
+    df_team['Pontos_Acumulados_Calc'] = df_team['Pontos_Jogo'].cumsum()
+
+    # 1. Destaque da melhor e da pior posição
+    posicao = df_team['Posicao_Jogo']
+    df_team['Destaque_Posicao'] = np.where(
+        posicao == posicao.min(), 'Melhor Posição',
+        np.where(posicao == posicao.max(), 'Pior Posição', 'Normal')
+    )
+
+    # 2. Saldo de gols acumulado e o sinal (cor da área e dos pontos)
+    df_team['Saldo_Gols_Acumulado'] = df_team['Saldo_Jogo'].cumsum()
+    df_team['Performance_Saldo'] = np.where(df_team['Saldo_Gols_Acumulado'] >= 0, 'Positivo', 'Negativo')
+    return df_team
+
+
+def project(df_team, chart):
+    """Só as colunas do gráfico; categorias não usadas saem do dicionário enviado em Arrow."""
+    projected = df_team[CHART_COLUMNS[chart]].reset_index(drop=True)
+    for column in projected.columns:
+        if isinstance(projected[column].dtype, pd.CategoricalDtype):
+            projected[column] = projected[column].cat.remove_unused_categories()
+    return projected
+
+
+def create_position_chart(all_teams_size, color=CONSISTENT_BLUE):
+    """Gráfico de evolução da posição no ranking (dados no dataset nomeado 'posicao')."""
+    chart_base = alt.Chart().encode(
+        x=alt.X('Ordem_Jogo:Q', title='Rodada'),
+        y=alt.Y('Posicao_Jogo:Q', title='Posição no Ranking', scale=alt.Scale(domain=[1, all_teams_size], reverse=True)),
+        tooltip=['Ordem_Jogo:Q', 'Posicao_Jogo:Q', 'Time1:N', 'Adversario:N', 'Resultado:N']
+    )
+
+    chart_line = chart_base.mark_line(color=color, point=True)
+
+    chart_highlight = chart_base.mark_circle(size=100, opacity=1).encode(
+        color=alt.Color('Destaque_Posicao:N',
+                        scale=alt.Scale(domain=['Melhor Posição', 'Pior Posição', 'Normal'],
+                                        range=[COLOR_POSITIVE, COLOR_NEGATIVE, 'transparent']),
+                        legend=alt.Legend(title="Performance", orient='bottom')),
+        strokeWidth=alt.value(2)
+    ).transform_filter(
+        alt.FieldOneOfPredicate(field='Destaque_Posicao', oneOf=['Melhor Posição', 'Pior Posição'])
+    )
+
+    return alt.layer(chart_line, chart_highlight, data=alt.NamedData(name='posicao')).properties(
+        title="Evolução da Posição no Ranking"
+    ).interactive()
+
+
+def create_points_chart(color=CONSISTENT_BLUE):
+    """Gráfico de evolução dos pontos acumulados (dados no dataset nomeado 'pontos')."""
+    return alt.Chart(alt.NamedData(name='pontos')).mark_line(point=True, color=color).encode(
+        x=alt.X('Ordem_Jogo:Q', title='Rodada'),
+        y=alt.Y('Pontos_Acumulados_Calc:Q', title='Pontos Acumulados'),
+        tooltip=['Ordem_Jogo:Q', 'Pontos_Acumulados_Calc:Q', 'Adversario:N', 'Resultado:N']
+    ).properties(title="Evolução dos Pontos Acumulados").interactive()
+
+
+def create_goal_difference_chart():
+    """
+    Gráfico do saldo de gols acumulado: linha zero, área e pontos coloridos pelo sinal e
+    linha contínua. As três camadas de dados usam o mesmo dataset nomeado 'saldo'.
+    """
+    color_scale = alt.Scale(domain=['Positivo', 'Negativo'], range=[COLOR_POSITIVE, COLOR_NEGATIVE])
+
+    chart_base = alt.Chart().encode(
+        x=alt.X('Ordem_Jogo:Q', title='Rodada'),
+        y=alt.Y('Saldo_Gols_Acumulado:Q', title='Saldo de Gols Acumulado', scale=alt.Scale(zero=False)),
+        tooltip=['Ordem_Jogo:Q', 'Saldo_Gols_Acumulado:Q', 'Adversario:N']
+    )
+
+    # 1. Linha zero de referência (um único valor inline, sem herdar as linhas do time)
+    rule = alt.Chart(alt.InlineData(values=[{'y': 0}])).mark_rule(color='gray', strokeDash=[3, 3]).encode(y='y:Q')
+
+    # 2. Área colorida condicionalmente, com base em y=0
+    chart_area = chart_base.mark_area(opacity=0.3, line=False).encode(
+        y2=alt.value(0),
+        color=alt.Color('Performance_Saldo:N', scale=color_scale, legend=None)
+    )
+
+    # 3. Linha de conexão contínua
+    chart_continuous_line = chart_base.mark_line(color='gray')
+
+    # 4. Pontos coloridos pelo sinal do saldo
+    chart_points_colored = chart_base.mark_circle(size=60).encode(
+        color=alt.Color('Performance_Saldo:N',
+                        scale=color_scale,
+                        legend=alt.Legend(title='Saldo Acumulado', orient='bottom'))
+    )
+
+    return alt.layer(
+        rule, chart_area, chart_continuous_line, chart_points_colored, data=alt.NamedData(name='saldo')
+    ).properties(title="Evolução do Saldo de Gols").interactive()
+
+
+def team_chart_specs(df_team, team_name, all_teams_size):
+    """
+    Specs Vega-Lite dos três gráficos do time ({'posicao', 'pontos', 'saldo'}), cada um com
+    o próprio dataset projetado em `datasets`. Prontos para st.vega_lite_chart.
+    """
+    if df_team.empty:
+        return {}
+
+    frame = chart_frame(df_team, team_name)
+    charts = {
+        'posicao': create_position_chart(all_teams_size),
+        'pontos': create_points_chart(),
+        'saldo': create_goal_difference_chart(),
+    }
+
+    specs = {}
+    for name, chart in charts.items():
+        # Sem o tema padrão do Altair (largura/altura fixas), como o st.altair_chart faz
+        with alt.theme.enable('none'):
+            spec = chart.to_dict()
+        # Valores inline (linha zero) já vêm consolidados em `datasets`; o do time entra junto
+        spec.setdefault('datasets', {})[name] = project(frame, name)
+        specs[name] = spec
+    return specs
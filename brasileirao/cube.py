@@ -0,0 +1,100 @@
+"""
+Núcleo do cubo de classificação só com NumPy: a tabela de uma rodada a partir dos
+acumulados e o snapshot .npz do cubo (ao lado do snapshot Parquet, chaveado pelo hash do
+arquivo de dados). Não importa pandas: é o caminho da CLI (`python -m brasileirao tabela`),
+que responde a partir do snapshot sem montar o dataset.
+"""
+import os
+
+import numpy as np
+
+from brasileirao.metrics import METRIC_COLUMNS, derived_metrics, ranking_order
+from brasileirao.partitions import PARTITION_FILE, parse_partition, source_file
+from brasileirao.storage import file_hash, remove_stale_snapshots, snapshot_path
+
+# Campos acumulados guardados no cubo (os demais são derivados)
+CUBE_FIELDS = ['V', 'E', 'D', 'GM', 'GC']
+
+# Posição de cada Local no eixo do cubo
+LOCAL_AXIS = {'C': 0, 'F': 1}
+
+CUBE_SUFFIX = '.cube.npz'
+
+
+def cube_totals(values, round_number=None, local_filter=None):
+    """Acumulados (times x CUBE_FIELDS) do cubo `values` até a rodada informada (padrão: última)."""
+    max_round = values.shape[0] - 1
+    round_number = max_round if round_number is None else int(np.clip(round_number, 0, max_round))
+    slab = values[round_number]
+    if local_filter is None:
+        return slab.sum(axis=1)
+    return slab[:, LOCAL_AXIS[local_filter]]
+
+
+def standings_columns(values, round_number=None, local_filter=None):
+    """Colunas METRIC_COLUMNS (arrays, na ordem dos times do cubo) na rodada informada."""
+    totals = cube_totals(values, round_number, local_filter)
+    columns = {name: totals[:, k] for k, name in enumerate(CUBE_FIELDS)}
+    columns['J'] = columns['V'] + columns['E'] + columns['D']
+    columns['P'] = columns['V'] * 3 + columns['E']
+    columns.update(derived_metrics(columns))
+    return {name: columns[name] for name in METRIC_COLUMNS}
+
+
+def standings_rows(teams, values, round_number=None, local_filter=None, ranking_option=None):
+    """Times e colunas já na ordem da classificação (mesma ordem de StandingsCube.table)."""
+    columns = standings_columns(values, round_number, local_filter)
+    order = ranking_order(columns, ranking_option)
+    return np.asarray(teams)[order], {name: column[order] for name, column in columns.items()}
+
+
+def save_cube(path, teams, values):
+    """
+    Grava times e acumulados em .npz de forma atômica (sem pickle: nomes como texto). Num
+    snapshot (`<nome>-<hash>.cube.npz`), apaga os das versões anteriores do mesmo arquivo.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+    np.savez(tmp_path, teams=np.asarray(teams, dtype=str), values=values)
+    os.replace(tmp_path, path)
+    if path.endswith(CUBE_SUFFIX):
+        remove_stale_snapshots(path, CUBE_SUFFIX)
+
+
+def load_cube(path):
+    """(times, acumulados) gravados por save_cube."""
+    with np.load(path, allow_pickle=False) as data:
+        return data['teams'], data['values']
+
+
+def cube_snapshot_path(source, snapshot_dir=None):
+    """
+    Snapshot do cubo de uma fonte (df.xlsx ou partição), pelo hash do arquivo de dados. Toda
+    partição grava um jogos.parquet: o nome do snapshot leva temporada e divisão, para que a
+    limpeza dos snapshots antigos de uma temporada não apague os das outras.
+    """
+    data_file = source_file(source)
+    name = data_file
+    if os.path.isdir(source):
+        _, temporada, divisao = parse_partition(source)
+        name = f"{os.path.splitext(PARTITION_FILE)[0]}-{temporada}-{divisao}"
+    return snapshot_path(name, file_hash(data_file), snapshot_dir, suffix=CUBE_SUFFIX)
+
+
+def load_cube_snapshot(source, build, snapshot_dir=None):
+    """
+    (times, acumulados) do cubo da fonte. Sem snapshot (ou ilegível), `build()` monta o
+    StandingsCube pelo caminho completo e o snapshot é gravado para as próximas consultas.
+    """
+    path = cube_snapshot_path(source, snapshot_dir)
+    try:
+        return load_cube(path)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    cube = build()
+    try:
+        save_cube(path, cube.teams, cube.values)
+    except OSError:
+        pass # Sem permissão de escrita: a consulta segue sem snapshot
+    return cube.teams, cube.values
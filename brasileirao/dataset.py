@@ -0,0 +1,71 @@
+"""
+Dataset de partidas somente leitura, pensado para ser compartilhado entre todas as sessões
+do Streamlit (via st.cache_resource). As colunas ficam em arrays NumPy não graváveis e as
+páginas consultam visões (fatias contíguas) em vez de cópias do DataFrame.
+"""
+import numpy as np
+import pandas as pd
+
+from brasileirao.schema import apply_schema
+
+
+def read_only(values):
+    """Marca o array como somente leitura (escritas acidentais levantam ValueError)."""
+    values.setflags(write=False)
+    return values
+
+
+def read_only_column(series):
+    """Cópia somente leitura da coluna; categorias guardam só os códigos (sem materializar strings)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = read_only(series.cat.codes.to_numpy(copy=True))
+        return pd.Categorical.from_codes(codes, dtype=series.dtype)
+    return read_only(series.to_numpy(copy=True))
+
+
+def read_only_frame(df):
+    """DataFrame construído sem cópia sobre uma cópia somente leitura de cada coluna."""
+    return pd.DataFrame({name: read_only_column(df[name]) for name in df.columns}, copy=False)
+
+
+class MatchDataset:
+    """
+    `frame` é um DataFrame construído sem cópia sobre arrays somente leitura, no esquema
+    compacto e ordenado por (Time1, Ordem_Jogo), de modo que os jogos de cada time formam
+    um bloco contíguo. `teams` é a tabela de IDs (Time_ID -> nome) e
+    `team_slices[time_id] = (início, fim)`.
+    """
+
+    def __init__(self, df):
+        if 'Time1' in df.columns:
+            df = apply_schema(df).sort_values(['Time1', 'Ordem_Jogo'], kind='mergesort')
+
+        # 1. Uma cópia de cada coluna, congelada; o DataFrame só referencia esses arrays
+        self.frame = read_only_frame(df)
+
+        # 2. Tabela de times e limites do bloco de cada time (pelos códigos inteiros)
+        self.teams = pd.Index([], dtype=object)
+        self.team_slices = {}
+        if 'Time1' in self.frame.columns:
+            self.teams = self.frame['Time1'].cat.categories
+            codes = self.frame['Time1'].cat.codes.to_numpy()
+            starts = np.flatnonzero(np.append(True, codes[1:] != codes[:-1])) if len(codes) else codes[:0]
+            stops = np.append(starts[1:], len(codes))
+            self.team_slices = {int(codes[start]): (int(start), int(stop)) for start, stop in zip(starts, stops)}
+
+    @property
+    def empty(self):
+        return self.frame.empty
+
+    def team_id(self, team):
+        """ID inteiro do time (código da categoria); -1 se o time não existir."""
+        return int(self.teams.get_indexer([team])[0])
+
+    def team_name(self, team_id):
+        """Nome do time a partir do ID."""
+        return self.teams[team_id]
+
+    def team_rows(self, team):
+        """Jogos do time (perspectiva do Time1) em ordem cronológica, como visão do frame."""
+        start, stop = self.team_slices.get(self.team_id(team), (0, 0))
+        return self.frame.iloc[start:stop]
@@ -0,0 +1,116 @@
+"""
+Motor de consultas de uma fonte de dados (df.xlsx ou partição de temporada), sem Streamlit:
+o dataset e as estruturas derivadas dele (métricas, cubo de classificação, forma, sequências,
+confrontos diretos) são montados sob demanda, uma vez por motor, e as consultas das páginas
+ficam aqui. As páginas guardam um motor por fonte (st.cache_resource em common.py) e só
+exibem o resultado; a CLI (python -m brasileirao) e scripts usam o mesmo objeto.
+"""
+import os
+from functools import cached_property
+
+from brasileirao.dataset import MatchDataset
+from brasileirao.form import FormTable
+from brasileirao.head_to_head import HeadToHeadIndex
+from brasileirao.metrics import add_match_columns, calculate_all_team_metrics, ranking_table, team_metrics
+from brasileirao.partitions import load_partition
+from brasileirao.standings import StandingsCube
+from brasileirao.storage import load_matches
+from brasileirao.streaks import StreakIndex
+
+
+def load_source(source, snapshot_dir=None):
+    """MatchDataset de uma partição (pasta) ou de um df.xlsx (via snapshot Parquet)."""
+    if os.path.isdir(source):
+        return MatchDataset(load_partition(source))
+    return MatchDataset(load_matches(source, snapshot_dir))
+
+
+class LeagueEngine:
+    """`dataset` é o MatchDataset da fonte; `source` identifica a fonte (caminho), se houver."""
+
+    def __init__(self, dataset, source=None):
+        self.dataset = dataset
+        self.source = source
+
+    @classmethod
+    def from_source(cls, source, snapshot_dir=None):
+        """Motor de uma partição (pasta) ou de um df.xlsx (via snapshot Parquet)."""
+        return cls(load_source(source, snapshot_dir), source)
+
+    @property
+    def frame(self):
+        return self.dataset.frame
+
+    @property
+    def teams(self):
+        """Nomes dos times em ordem alfabética."""
+        return list(self.dataset.teams)
+
+    # --- Estruturas derivadas (montadas na primeira consulta) ---
+
+    @cached_property
+    def metrics_table(self):
+        """Métricas Geral/Casa/Fora de todos os times, indexadas por (Local, Time)."""
+        return calculate_all_team_metrics(self.frame)
+
+    @cached_property
+    def positions(self):
+        """Colocação atual (Geral) de cada time: {time: posição}."""
+        ranking = ranking_table(self.metrics_table)
+        return {team: int(pos) for pos, team in ranking['Time'].items()}
+
+    @cached_property
+    def cube(self):
+        return StandingsCube.from_matches(self.frame)
+
+    @cached_property
+    def form(self):
+        return FormTable.from_matches(self.frame)
+
+    @cached_property
+    def streaks(self):
+        return StreakIndex.from_matches(self.frame)
+
+    @cached_property
+    def head_to_head(self):
+        return HeadToHeadIndex.from_matches(self.frame)
+
+    # --- Consultas ---
+
+    def table(self, round_number=None, local_filter=None, ranking_option=None):
+        """Classificação 'como estava' na rodada (padrão: última), com filtro de Local e tipo de ranking."""
+        return self.cube.table(round_number, local_filter, ranking_option)
+
+    def team_metrics(self, team, local_filter=None):
+        """Dicionário de métricas (P/J/V/E/D/GM/GC/SG/AP/GPJ/PPJ) do time no Local."""
+        return team_metrics(self.metrics_table, team, local_filter)
+
+    def team_games(self, team):
+        """
+        Cópia dos jogos do time em ordem cronológica com GS, GC, Saldo_Jogo, Adversario,
+        Pontos_Jogo e Pontos_Acumulados_Calc (pontos acumulados do zero).
+        """
+        df_team = add_match_columns(self.dataset.team_rows(team).copy(), team)
+        df_team['Pontos_Acumulados_Calc'] = df_team['Pontos_Jogo'].cumsum()
+        return df_team
+
+    def duel_metrics(self, team, local_filter=None, n_games=3):
+        """Métricas do time no Local mais o desempenho nos últimos `n_games` jogos ('RECENT')."""
+        metrics = self.team_metrics(team, local_filter)
+        metrics['RECENT'] = self.form.recent(team, n_games, local_filter)
+        return metrics
+
+    def streak(self, team, kind, local_filter=None, current=False):
+        """(tamanho, rodada inicial, rodada final) da maior sequência (ou da atual) do time."""
+        lookup = self.streaks.current if current else self.streaks.longest
+        return lookup(team, kind, local_filter)
+
+    def meetings(self, team_a, team_b):
+        """Jogos de team_a contra team_b na perspectiva de team_a, em ordem cronológica."""
+        return self.head_to_head.meetings(team_a, team_b)
+
+    def team_chart_specs(self, team):
+        """Specs Vega-Lite dos gráficos de evolução do time (Altair só é importado aqui)."""
+        from brasileirao.charts import team_chart_specs
+
+        return team_chart_specs(self.dataset.team_rows(team), team, len(self.dataset.teams))
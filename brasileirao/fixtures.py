@@ -0,0 +1,134 @@
+"""
+Tabela canônica de partidas: uma linha por jogo (mandante, visitante, gols e o número do
+jogo de cada time). A visão por time (formato do df.xlsx, duas linhas por jogo) é derivada
+dela sob demanda com indexação vetorizada, então as duas cópias de um jogo nunca divergem.
+
+A posição publicada pelo notebook depois de cada jogo (Posicao_Jogo) é guardada por lado
+da partida: o desempate final dela depende da ordem dos times no momento da raspagem e não
+pode ser recalculado a partir dos jogos.
+"""
+import numpy as np
+import pandas as pd
+
+from brasileirao.metrics import POINTS, team_games
+from brasileirao.ranking import round_positions
+from brasileirao.schema import CATEGORY_VALUES, apply_schema
+
+FIXTURE_COLUMNS = [
+    'Mandante', 'Visitante', 'Mandante_ID', 'Visitante_ID',
+    'Gols_Mandante', 'Gols_Visitante', 'Jogo_Mandante', 'Jogo_Visitante',
+    'Posicao_Mandante', 'Posicao_Visitante',
+]
+
+
+def fixtures_from_perspective(df):
+    """
+    Converte o DataFrame por time (df.xlsx) na tabela canônica. Levanta ValueError se as
+    duas cópias de um jogo não baterem (placar diferente ou jogo sem a outra perspectiva).
+    """
+    games = team_games(df)
+    home = games[games['Local'] == 'C']
+    away = games[games['Local'] == 'F']
+
+    # 1. Casa cada jogo em casa com a linha do visitante; o contador separa repetições do confronto
+    home_key = home.assign(Mandante=home['Time1'].astype(object), Visitante=home['Time2'].astype(object))
+    away_key = away.assign(Mandante=away['Time2'].astype(object), Visitante=away['Time1'].astype(object))
+    home_key['Encontro'] = home_key.sort_values('Ordem_Jogo').groupby(['Mandante', 'Visitante']).cumcount()
+    away_key['Encontro'] = away_key.sort_values('Ordem_Jogo').groupby(['Mandante', 'Visitante']).cumcount()
+
+    merged = home_key.merge(
+        away_key, on=['Mandante', 'Visitante', 'Encontro'], how='outer',
+        suffixes=('_casa', '_fora'), indicator=True
+    )
+    orphans = merged[merged['_merge'] != 'both']
+    if len(orphans):
+        sample = orphans[['Mandante', 'Visitante']].head(3).to_dict('records')
+        raise ValueError(f"{len(orphans)} jogo(s) sem a perspectiva do adversário: {sample}")
+
+    # 2. As duas cópias precisam ter o mesmo placar
+    divergent = merged[(merged['Gols1_casa'] != merged['Gols2_fora']) | (merged['Gols2_casa'] != merged['Gols1_fora'])]
+    if len(divergent):
+        sample = divergent[['Mandante', 'Visitante']].head(3).to_dict('records')
+        raise ValueError(f"{len(divergent)} jogo(s) com placares divergentes entre as perspectivas: {sample}")
+
+    fixtures = pd.DataFrame({
+        'Mandante': merged['Mandante'],
+        'Visitante': merged['Visitante'],
+        'Mandante_ID': merged['Time_Foco_ID_casa'].astype(np.int32),
+        'Visitante_ID': merged['Time_Foco_ID_fora'].astype(np.int32),
+        'Gols_Mandante': merged['Gols1_casa'].astype(np.int8),
+        'Gols_Visitante': merged['Gols2_casa'].astype(np.int8),
+        'Jogo_Mandante': merged['Ordem_Jogo_casa'].astype(np.int16),
+        'Jogo_Visitante': merged['Ordem_Jogo_fora'].astype(np.int16),
+    })
+    if 'Posicao_Jogo_casa' in merged.columns:
+        fixtures['Posicao_Mandante'] = merged['Posicao_Jogo_casa'].astype(np.int8)
+        fixtures['Posicao_Visitante'] = merged['Posicao_Jogo_fora'].astype(np.int8)
+    teams = fixtures[['Mandante', 'Visitante']].stack().unique()
+    fixtures[['Mandante', 'Visitante']] = fixtures[['Mandante', 'Visitante']].astype(pd.CategoricalDtype(np.sort(teams)))
+    return fixtures.sort_values(['Jogo_Mandante', 'Mandante'], kind='mergesort').reset_index(drop=True)
+
+
+def _group_cumsum(values, starts, lengths):
+    """Soma acumulada que recomeça no início de cada grupo (linhas já agrupadas)."""
+    total = np.cumsum(values)
+    offset = total[starts] - values[starts]
+    return total - np.repeat(offset, lengths)
+
+
+def team_perspective(fixtures, tiebreak='notebook'):
+    """
+    Deriva a visão por time (formato do df.xlsx, no esquema compacto) da tabela canônica:
+    resultado e acumulados são recalculados a partir dos jogos. Sem as posições guardadas,
+    a posição de cada rodada também é calculada (desempate `tiebreak`).
+    """
+    n = len(fixtures)
+    teams = pd.CategoricalDtype(np.sort(pd.unique(np.concatenate([
+        np.asarray(fixtures['Mandante'], dtype=object), np.asarray(fixtures['Visitante'], dtype=object)
+    ])).astype(str)))
+
+    def both(first, second):
+        return np.concatenate([np.asarray(fixtures[first]), np.asarray(fixtures[second])])
+
+    def team_codes(first, second):
+        return np.concatenate([
+            pd.Categorical(np.asarray(fixtures[first], dtype=object), dtype=teams).codes,
+            pd.Categorical(np.asarray(fixtures[second], dtype=object), dtype=teams).codes,
+        ])
+
+    # 1. Linha do mandante (primeiras n) e do visitante (últimas n), agrupadas por (time, jogo)
+    time1, time2 = team_codes('Mandante', 'Visitante'), team_codes('Visitante', 'Mandante')
+    rounds = both('Jogo_Mandante', 'Jogo_Visitante').astype(np.int16)
+    order = np.lexsort((rounds, time1))
+    time1, time2, rounds = time1[order], time2[order], rounds[order]
+    gols1 = both('Gols_Mandante', 'Gols_Visitante')[order].astype(np.int64)
+    gols2 = both('Gols_Visitante', 'Gols_Mandante')[order].astype(np.int64)
+    results = CATEGORY_VALUES['Resultado']
+    resultado = np.select([gols1 > gols2, gols1 == gols2], [results.index('V'), results.index('E')],
+                          results.index('D')).astype(np.int8)
+
+    # 2. Acumulados por time (cada time é um bloco contíguo em ordem cronológica)
+    starts = np.flatnonzero(np.append(True, time1[1:] != time1[:-1])) if len(time1) else np.zeros(0, dtype=np.int64)
+    lengths = np.diff(np.append(starts, len(time1)))
+    df = pd.DataFrame({
+        'Time_Foco_ID': both('Mandante_ID', 'Visitante_ID')[order].astype(np.int32),
+        'Ordem_Jogo': rounds,
+        'Local': pd.Categorical.from_codes(np.repeat(np.array([0, 1], dtype=np.int8), n)[order],
+                                           dtype=pd.CategoricalDtype(CATEGORY_VALUES['Local'])),
+        'Time1': pd.Categorical.from_codes(time1, dtype=teams),
+        'Gols1': gols1.astype(np.int8),
+        'Gols2': gols2.astype(np.int8),
+        'Time2': pd.Categorical.from_codes(time2, dtype=teams),
+        'Resultado': pd.Categorical.from_codes(resultado, dtype=pd.CategoricalDtype(results)),
+        'Pontos_Acumulados': _group_cumsum(np.array([POINTS[r] for r in results])[resultado], starts, lengths).astype(np.int16),
+        'Vitorias_Acumuladas': _group_cumsum((resultado == results.index('V')).astype(np.int64), starts, lengths).astype(np.int16),
+        'Saldo_Gols_Acumulado': _group_cumsum(gols1 - gols2, starts, lengths).astype(np.int16),
+    })
+
+    # 3. Posição após cada jogo (guardada ou recalculada) e a ordem do df.xlsx (rodada, posição)
+    if 'Posicao_Mandante' in fixtures.columns:
+        df['Posicao_Jogo'] = both('Posicao_Mandante', 'Posicao_Visitante')[order].astype(np.int8)
+    else:
+        df['Posicao_Jogo'] = round_positions(df, 'Time1', 'Ordem_Jogo', tiebreak).astype(np.int8)
+    df = df.iloc[np.lexsort((df['Posicao_Jogo'].to_numpy(), df['Ordem_Jogo'].to_numpy()))]
+    return apply_schema(df.reset_index(drop=True))
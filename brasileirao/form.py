@@ -0,0 +1,133 @@
+"""
+Tabelas de forma (últimos N jogos) de todos os times em todas as rodadas, para várias
+janelas e para Geral/Casa/Fora, calculadas de uma vez com somas acumuladas por time.
+"""
+import numpy as np
+import pandas as pd
+
+from brasileirao.metrics import METRIC_COLUMNS, add_derived_metrics, sort_ranking, team_games
+
+# Janelas (número de jogos) pré-calculadas
+FORM_WINDOWS = (3, 5, 10)
+
+# Campos somados na janela (os demais são derivados)
+FORM_FIELDS = ['V', 'E', 'D', 'GM', 'GC']
+
+# Escopos (Geral, Casa, Fora), na ordem do eixo
+SCOPES = (None, 'C', 'F')
+
+
+class FormTable:
+    """
+    `values[(local, janela)][r, t, k]` é a soma do campo FORM_FIELDS[k] nos últimos `janela`
+    jogos do time t (no local) disputados até a rodada r; `games[(local, janela)][r, t]` é
+    quantos jogos entraram na janela. `results[local][t]` guarda a sequência de resultados
+    (V/E/D) do time no local, em ordem cronológica, e `played[local][r, t]` quantos jogos
+    ele já tinha disputado até a rodada r.
+    """
+
+    def __init__(self, teams, values, games, results, played):
+        self.teams = teams
+        self.values = values
+        self.games = games
+        self.results = results
+        self.played = played
+        self.max_round = next(iter(played.values())).shape[0] - 1
+        self._team_pos = {team: i for i, team in enumerate(teams)}
+
+    @classmethod
+    def from_matches(cls, df, all_teams=None, windows=FORM_WINDOWS):
+        """Constrói as tabelas a partir do DataFrame de partidas (uma linha por time/jogo)."""
+        games = team_games(df)
+
+        if all_teams is None:
+            all_teams = np.sort(pd.unique(df[['Time1', 'Time2']].values.ravel('K')))
+        teams = np.asarray(all_teams)
+
+        team_idx = pd.Index(teams).get_indexer(games['Time1'])
+        rounds = games['Ordem_Jogo'].to_numpy(dtype=np.int64)
+        local = np.asarray(games['Local'], dtype=object)
+        resultado = np.asarray(games['Resultado'], dtype=object)
+        deltas = np.column_stack([
+            resultado == 'V',
+            resultado == 'E',
+            resultado == 'D',
+            games['Gols1'].to_numpy(dtype=np.int64),
+            games['Gols2'].to_numpy(dtype=np.int64),
+        ]).astype(np.int64)
+        max_round = int(rounds.max()) if len(rounds) else 0
+
+        values, window_games, results, played = {}, {}, {}, {}
+        for scope in SCOPES:
+            in_scope = np.ones(len(rounds), dtype=bool) if scope is None else local == scope
+            order = np.flatnonzero(in_scope)[np.lexsort((rounds[in_scope], team_idx[in_scope]))]
+            scope_teams, scope_rounds = team_idx[order], rounds[order]
+
+            # 1. Número do jogo de cada linha dentro do time (1, 2, ...) e somas acumuladas por jogo
+            starts = np.searchsorted(scope_teams, np.arange(len(teams)))
+            game_number = np.arange(len(order)) - starts[scope_teams] + 1
+            max_games = int(game_number.max()) if len(order) else 0
+            cumulative = np.zeros((len(teams), max_games + 1, len(FORM_FIELDS)), dtype=np.int64)
+            cumulative[scope_teams, game_number] = deltas[order]
+            np.cumsum(cumulative, axis=1, out=cumulative)
+
+            # 2. Jogos disputados por cada time até cada rodada
+            counts = np.zeros((max_round + 1, len(teams)), dtype=np.int64)
+            np.add.at(counts, (scope_rounds, scope_teams), 1)
+            played[scope] = np.cumsum(counts, axis=0)
+
+            # 3. Janela: diferença entre o acumulado no último jogo e N jogos antes
+            columns = np.arange(len(teams))[None, :]
+            for window in windows:
+                last = played[scope]
+                first = np.maximum(last - window, 0)
+                values[(scope, window)] = cumulative[columns, last] - cumulative[columns, first]
+                window_games[(scope, window)] = last - first
+
+            stops = np.append(starts[1:], len(order))
+            results[scope] = [resultado[order[start:stop]] for start, stop in zip(starts, stops)]
+
+        return cls(teams, values, window_games, results, played)
+
+    def _round(self, round_number):
+        return self.max_round if round_number is None else int(np.clip(round_number, 0, self.max_round))
+
+    def recent(self, team, window=3, local_filter=None, round_number=None):
+        """
+        Desempenho do time nos últimos `window` jogos (no local) até a rodada: dicionário com
+        V, E, D, P, AP e a lista de resultados do mais recente para o mais antigo.
+        """
+        if team not in self._team_pos or (local_filter, window) not in self.values:
+            return {'V': 0, 'E': 0, 'D': 0, 'P': 0, 'AP': 0.0, 'Results': []}
+
+        t = self._team_pos[team]
+        r = self._round(round_number)
+        total_games = int(self.games[(local_filter, window)][r, t])
+        if total_games == 0:
+            return {'V': 0, 'E': 0, 'D': 0, 'P': 0, 'AP': 0.0, 'Results': []}
+
+        victories, draws, defeats = (int(v) for v in self.values[(local_filter, window)][r, t, :3])
+        total_points = victories * 3 + draws
+        last = int(self.played[local_filter][r, t])
+        return {
+            'V': victories,
+            'E': draws,
+            'D': defeats,
+            'P': total_points,
+            'AP': total_points / (total_games * 3) * 100,
+            'Results': self.results[local_filter][t][last - total_games:last][::-1].tolist(),
+        }
+
+    def metrics(self, window, round_number=None, local_filter=None):
+        """Métricas (P/J/V/E/D/GM/GC/SG/AP/GPJ/PPJ) de todos os times nos últimos `window` jogos."""
+        r = self._round(round_number)
+        table = pd.DataFrame(self.values[(local_filter, window)][r], columns=FORM_FIELDS,
+                             index=pd.Index(self.teams, name='Time'))
+        table['J'] = self.games[(local_filter, window)][r]
+        table['P'] = table['V'] * 3 + table['E']
+        return add_derived_metrics(table)
+
+    def table(self, window, round_number=None, local_filter=None):
+        """Tabela de forma: classificação (P, V, SG, GM) considerando só os últimos `window` jogos."""
+        ranking_df = self.metrics(window, round_number, local_filter).reset_index()
+        return sort_ranking(ranking_df[METRIC_COLUMNS + ['Time']])
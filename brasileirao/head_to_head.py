@@ -0,0 +1,67 @@
+"""
+Índice de confrontos diretos: as partidas de cada par (time_a, time_b) ficam em fatias
+contíguas de uma única tabela, nas duas perspectivas. Um duelo vira uma consulta
+O(jogos entre os dois times), sem varrer o DataFrame inteiro.
+"""
+import numpy as np
+import pandas as pd
+
+from brasileirao.dataset import read_only_frame
+from brasileirao.metrics import team_games
+
+# Colunas guardadas no índice (perspectiva do Time1); 'Turno' é acrescentada na construção
+H2H_COLUMNS = ['Time1', 'Time2', 'Ordem_Jogo', 'Local', 'Gols1', 'Gols2', 'Resultado']
+
+
+class HeadToHeadIndex:
+    """
+    `matches` tem uma linha por (time, jogo), ordenada por (Time1, Time2, Ordem_Jogo);
+    `slices[(time_a, time_b)]` é o intervalo [início, fim) dos jogos de time_a contra
+    time_b na perspectiva de time_a. 'Turno' numera os confrontos do par em ordem
+    cronológica (1 = primeiro turno, 2 = segundo turno).
+    """
+
+    def __init__(self, matches, slices):
+        self.matches = matches
+        self.slices = slices
+
+    @classmethod
+    def from_matches(cls, df):
+        """Constrói o índice a partir do DataFrame de partidas (uma linha por time/jogo)."""
+        games = team_games(df)
+
+        # 1. Ordena por (time, adversário, jogo): cada par vira um bloco contíguo
+        teams = pd.Index(pd.unique(games[['Time1', 'Time2']].values.ravel('K')))
+        team_codes = teams.get_indexer(games['Time1'])
+        opponent_codes = teams.get_indexer(games['Time2'])
+        rounds = games['Ordem_Jogo'].to_numpy(dtype=np.int64)
+        order = np.lexsort((rounds, opponent_codes, team_codes))
+
+        matches = games[H2H_COLUMNS].iloc[order].reset_index(drop=True)
+        team_codes, opponent_codes = team_codes[order], opponent_codes[order]
+
+        # 2. Limites de cada bloco e turno de cada jogo dentro do bloco
+        n = len(matches)
+        new_pair = np.ones(n, dtype=bool)
+        new_pair[1:] = (team_codes[1:] != team_codes[:-1]) | (opponent_codes[1:] != opponent_codes[:-1])
+        starts = np.flatnonzero(new_pair)
+        stops = np.append(starts[1:], n)
+        matches['Turno'] = np.arange(n) - np.repeat(starts, stops - starts) + 1
+        matches = read_only_frame(matches)
+
+        time1 = matches['Time1'].to_numpy()
+        time2 = matches['Time2'].to_numpy()
+        slices = {(time1[start], time2[start]): (int(start), int(stop)) for start, stop in zip(starts, stops)}
+        return cls(matches, slices)
+
+    def meetings(self, team_a, team_b):
+        """Jogos de team_a contra team_b na perspectiva de team_a, em ordem cronológica."""
+        start, stop = self.slices.get((team_a, team_b), (0, 0))
+        return self.matches.iloc[start:stop]
+
+    def turnos(self, team_a, team_b):
+        """Resultado de cada turno na perspectiva de team_a: {turno: registro do jogo}."""
+        return {
+            record['Turno']: record
+            for record in self.meetings(team_a, team_b).to_dict('records')
+        }
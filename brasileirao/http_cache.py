@@ -0,0 +1,229 @@
+"""
+Cache em disco das respostas do scraper com requisições condicionais (ETag/Last-Modified).
+
+Quando o servidor responde 304, ou devolve um corpo com o mesmo hash do que já está
+salvo, o resultado do parse guardado é reutilizado e o HTML não é processado de novo.
+As entradas menos usadas recentemente são removidas ao passar dos limites de tamanho.
+"""
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+
+from brasileirao.storage import SNAPSHOT_DIR
+
+DEFAULT_CACHE_DIR = os.path.join(SNAPSHOT_DIR, 'http')
+
+
+class CachedPage:
+    """Corpo de uma página (da rede ou do cache) e o hash do conteúdo."""
+
+    def __init__(self, url, body, content_hash, status):
+        self.url = url
+        self.body = body
+        self.content_hash = content_hash
+        self.status = status  # 'not_modified' (304), 'same_content' (200 igual) ou 'new'
+
+    @property
+    def content(self):
+        """Compatível com requests.Response.content."""
+        return self.body
+
+
+class HTTPCache:
+    """
+    Cache de respostas HTTP em `cache_dir`. Cada URL tem um `<chave>.json` (ETag,
+    Last-Modified, hash, tamanho, último acesso) e um `<chave>.html`; os resultados de
+    parse ficam em `<hash>-<sufixo>.pkl`. Limites: `max_bytes` e `max_entries` (LRU).
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=50 * 1024 * 1024, max_entries=500):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.stats = {'hits': 0, 'same_content': 0, 'misses': 0, 'bytes_saved': 0,
+                      'parse_reused': 0, 'parsed': 0, 'evicted': 0}
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index = self._load_index()
+
+    # --- Armazenamento ---
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+
+    def _path(self, name):
+        return os.path.join(self.cache_dir, name)
+
+    def _load_index(self):
+        """Lê os metadados de todas as entradas salvas."""
+        index = {}
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.json'):
+                try:
+                    with open(self._path(name), encoding='utf-8') as f:
+                        index[name[:-5]] = json.load(f)
+                except (OSError, ValueError):
+                    continue
+        return index
+
+    def _write_meta(self, key, meta):
+        tmp_path = self._path(f"{key}.json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self._path(f"{key}.json"))
+
+    def _read_body(self, key):
+        with open(self._path(f"{key}.html"), 'rb') as f:
+            return f.read()
+
+    # --- Requisições condicionais ---
+
+    def conditional_request(self, url):
+        """
+        (cabeçalhos If-None-Match / If-Modified-Since, cópia) para a URL. A cópia (metadados e
+        corpo lidos agora) é o que um 304 confirma: a entrada pode ser removida por outra thread
+        antes da resposta chegar. Sem cache para a URL: ({}, None).
+        """
+        key = self._key(url)
+        with self._lock:
+            meta = self._index.get(key)
+            try:
+                snapshot = (dict(meta), self._read_body(key)) if meta is not None else None
+            except OSError:
+                snapshot = None
+        if snapshot is None:
+            return {}, None
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers, snapshot
+
+    def store_response(self, url, response, snapshot=None):
+        """
+        Registra a resposta de uma requisição (condicional ou não) e retorna a CachedPage.
+        Em um 304 o corpo vem da cópia de `conditional_request` (ou, sem ela, do disco) e o
+        tamanho dele conta como bytes economizados; retorna None se não houver cópia.
+        """
+        key = self._key(url)
+        with self._lock:
+            meta = self._index.get(key)
+
+            if response.status_code == 304:
+                if snapshot is None and meta is not None:
+                    try:
+                        snapshot = (meta, self._read_body(key))
+                    except OSError:
+                        pass
+                if snapshot is None:
+                    return None  # Nada para confirmar: o corpo vazio do 304 nunca é salvo
+                cached_meta, body = snapshot
+                if meta is None or meta['content_hash'] != cached_meta['content_hash']:
+                    # A entrada saiu (ou mudou) depois dos cabeçalhos: volta a partir da cópia
+                    with open(self._path(f"{key}.html"), 'wb') as f:
+                        f.write(body)
+                self._index[key] = dict(cached_meta, last_access=time.time())
+                self._write_meta(key, self._index[key])
+                self.stats['hits'] += 1
+                self.stats['bytes_saved'] += cached_meta['size']
+                self._evict()
+                return CachedPage(url, body, cached_meta['content_hash'], 'not_modified')
+
+            body = response.content
+            content_hash = hashlib.sha256(body).hexdigest()
+            status = 'same_content' if meta is not None and meta['content_hash'] == content_hash else 'new'
+            self.stats['same_content' if status == 'same_content' else 'misses'] += 1
+
+            if status == 'new':
+                with open(self._path(f"{key}.html"), 'wb') as f:
+                    f.write(body)
+            self._index[key] = {
+                'url': url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'content_hash': content_hash,
+                'size': len(body),
+                'last_access': time.time(),
+            }
+            self._write_meta(key, self._index[key])
+            self._evict(replaced=status == 'new' and meta is not None)
+            return CachedPage(url, body, content_hash, status)
+
+    # --- Resultado do parse ---
+
+    def parse(self, page, parse_fn, suffix=''):
+        """Executa `parse_fn(page.body)` ou reutiliza o resultado salvo para o mesmo conteúdo."""
+        path = self._path(f"{page.content_hash[:32]}-{suffix}.pkl")
+        if os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    result = pickle.load(f)
+                with self._lock:
+                    self.stats['parse_reused'] += 1
+                return result
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass  # Arquivo corrompido: refaz o parse
+
+        result = parse_fn(page.body)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(result, f)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.stats['parsed'] += 1
+        return result
+
+    # --- Política de remoção (LRU) ---
+
+    def _total_bytes(self):
+        return sum(meta['size'] for meta in self._index.values())
+
+    def _evict(self, replaced=False):
+        """
+        Remove as entradas menos usadas recentemente até respeitar max_bytes e max_entries.
+        Depois (ou se um conteúdo foi substituído), apaga os parses de conteúdos que saíram.
+        """
+        by_access = sorted(self._index.items(), key=lambda item: item[1]['last_access'])
+        total = self._total_bytes()
+        evicted = 0
+
+        for key, meta in by_access:
+            if total <= self.max_bytes and len(self._index) <= self.max_entries:
+                break
+            for name in (f"{key}.html", f"{key}.json"):
+                try:
+                    os.remove(self._path(name))
+                except OSError:
+                    pass
+            del self._index[key]
+            total -= meta['size']
+            evicted += 1
+
+        self.stats['evicted'] += evicted
+        if not (evicted or replaced):
+            return
+
+        live_hashes = {meta['content_hash'][:32] for meta in self._index.values()}
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pkl') and name.split('-', 1)[0] not in live_hashes:
+                try:
+                    os.remove(self._path(name))
+                except OSError:
+                    pass
+
+    def report(self):
+        """Resumo das estatísticas (acertos, falhas, bytes economizados, parses reutilizados)."""
+        s = self.stats
+        total = s['hits'] + s['same_content'] + s['misses']
+        hit_rate = (s['hits'] + s['same_content']) / total * 100 if total else 0.0
+        return (
+            f"Cache HTTP: {total} respostas | 304: {s['hits']} | mesmo conteúdo: {s['same_content']} | "
+            f"falhas: {s['misses']} | acerto: {hit_rate:.1f}% | bytes economizados: {s['bytes_saved']:,} | "
+            f"parses reutilizados: {s['parse_reused']} | parses feitos: {s['parsed']} | "
+            f"removidos: {s['evicted']} | tamanho: {self._total_bytes():,} bytes em {len(self._index)} entradas"
+        )
@@ -0,0 +1,116 @@
+"""
+Atualização incremental do dataset: acrescenta apenas os jogos novos coletados e estende
+acumulados e posições a partir do último estado conhecido, sem recalcular a temporada.
+"""
+import numpy as np
+import pandas as pd
+
+from brasileirao.ranking import round_positions
+
+# Colunas do dataset armazenado (df.xlsx)
+STORED_COLUMNS = [
+    'Time_Foco_ID', 'Ordem_Jogo', 'Local', 'Time1', 'Gols1', 'Gols2', 'Time2', 'Resultado',
+    'Pontos_Acumulados', 'Vitorias_Acumuladas', 'Saldo_Gols_Acumulado', 'Posicao_Jogo'
+]
+
+# Colunas que identificam um jogo do ponto de vista do time em foco
+MATCH_COLUMNS = ['Time_Foco_ID', 'Ordem_Jogo', 'Local', 'Time1', 'Gols1', 'Gols2', 'Time2', 'Resultado']
+
+COLUNA_TIME_ID = 'Time_Foco_ID'
+COLUNA_RODADA = 'Ordem_Jogo'
+
+
+def _last_rows(df):
+    """Última linha (maior Ordem_Jogo) de cada time."""
+    return df.sort_values(COLUNA_RODADA).drop_duplicates(subset=[COLUNA_TIME_ID], keep='last')
+
+
+def new_matches(stored, scraped):
+    """
+    Compara os jogos coletados com o dataset armazenado e retorna apenas os novos (Ordem_Jogo
+    maior que o último conhecido de cada time). O último jogo armazenado de cada time precisa
+    bater com o coletado; se não bater (placar corrigido, jogo renumerado), é preciso
+    reconstruir a temporada e um ValueError é lançado.
+    """
+    last_stored = _last_rows(stored)[MATCH_COLUMNS]
+
+    # 1. Checagem de consistência no ponto de emenda (O(times))
+    check = last_stored.merge(scraped[MATCH_COLUMNS], on=[COLUNA_TIME_ID, COLUNA_RODADA],
+                              how='left', suffixes=('', '_coletado'))
+    compare = [c for c in MATCH_COLUMNS if c not in (COLUNA_TIME_ID, COLUNA_RODADA)]
+    collected_teams = check[COLUNA_TIME_ID].isin(scraped[COLUNA_TIME_ID])
+    mismatched = np.zeros(len(check), dtype=bool)
+    for col in compare:
+        mismatched |= (check[col].to_numpy() != check[f'{col}_coletado'].to_numpy())
+    mismatched &= collected_teams.to_numpy()
+    if mismatched.any():
+        teams = check.loc[mismatched, 'Time1'].tolist()
+        raise ValueError(f"Jogos armazenados divergem dos coletados para: {teams}. Reconstrua a temporada.")
+
+    # 2. Jogos com Ordem_Jogo acima do último conhecido (times novos entram inteiros)
+    last_round = scraped[COLUNA_TIME_ID].map(last_stored.set_index(COLUNA_TIME_ID)[COLUNA_RODADA]).fillna(0)
+    return scraped.loc[scraped[COLUNA_RODADA] > last_round, MATCH_COLUMNS].drop_duplicates()
+
+
+def extend_accumulated(stored, new_rows):
+    """Calcula Pontos/Saldo/Vitórias acumulados dos jogos novos a partir do último acumulado de cada time."""
+    new_rows = new_rows.sort_values([COLUNA_TIME_ID, COLUNA_RODADA]).copy()
+
+    gols1 = new_rows['Gols1'].to_numpy()
+    gols2 = new_rows['Gols2'].to_numpy()
+    deltas = pd.DataFrame({
+        'Pontos_Acumulados': np.select([gols1 > gols2, gols1 == gols2], [3, 1], default=0),
+        'Vitorias_Acumuladas': (gols1 > gols2).astype(np.int64),
+        'Saldo_Gols_Acumulado': gols1 - gols2,
+    }, index=new_rows.index)
+
+    base = _last_rows(stored).set_index(COLUNA_TIME_ID)
+    for col in deltas.columns:
+        start = new_rows[COLUNA_TIME_ID].map(base[col]).fillna(0).astype(np.int64)
+        new_rows[col] = start + deltas[col].groupby(new_rows[COLUNA_TIME_ID]).cumsum()
+    return new_rows
+
+
+def incremental_update(stored, scraped, tiebreak='notebook'):
+    """
+    Acrescenta ao dataset armazenado somente os jogos novos do `scraped` e recalcula
+    Posicao_Jogo apenas nas rodadas afetadas. Retorna (dataset_atualizado, jogos_novos).
+
+    O custo depende dos jogos novos: o ranking usa o último estado de cada time antes da
+    primeira rodada afetada mais as linhas dessas rodadas.
+    """
+    stored = stored[STORED_COLUMNS]
+    added = new_matches(stored, scraped)
+    if added.empty:
+        return stored, added
+
+    added = extend_accumulated(stored, added)
+    first_round = int(added[COLUNA_RODADA].min())
+
+    # 1. Linhas que entram no ranking: rodadas afetadas + estado anterior de cada time
+    before = stored[stored[COLUNA_RODADA] < first_round]
+    carry = _last_rows(before)
+    affected_stored = stored[stored[COLUNA_RODADA] >= first_round]
+    window = pd.concat([carry, affected_stored, added], ignore_index=False, keys=['carry', 'stored', 'added'])
+
+    # O estado anterior vira a "rodada 1" da janela; as rodadas afetadas vêm em seguida.
+    # A ordem de aparição dos times segue a coleta, como na reconstrução completa (desempate final).
+    team_order = pd.unique(pd.concat([scraped[COLUNA_TIME_ID], stored[COLUNA_TIME_ID]]))
+    window = window.assign(_ordem=pd.Index(team_order).get_indexer(window[COLUNA_TIME_ID]))
+    window.loc[window['_ordem'] < 0, '_ordem'] = len(team_order)
+    window = window.sort_values('_ordem', kind='stable')
+    window[COLUNA_RODADA + '_janela'] = np.where(
+        window.index.get_level_values(0) == 'carry', 1, window[COLUNA_RODADA] - first_round + 2
+    )
+    positions = round_positions(window, COLUNA_TIME_ID, COLUNA_RODADA + '_janela', tiebreak=tiebreak)
+
+    # 2. Atualiza as posições das rodadas afetadas e acrescenta os jogos novos
+    stored = stored.copy()
+    affected = positions.loc['stored'] if 'stored' in positions.index.get_level_values(0) else None
+    if affected is not None:
+        stored.loc[affected.index, 'Posicao_Jogo'] = affected.to_numpy()
+    added['Posicao_Jogo'] = positions.loc['added'].reindex(added.index).to_numpy()
+
+    updated = pd.concat([stored, added[STORED_COLUMNS]], ignore_index=True)
+    updated = updated.sort_values(by=[COLUNA_RODADA, 'Posicao_Jogo']).reset_index(drop=True)
+    return updated, added[STORED_COLUMNS]
@@ -0,0 +1,146 @@
+"""
+Logos dos times: mapeamento único (antes replicado em cada página) e pipeline local de
+miniaturas.
+
+Os arquivos originais ficam em `assets/logos/<slug>.<ext>` (png/jpg/webp); o build gera
+miniaturas quadradas de 20/50/200px em `assets/logos/thumbs/<slug>-<tamanho>.png`, que são
+servidas embutidas no HTML como data URIs (nenhuma requisição de imagem por render).
+Times sem miniatura continuam usando a URL remota do TEAM_LOGOS.
+
+Build: python -m brasileirao.logos [pasta_origem] [pasta_destino]
+"""
+import base64
+import os
+import sys
+import unicodedata
+
+# Pasta dos logos na raiz do projeto (independe do diretório de onde o app é iniciado)
+LOGO_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'logos')
+THUMB_DIR = os.path.join(LOGO_DIR, 'thumbs')
+
+# Tamanhos exibidos: tabela do ranking (20), cabeçalho do Duelo (50) e Visão Time (200)
+LOGO_SIZES = (20, 50, 200)
+
+SOURCE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+
+# URLs remotas (fallback quando não há miniatura local)
+TEAM_LOGOS = {
+    'Fortaleza Ec Saf': 'https://upload.wikimedia.org/wikipedia/commons/e/e9/Fortaleza_EC_2018.png',
+    'Juventude': 'https://upload.wikimedia.org/wikipedia/de/c/cd/Juventude_logo.svg',
+    'Cruzeiro Saf': 'https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Cruzeiro_Esporte_Clube_%28logo%29.svg/250px-Cruzeiro_Esporte_Clube_%28logo%29.svg.png',
+    'Vasco da Gama S.a.f.': 'https://upload.wikimedia.org/wikipedia/pt/thumb/8/8b/EscudoDoVascoDaGama.svg/950px-EscudoDoVascoDaGama.svg.png',
+    'Grêmio': 'https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Gremio_logo.svg/250px-Gremio_logo.svg.png',
+    'Palmeiras': 'https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Palmeiras_logo.svg/250px-Palmeiras_logo.svg.png',
+    'Flamengo': 'https://upload.wikimedia.org/wikipedia/commons/thumb/2/2e/Flamengo_braz_logo.svg/250px-Flamengo_braz_logo.svg.png',
+    'Bahia': 'https://upload.wikimedia.org/wikipedia/pt/thumb/9/90/ECBahia.png/250px-ECBahia.png',
+    'Botafogo': 'https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Botafogo_de_Futebol_e_Regatas_logo.svg/1064px-Botafogo_de_Futebol_e_Regatas_logo.svg.png',
+    'São Paulo': 'https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Brasao_do_Sao_Paulo_Futebol_Clube.svg/1024px-Brasao_do_Sao_Paulo_Futebol_Clube.svg.png',
+    'Corinthians': 'https://upload.wikimedia.org/wikipedia/pt/thumb/b/b4/Corinthians_simbolo.png/250px-Corinthians_simbolo.png',
+    'Ceará': 'https://upload.wikimedia.org/wikipedia/commons/thumb/3/38/Cear%C3%A1_Sporting_Club_logo.svg/1081px-Cear%C3%A1_Sporting_Club_logo.svg.png',
+    'Red Bull Bragantino': 'https://upload.wikimedia.org/wikipedia/pt/thumb/9/9e/RedBullBragantino.png/250px-RedBullBragantino.png',
+    'Internacional': 'https://upload.wikimedia.org/wikipedia/commons/thumb/a/ae/SC_Internacional_Brazil_Logo.svg/250px-SC_Internacional_Brazil_Logo.svg.png',
+    'Sport Recife': 'https://upload.wikimedia.org/wikipedia/pt/1/17/Sport_Club_do_Recife.png',
+    'Mirassol': 'https://upload.wikimedia.org/wikipedia/commons/5/5b/Mirassol_FC_logo.png',
+    'Atlético Mineiro Saf': 'https://upload.wikimedia.org/wikipedia/commons/thumb/5/5f/Atletico_mineiro_galo.png/250px-Atletico_mineiro_galo.png',
+    'Santos Fc': 'https://upload.wikimedia.org/wikipedia/commons/thumb/3/35/Santos_logo.svg/1045px-Santos_logo.svg.png',
+    'Fluminense': 'https://upload.wikimedia.org/wikipedia/commons/thumb/1/12/Fluminense_Football_Club.svg/250px-Fluminense_Football_Club.svg.png',
+    'Vitória': 'https://upload.wikimedia.org/wikipedia/pt/3/34/Esporte_Clube_Vit%C3%B3ria_logo.png'
+}
+
+
+def placeholder_logo(size, text='?'):
+    """Imagem genérica para times sem logo."""
+    return f'https://placehold.co/{size}x{size}/cccccc/333333?text={text}'
+
+
+def team_slug(team_name):
+    """Nome do arquivo do time: 'Vasco da Gama S.a.f.' -> 'vasco-da-gama-s-a-f'."""
+    ascii_name = unicodedata.normalize('NFKD', team_name).encode('ascii', 'ignore').decode('ascii')
+    words = ''.join(char if char.isalnum() else ' ' for char in ascii_name.lower()).split()
+    return '-'.join(words)
+
+
+def thumbnail_path(thumb_dir, team_name, size):
+    return os.path.join(thumb_dir, f'{team_slug(team_name)}-{size}.png')
+
+
+def build_thumbnails(source_dir=LOGO_DIR, thumb_dir=THUMB_DIR, sizes=LOGO_SIZES, teams=TEAM_LOGOS):
+    """
+    Gera as miniaturas (PNG quadrado, fundo transparente, logo centralizado sem distorção)
+    de cada time com arquivo em `source_dir`. Retorna {time: [caminhos gerados]}.
+    """
+    from PIL import Image, ImageOps
+
+    os.makedirs(thumb_dir, exist_ok=True)
+    built = {}
+    for team in teams:
+        slug = team_slug(team)
+        source = next((os.path.join(source_dir, slug + ext) for ext in SOURCE_EXTENSIONS
+                       if os.path.exists(os.path.join(source_dir, slug + ext))), None)
+        if source is None:
+            continue
+
+        with Image.open(source) as image:
+            image = image.convert('RGBA')
+            paths = []
+            for size in sizes:
+                # Reduz para caber em size x size e centraliza num quadrado transparente
+                thumb = ImageOps.contain(image, (size, size), Image.LANCZOS)
+                canvas = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+                canvas.paste(thumb, ((size - thumb.width) // 2, (size - thumb.height) // 2))
+                path = thumbnail_path(thumb_dir, team, size)
+                canvas.save(path, optimize=True)
+                paths.append(path)
+        built[team] = paths
+    return built
+
+
+def data_uri(png_bytes):
+    return 'data:image/png;base64,' + base64.b64encode(png_bytes).decode('ascii')
+
+
+class LogoCatalog:
+    """
+    Logos prontos para exibição: data URI da miniatura local quando existe, senão a URL
+    remota. Carregado uma vez por processo (as páginas compartilham a mesma instância).
+    """
+
+    def __init__(self, thumbnails, remote=TEAM_LOGOS):
+        self.thumbnails = thumbnails # {(time, tamanho): data URI}
+        self.remote = remote
+
+    @classmethod
+    def from_directory(cls, thumb_dir=THUMB_DIR, sizes=LOGO_SIZES, teams=TEAM_LOGOS):
+        thumbnails = {}
+        for team in teams:
+            for size in sizes:
+                path = thumbnail_path(thumb_dir, team, size)
+                if os.path.exists(path):
+                    with open(path, 'rb') as f:
+                        thumbnails[(team, size)] = data_uri(f.read())
+        return cls(thumbnails, teams)
+
+    def url(self, team_name, size, default=None):
+        """src da imagem do time no tamanho pedido (data URI, URL remota ou placeholder)."""
+        thumbnail = self.thumbnails.get((team_name, size))
+        if thumbnail is not None:
+            return thumbnail
+        return self.remote.get(team_name, default or placeholder_logo(size))
+
+    def mapping(self, size):
+        """{time: src} de todos os times conhecidos no tamanho pedido."""
+        return {team: self.url(team, size) for team in self.remote}
+
+    def local_count(self, size):
+        """Quantos times têm miniatura local (sem requisição de imagem) no tamanho pedido."""
+        return sum(1 for team, thumb_size in self.thumbnails if thumb_size == size)
+
+
+if __name__ == '__main__':
+    source_dir = sys.argv[1] if len(sys.argv) > 1 else LOGO_DIR
+    thumb_dir = sys.argv[2] if len(sys.argv) > 2 else THUMB_DIR
+    built = build_thumbnails(source_dir, thumb_dir)
+    print(f"{len(built)} de {len(TEAM_LOGOS)} times com miniaturas em {thumb_dir}")
+    for team in TEAM_LOGOS:
+        if team not in built:
+            print(f"  sem arquivo de origem: {team} (esperado {os.path.join(source_dir, team_slug(team))}.png)")
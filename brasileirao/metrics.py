@@ -0,0 +1,183 @@
+"""
+Métricas de desempenho (P/J/V/E/D/GM/GC/SG/AP/GPJ/PPJ) calculadas para todos os times de uma vez.
+
+O módulo só importa pandas dentro das funções que montam DataFrames: as constantes, as
+métricas derivadas e a ordem da classificação servem também ao caminho só com NumPy da
+CLI (brasileirao.cube).
+"""
+import numpy as np
+
+from brasileirao.ranking import TIEBREAK_PRESETS
+
+# Pontos por resultado
+POINTS = {'V': 3, 'E': 1, 'D': 0}
+
+# Colunas de métricas, na ordem usada pelas páginas
+METRIC_COLUMNS = ['P', 'J', 'V', 'E', 'D', 'GM', 'GC', 'SG', 'AP', 'GPJ', 'PPJ']
+
+# Colunas somáveis (as demais são derivadas delas em add_derived_metrics)
+SUM_COLUMNS = ['P', 'J', 'V', 'E', 'D', 'GM', 'GC']
+
+# Filtros de Local aceitos pelas páginas (None = Geral) e a chave usada na tabela
+LOCAL_FILTERS = (None, 'C', 'F')
+LOCAL_KEYS = {None: 'Geral', 'C': 'C', 'F': 'F'}
+
+# Critérios padrão da classificação (Pontos, Vitórias, Saldo, Gols Marcados)
+DEFAULT_SORT = TIEBREAK_PRESETS['completo']
+
+# Critérios de ordenação de cada tipo de ranking da página Visão Ranking: (colunas, ascendente)
+RANKING_CRITERIA = {
+    'Classificação (Pontos)': (DEFAULT_SORT, [False, False, False, False]),
+    'Melhor Ataque (Gols Marcados)': (['GM', 'V', 'SG', 'P'], [False, False, False, False]),
+    'Melhor Defesa (Gols Sofridos)': (['GC', 'SG', 'V', 'P'], [True, False, False, False]),
+    'Média de Pontos por Jogo (PPJ)': (['PPJ', 'V', 'SG', 'P'], [False, False, False, False]),
+    'Média de Gols por Jogo (GPJ)': (['GPJ', 'V', 'SG', 'P'], [False, False, False, False]),
+}
+
+# Nomes curtos de cada tipo de ranking (CLI e API)
+RANKING_ALIASES = dict(zip(['pontos', 'ataque', 'defesa', 'ppj', 'gpj'], RANKING_CRITERIA))
+
+
+def result_points(resultado):
+    """Pontos de cada jogo (V/E/D -> 3/1/0) como inteiros, também para a coluna categórica."""
+    return resultado.astype(object).map(POINTS)
+
+
+def add_match_columns(df_team, team_name=None):
+    """
+    Adiciona GS, GC, Saldo_Jogo, Adversario e Pontos_Jogo de forma vetorizada.
+    Sem `team_name`, a perspectiva é sempre a do Time1 (time em foco).
+    """
+    is_time1 = (df_team['Time1'] == team_name) if team_name is not None else np.ones(len(df_team), dtype=bool)
+
+    df_team['GS'] = np.where(is_time1, df_team['Gols1'], df_team['Gols2']).astype(np.int64)
+    df_team['GC'] = np.where(is_time1, df_team['Gols2'], df_team['Gols1']).astype(np.int64)
+    df_team['Saldo_Jogo'] = df_team['GS'] - df_team['GC']
+    df_team['Adversario'] = np.where(is_time1, df_team['Time2'], df_team['Time1'])
+    df_team['Pontos_Jogo'] = result_points(df_team['Resultado'])
+    return df_team
+
+
+def team_games(df):
+    """Uma linha por (time, jogo) na perspectiva do Time1, sem as duplicatas do esqueleto."""
+    return df.drop_duplicates(subset=['Time1', 'Ordem_Jogo'], keep='first')
+
+
+def calculate_all_team_metrics(df, all_teams=None):
+    """
+    Calcula as métricas de todos os times para Geral, Casa ('C') e Fora ('F') em uma
+    única passada agrupada. Retorna um DataFrame indexado por (Local, Time).
+    """
+    import pandas as pd
+
+    games = team_games(df)
+    resultado = games['Resultado'].to_numpy()
+
+    # 1. Uma coluna indicadora por métrica somável
+    parts = pd.DataFrame({
+        'Local': games['Local'].to_numpy(),
+        'Time': games['Time1'].to_numpy(),
+        'P': result_points(games['Resultado']).to_numpy(),
+        'J': 1,
+        'V': (resultado == 'V').astype(np.int64),
+        'E': (resultado == 'E').astype(np.int64),
+        'D': (resultado == 'D').astype(np.int64),
+        'GM': games['Gols1'].to_numpy(dtype=np.int64),
+        'GC': games['Gols2'].to_numpy(dtype=np.int64),
+    })
+
+    # 2. Soma por (Local, Time); o Geral é a soma de Casa + Fora
+    by_local = parts.groupby(['Local', 'Time']).sum()
+
+    if all_teams is None:
+        all_teams = np.sort(pd.unique(df[['Time1', 'Time2']].values.ravel('K')))
+    return metrics_from_local_sums(by_local, all_teams)
+
+
+def metrics_from_local_sums(by_local, all_teams):
+    """
+    Tabela de métricas (Local x Time, com o Geral) a partir das somas P/J/V/E/D/GM/GC por
+    (Local, Time). Também usada pelos agregados entre temporadas (brasileirao.rollups).
+    """
+    import pandas as pd
+
+    geral = by_local.groupby(level='Time').sum()
+    all_teams = pd.Index(all_teams, name='Time')
+
+    tables = {'Geral': geral}
+    for local in ('C', 'F'):
+        tables[local] = by_local.xs(local, level='Local') if local in by_local.index.get_level_values('Local') else geral.iloc[0:0]
+    table = pd.concat(
+        {key: t.reindex(all_teams, fill_value=0) for key, t in tables.items()},
+        names=['Local']
+    )
+
+    # Métricas derivadas (times sem jogos no filtro ficam com 0)
+    return add_derived_metrics(table)
+
+
+def derived_metrics(columns):
+    """SG, AP, GPJ e PPJ a partir das colunas somáveis (mapeamento coluna -> array ou Series)."""
+    games_played = np.asarray(columns['J'])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return {
+            'SG': columns['GM'] - columns['GC'],
+            'AP': np.where(games_played > 0, columns['P'] / (games_played * 3) * 100, 0.0),
+            'GPJ': np.where(games_played > 0, columns['GM'] / games_played, 0.0),
+            'PPJ': np.where(games_played > 0, columns['P'] / games_played, 0.0),
+        }
+
+
+def add_derived_metrics(table):
+    """Completa SG, AP, GPJ e PPJ a partir das colunas somáveis (P, J, V, E, D, GM, GC)."""
+    for column, values in derived_metrics(table).items():
+        table[column] = values
+    return table[METRIC_COLUMNS]
+
+
+def team_metrics(metrics_table, team_name, local_filter=None):
+    """Retorna o dicionário de métricas de um time (mesmo formato do antigo calculate_team_metrics)."""
+    key = (LOCAL_KEYS[local_filter], team_name)
+    if key not in metrics_table.index:
+        return {col: (0.0 if col in ('AP', 'GPJ', 'PPJ') else 0) for col in METRIC_COLUMNS}
+    # Leitura posicional coluna a coluna: preserva o tipo de cada coluna (int continua int)
+    # e evita montar um DataFrame de uma linha a cada consulta
+    row = metrics_table.index.get_loc(key)
+    return {col: metrics_table[col].iat[row].item() for col in METRIC_COLUMNS}
+
+
+def ranking_order(columns, ranking_option=None):
+    """
+    Ordem das linhas na classificação (índices para reordenar `columns`, um mapeamento
+    coluna -> array ou um DataFrame): critérios do tipo de ranking, depois a classificação
+    padrão (decrescente) e, nos empates completos, a ordem original das linhas.
+    """
+    keys = [(column, False) for column in DEFAULT_SORT]
+    if ranking_option is not None and ranking_option != 'Classificação (Pontos)':
+        sort_by, ascending = RANKING_CRITERIA[ranking_option]
+        keys = list(zip(sort_by, ascending)) + keys
+
+    # np.lexsort ordena pela ÚLTIMA chave primeiro e é estável
+    sort_keys = [np.asarray(columns[column]) for column, _ in reversed(keys)]
+    return np.lexsort([key if asc else -key for key, (_, asc) in zip(sort_keys, reversed(keys))])
+
+
+def sort_ranking(ranking_df, ranking_option=None):
+    """
+    Ordena a tabela pela classificação padrão e, em seguida, pelos critérios do tipo de
+    ranking escolhido. O índice 'Pos' é refeito começando em 1.
+    """
+    ranking_df = ranking_df.iloc[ranking_order(ranking_df, ranking_option)].reset_index(drop=True)
+
+    ranking_df.index = ranking_df.index + 1  # Posição começando em 1
+    ranking_df.index.name = 'Pos'
+    return ranking_df
+
+
+def ranking_table(metrics_table, local_filter=None, ranking_option=None):
+    """
+    Monta a tabela de classificação (coluna 'Time' + métricas) para um filtro de Local,
+    ordenada pelo tipo de ranking (padrão: Pontos) e com índice 'Pos' começando em 1.
+    """
+    ranking_df = metrics_table.xs(LOCAL_KEYS[local_filter], level='Local').reset_index()
+    return sort_ranking(ranking_df[METRIC_COLUMNS + ['Time']], ranking_option)
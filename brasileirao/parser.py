@@ -0,0 +1,113 @@
+"""
+Parse dos cards de partida da aba 'histórico de partidas' da CBF.
+
+`extrair_placares` usa lxml com expressões XPath pré-compiladas (bem mais rápido que o
+BeautifulSoup com `html.parser` e matchers em Python). `extrair_placares_bs4` é a
+implementação original, mantida como referência e como alternativa quando o lxml não
+estiver instalado. As duas retornam exatamente os mesmos resultados.
+"""
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:  # pragma: no cover - lxml está no requirements.txt
+    lxml_html = None
+
+if lxml_html is not None:
+    # Mesmo critério do BeautifulSoup: a classe contém o trecho (nomes gerados pelo CSS-in-JS)
+    _CARDS = etree.XPath("//div[contains(@class, 'styles_gameCardContainer')]")
+    _SCORE = etree.XPath("(.//div[contains(@class, 'styles_score')])[1]")
+    _CHILD_DIVS = etree.XPath("./div")
+    _FIRST_STRONG = etree.XPath("(.//strong)[1]")
+    _GOL_SPANS = etree.XPath(".//span[contains(@class, 'styles_gol')]")
+    _STRONGS = etree.XPath(".//strong")
+
+
+def _text(element):
+    """Texto do elemento e de todos os descendentes (equivalente ao .text do BeautifulSoup)."""
+    return ''.join(element.itertext())
+
+
+def extrair_placares(html):
+    """Extrai (Time_Casa, Placar_Casa, Placar_Fora, Time_Fora) dos cards de partida da página."""
+    if lxml_html is None:
+        return extrair_placares_bs4(html)
+
+    root = lxml_html.document_fromstring(html)
+    dados_placares = []
+
+    for partida in _CARDS(root):
+        score = _SCORE(partida)
+        if not score:
+            continue
+        score_container = score[0]
+
+        # Blocos dos dois times (filhos diretos do container de placar)
+        times_scores = _CHILD_DIVS(score_container)
+        if len(times_scores) < 2:
+            continue
+
+        # Valida o bloco do mandante (nome no <strong title> e placar no span de gol)
+        primeiro_nome = _FIRST_STRONG(times_scores[0])
+        if not primeiro_nome or primeiro_nome[0].get('title') is None or not _GOL_SPANS(times_scores[0]):
+            continue
+
+        times_nomes = _STRONGS(partida)
+        scores = _GOL_SPANS(score_container)
+        if len(times_nomes) < 2 or len(scores) < 2:
+            continue
+
+        time_casa = times_nomes[0].get('title')
+        time_fora = times_nomes[1].get('title')
+        if time_casa is None or time_fora is None:
+            continue
+        try:
+            placar_casa = int(_text(scores[0]).strip())
+            placar_fora = int(_text(scores[1]).strip())
+        except ValueError:
+            continue
+
+        dados_placares.append({
+            'Time_Casa': time_casa.strip(),
+            'Placar_Casa': placar_casa,
+            'Placar_Fora': placar_fora,
+            'Time_Fora': time_fora.strip()
+        })
+
+    return dados_placares
+
+
+def extrair_placares_bs4(html):
+    """Implementação original (BeautifulSoup + html.parser), usada como referência."""
+    soup_historico = BeautifulSoup(html, 'html.parser')
+
+    partidas = soup_historico.find_all('div', class_=lambda x: x and 'styles_gameCardContainer' in x)
+    dados_placares = []
+
+    for partida in partidas:
+        score_container = partida.find('div', class_=lambda x: x and 'styles_score' in x)
+
+        if score_container:
+            # Encontra os blocos dos dois times dentro do container de placar
+            times_scores = score_container.find_all('div', recursive=False)
+
+            if len(times_scores) >= 2:
+                try:
+                    # Valida o bloco do mandante (nome no <strong title> e placar no span de gol)
+                    times_scores[0].find('strong')['title'].strip()
+                    times_scores[0].find('span', class_=lambda x: x and 'styles_gol' in x).text.strip()
+
+                    times_nomes = partida.find_all('strong')
+                    scores = score_container.find_all('span', class_=lambda x: x and 'styles_gol' in x)
+
+                    if len(times_nomes) >= 2 and len(scores) >= 2:
+                        dados_placares.append({
+                            'Time_Casa': times_nomes[0]['title'].strip(),
+                            'Placar_Casa': int(scores[0].text.strip()),
+                            'Placar_Fora': int(scores[1].text.strip()),
+                            'Time_Fora': times_nomes[1]['title'].strip()
+                        })
+                except Exception:
+                    continue
+
+    return dados_placares
@@ -0,0 +1,186 @@
+"""
+Histórico de várias temporadas particionado por temporada e divisão (Parquet, layout hive):
+
+    dados/temporada=2025/divisao=serie-a/jogos.parquet
+
+Cada partição guarda a tabela canônica de jogos da temporada (brasileirao.fixtures). Na
+leitura, os filtros de temporada/divisão escolhem os arquivos pelo caminho (as partições das
+outras temporadas nem são abertas), os de time/rodada descem para o leitor Parquet
+(estatísticas dos row groups) e só as colunas pedidas são lidas: carregar uma temporada
+custa o mesmo com 1 ou 20 temporadas arquivadas.
+
+Importar um df.xlsx como temporada: python -m brasileirao.partitions df.xlsx 2025 [serie-a]
+"""
+import os
+import sys
+
+# Raiz do histórico particionado (na raiz do projeto, ao lado do df.xlsx)
+PARTITION_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'dados')
+PARTITION_FILE = 'jogos.parquet'
+DEFAULT_DIVISION = 'serie-a'
+
+# Colunas de partição (vêm do caminho, não dos arquivos)
+PARTITION_COLUMNS = ['temporada', 'divisao']
+
+
+def partition_path(temporada, divisao=DEFAULT_DIVISION, root=None):
+    """Pasta da partição: <root>/temporada=2025/divisao=serie-a."""
+    return os.path.join(root or PARTITION_DIR, f'temporada={int(temporada)}', f'divisao={divisao}')
+
+
+def parse_partition(path):
+    """(root, temporada, divisao) de uma pasta de partição (inverso de partition_path)."""
+    path = os.path.normpath(path)
+    season_dir, division_dir = os.path.split(path)
+    root, season_name = os.path.split(season_dir)
+    if not (season_name.startswith('temporada=') and division_dir.startswith('divisao=')):
+        raise ValueError(f"Caminho não é uma partição temporada=/divisao=: {path}")
+    return root, int(season_name.split('=', 1)[1]), division_dir.split('=', 1)[1]
+
+
+def available_partitions(root=None):
+    """[(temporada, divisao)] com arquivo gravado, em ordem (só lista pastas, não abre Parquet)."""
+    root = root or PARTITION_DIR
+    if not os.path.isdir(root):
+        return []
+    partitions = []
+    for season_name in os.listdir(root):
+        if not season_name.startswith('temporada='):
+            continue
+        season_dir = os.path.join(root, season_name)
+        for division_name in os.listdir(season_dir) if os.path.isdir(season_dir) else []:
+            if division_name.startswith('divisao=') and os.path.exists(os.path.join(season_dir, division_name, PARTITION_FILE)):
+                partitions.append((int(season_name.split('=', 1)[1]), division_name.split('=', 1)[1]))
+    return sorted(partitions)
+
+
+def available_seasons(root=None, divisao=DEFAULT_DIVISION):
+    """Temporadas gravadas de uma divisão, em ordem crescente."""
+    return [temporada for temporada, division in available_partitions(root) if division == divisao]
+
+
+def resolve_source(temporada=None, root=None, default=None, divisao=DEFAULT_DIVISION):
+    """
+    Fonte de dados das consultas, como nas páginas: a partição da `temporada` pedida ou,
+    sem temporada, a mais recente; sem histórico particionado, `default` (o df.xlsx).
+    Levanta ValueError se a temporada pedida não estiver gravada.
+    """
+    root = root or PARTITION_DIR
+    seasons = available_seasons(root, divisao)
+    if temporada is not None:
+        if int(temporada) not in seasons:
+            raise ValueError(f"Temporada {temporada} não encontrada em {root}.")
+        return partition_path(temporada, divisao, root)
+    return partition_path(seasons[-1], divisao, root) if seasons else default
+
+
+def source_file(source):
+    """Arquivo de dados de uma fonte das páginas: o jogos.parquet da partição ou o próprio df.xlsx."""
+    return os.path.join(source, PARTITION_FILE) if os.path.isdir(source) else source
+
+
+def write_partition(fixtures, temporada, divisao=DEFAULT_DIVISION, root=None):
+    """Grava (ou substitui) a tabela de jogos de uma temporada de forma atômica."""
+    directory = partition_path(temporada, divisao, root)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, PARTITION_FILE)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    fixtures.drop(columns=PARTITION_COLUMNS, errors='ignore').to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def import_excel(file_path, temporada, divisao=DEFAULT_DIVISION, root=None):
+    """Importa um df.xlsx (formato do notebook) como a partição da temporada."""
+    from brasileirao.storage import load_fixtures
+
+    return write_partition(load_fixtures(file_path), temporada, divisao, root)
+
+
+def _filter_expression(times, rodadas):
+    """
+    Jogos de algum dos `times` (dentro das `rodadas`, contadas pelo jogo desse time). Sem
+    times, vale o jogo em que algum dos lados está no intervalo de rodadas.
+    """
+    import pyarrow.dataset as ds
+
+    def side(team_column, round_column):
+        condition = None
+        if times is not None:
+            condition = ds.field(team_column).isin(list(times))
+        if rodadas is not None:
+            first, last = rodadas
+            in_rounds = (ds.field(round_column) >= first) & (ds.field(round_column) <= last)
+            condition = in_rounds if condition is None else condition & in_rounds
+        return condition
+
+    if times is None and rodadas is None:
+        return None
+    return side('Mandante', 'Jogo_Mandante') | side('Visitante', 'Jogo_Visitante')
+
+
+def read_fixtures(root=None, temporadas=None, divisoes=(DEFAULT_DIVISION,), times=None, rodadas=None, columns=None):
+    """
+    Tabela canônica de jogos das partições pedidas, com as colunas `temporada` e `divisao`.
+
+    - temporadas / divisoes: listas (None = todas); escolhem as partições pelo caminho;
+    - times: jogos em que algum desses times entra em campo;
+    - rodadas: (primeira, última), inclusivas, pelo número do jogo de cada time;
+    - columns: colunas lidas do arquivo (as de partição podem ser pedidas também).
+    """
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    root = root or PARTITION_DIR
+    if temporadas is not None and divisoes is not None:
+        # Partições conhecidas: monta os caminhos direto, sem listar a raiz
+        partitions = [(temporada, divisao) for temporada in temporadas for divisao in divisoes
+                      if os.path.exists(os.path.join(partition_path(temporada, divisao, root), PARTITION_FILE))]
+    else:
+        partitions = [(temporada, divisao) for temporada, divisao in available_partitions(root)
+                      if (temporadas is None or temporada in temporadas) and (divisoes is None or divisao in divisoes)]
+    if not partitions:
+        return pd.DataFrame(columns=columns)
+
+    # Só os arquivos das partições escolhidas entram no dataset (nada das demais é listado ou aberto)
+    files = [os.path.join(partition_path(temporada, divisao, root), PARTITION_FILE) for temporada, divisao in partitions]
+    partitioning = ds.partitioning(pa.schema([('temporada', pa.int16()), ('divisao', pa.string())]), flavor='hive')
+    dataset = ds.dataset(files, format='parquet', partitioning=partitioning, partition_base_dir=root)
+    table = dataset.to_table(columns=columns, filter=_filter_expression(times, rodadas))
+    return table.to_pandas()
+
+
+def load_season(temporada, divisao=DEFAULT_DIVISION, root=None, times=None, ate_rodada=None):
+    """
+    Visão por time (formato do df.xlsx, esquema compacto) de uma temporada, opcionalmente só
+    de alguns times e até uma rodada (os acumulados continuam corretos: a leitura traz todos
+    os jogos desses times desde a rodada 1). O filtro de times exige as posições guardadas:
+    recalculá-las com parte dos jogos daria outro ranking.
+    """
+    from brasileirao.fixtures import team_perspective
+
+    rodadas = (1, ate_rodada) if ate_rodada is not None else None
+    fixtures = read_fixtures(root, [temporada], [divisao], times, rodadas)
+    if times is not None and 'Posicao_Mandante' not in fixtures.columns:
+        raise ValueError("Filtro de times sem posições guardadas na partição: carregue a temporada inteira.")
+    df = team_perspective(fixtures.drop(columns=PARTITION_COLUMNS, errors='ignore'))
+    if times is not None:
+        df = df[df['Time1'].isin(list(times))]
+    if ate_rodada is not None:
+        df = df[df['Ordem_Jogo'] <= ate_rodada]
+    return df.reset_index(drop=True)
+
+
+def load_partition(path, **filters):
+    """load_season a partir da pasta da partição (ex.: a fonte escolhida nas páginas)."""
+    root, temporada, divisao = parse_partition(path)
+    return load_season(temporada, divisao, root, **filters)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print("Uso: python -m brasileirao.partitions arquivo.xlsx temporada [divisao]")
+        sys.exit(1)
+    division = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_DIVISION
+    print(f"Partição gravada em {import_excel(sys.argv[1], int(sys.argv[2]), division)}")
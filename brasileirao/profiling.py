@@ -0,0 +1,191 @@
+"""
+Instrumentação leve dos reruns das páginas: tempo de cada fase (carga, cálculo,
+renderização) e de trechos específicos, gravados como um registro por rerun num arquivo
+JSON-lines para análise offline (p50/p95 por página e por fase).
+
+- `lap(nome)` fecha a fase corrente (tempo desde a fase anterior): as fases somam o rerun;
+- `span(nome)` / `timed(nome)` medem um trecho dentro de uma fase (detalhe, não somado).
+
+`MemoryProfiler` atribui memória (tracemalloc) a cada etapa: o pico durante a execução e o
+que continua alocado depois dela (o que a etapa retém, ex.: o que fica no cache).
+
+Resumo do log: python -m brasileirao.profiling [arquivo.jsonl]
+"""
+import functools
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from brasileirao.storage import SNAPSHOT_DIR
+
+# Junto dos snapshots, na .cache da raiz do projeto
+DEFAULT_LOG = os.path.join(SNAPSHOT_DIR, 'reruns.jsonl')
+
+_log_lock = threading.Lock()
+
+
+class RerunTimer:
+    """Cronômetro de um rerun: fases sequenciais + detalhes, em milissegundos."""
+
+    def __init__(self, page, clock=time.perf_counter):
+        self.page = page
+        self.clock = clock
+        self.phases = [] # [(nome, ms)]
+        self.details = [] # [(nome, ms)]
+        self._start = self._last = clock()
+
+    def lap(self, name):
+        """Fecha a fase `name` (tempo desde o último lap ou do início do rerun)."""
+        now = self.clock()
+        self.phases.append((name, (now - self._last) * 1e3))
+        self._last = now
+
+    @contextmanager
+    def span(self, name):
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.details.append((name, (self.clock() - start) * 1e3))
+
+    def timed(self, name=None):
+        """Decorador: mede cada chamada da função como um detalhe."""
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(name or fn.__name__):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def total_ms(self):
+        return (self.clock() - self._start) * 1e3
+
+    def record(self, selection=None):
+        """Registro do rerun (página, seleção, fases e detalhes) pronto para o log."""
+        def summed(spans):
+            totals = {}
+            for name, ms in spans:
+                totals[name] = round(totals.get(name, 0.0) + ms, 3)
+            return totals
+
+        return {
+            'ts': round(time.time(), 3),
+            'pagina': self.page,
+            'selecao': selection or {},
+            'total_ms': round(self.total_ms(), 3),
+            'fases': summed(self.phases),
+            'detalhes': summed(self.details),
+        }
+
+
+class MemoryProfiler:
+    """
+    Pico e memória retida (KiB) por etapa. O tracemalloc fica ligado entre `start()` e
+    `stop()` (deixa o código bem mais lento: é um modo de diagnóstico).
+    """
+
+    def __init__(self):
+        self.stats = {} # {etapa: {'pico_kib', 'retido_kib'}}
+        self._lock = threading.RLock()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        return self
+
+    def stop(self):
+        tracemalloc.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def measure(self, name, fn, *args, **kwargs):
+        """Executa fn(*args, **kwargs) registrando o pico e o retido sob `name`."""
+        if not tracemalloc.is_tracing():
+            return fn(*args, **kwargs)
+        # reset_peak é global: etapas concorrentes (várias sessões) são medidas uma de cada vez.
+        # Etapas aninhadas não travam, mas o pico da etapa externa passa a ser o da última interna.
+        with self._lock:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            result = fn(*args, **kwargs)
+            current, peak = tracemalloc.get_traced_memory()
+        self.stats[name] = {
+            'pico_kib': round((peak - before) / 1024, 1),
+            'retido_kib': round((current - before) / 1024, 1),
+        }
+        return result
+
+
+def append_record(record, log_path=DEFAULT_LOG):
+    """Acrescenta o registro (uma linha JSON) ao log; seguro para várias sessões."""
+    line = json.dumps(record, ensure_ascii=False, default=str)
+    directory = os.path.dirname(log_path)
+    with _log_lock:
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+
+
+def read_log(log_path=DEFAULT_LOG):
+    """Registros do log (linhas inválidas, ex.: escrita interrompida, são ignoradas)."""
+    records = []
+    with open(log_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def percentile(values, q):
+    """Percentil (0-100) por interpolação linear, como numpy.percentile."""
+    values = sorted(values)
+    if len(values) == 1:
+        return values[0]
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(records):
+    """{página: {'reruns', 'total': (p50, p95), 'fases': {nome: (p50, p95)}}}."""
+    by_page = {}
+    for record in records:
+        by_page.setdefault(record['pagina'], []).append(record)
+
+    summary = {}
+    for page, page_records in by_page.items():
+        phases = {}
+        for record in page_records:
+            for name, ms in {**record.get('fases', {}), **record.get('detalhes', {})}.items():
+                phases.setdefault(name, []).append(ms)
+        totals = [record['total_ms'] for record in page_records]
+        summary[page] = {
+            'reruns': len(page_records),
+            'total': (statistics.median(totals), percentile(totals, 95)),
+            'fases': {name: (statistics.median(v), percentile(v, 95)) for name, v in phases.items()},
+        }
+    return summary
+
+
+if __name__ == '__main__':
+    log_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_LOG
+    for page, stats in summarize(read_log(log_path)).items():
+        p50, p95 = stats['total']
+        print(f"{page} ({stats['reruns']} reruns): p50 {p50:.1f} ms | p95 {p95:.1f} ms")
+        print(f"  {'fase / detalhe':<32}{'p50 (ms)':>10}{'p95 (ms)':>10}")
+        for name, (p50, p95) in stats['fases'].items():
+            print(f"  {name:<32}{p50:>10.1f}{p95:>10.1f}")
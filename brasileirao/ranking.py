@@ -0,0 +1,115 @@
+"""
+Posições por rodada para todas as rodadas de uma vez: um único np.lexsort sobre os
+critérios de desempate, sem groupby().apply por rodada. (pandas só é importado pelas
+funções que recebem DataFrames.)
+"""
+import numpy as np
+
+# Critérios de desempate (em ordem de prioridade), definidos em um único lugar.
+# 'completo' é o usado pelas páginas; o notebook não acumula gols marcados e usa P/V/SG.
+TIEBREAK_PRESETS = {
+    'completo': ['P', 'V', 'SG', 'GM'],
+    'notebook': ['P', 'V', 'SG'],
+}
+
+# Colunas acumuladas do cbf.ipynb / df.xlsx correspondentes a cada critério
+ACCUMULATED_COLUMNS = {
+    'P': 'Pontos_Acumulados',
+    'V': 'Vitorias_Acumuladas',
+    'SG': 'Saldo_Gols_Acumulado',
+}
+
+
+def rank_within_groups(groups, keys, ascending=None):
+    """
+    Atribui posições (1..n) dentro de cada grupo (ex.: rodada, ou temporada+divisão+rodada).
+
+    `groups` é um array (ou lista de arrays) de chaves de grupo e `keys` a lista de arrays
+    dos critérios, em ordem de prioridade (decrescentes por padrão). Empates completos
+    ficam na ordem original das linhas, como o `method='first'` do notebook.
+    """
+    groups = [np.asarray(g) for g in (groups if isinstance(groups, (list, tuple)) else [groups])]
+    ascending = ascending if ascending is not None else [False] * len(keys)
+    n = len(groups[0])
+
+    # np.lexsort ordena pela ÚLTIMA chave primeiro: grupos por fora, critérios por dentro
+    sort_keys = [np.arange(n)]
+    for key, asc in reversed(list(zip(keys, ascending))):
+        key = np.asarray(key)
+        sort_keys.append(key if asc else -key)
+    sort_keys.extend(reversed(groups))
+    order = np.lexsort(sort_keys)
+
+    # Início de cada grupo na ordem ordenada -> posição = deslocamento dentro do grupo + 1
+    changed = np.zeros(n, dtype=bool)
+    if n:
+        changed[0] = True
+        for g in groups:
+            g_sorted = g[order]
+            changed[1:] |= g_sorted[1:] != g_sorted[:-1]
+    starts = np.flatnonzero(changed)
+    group_start = np.repeat(starts, np.diff(np.append(starts, n)))
+
+    positions = np.empty(n, dtype=np.int64)
+    positions[order] = np.arange(n) - group_start + 1
+    return positions
+
+
+def rank_grid(grid, keys, ascending=None):
+    """
+    Posições de uma grade (rodadas x times): `grid[k]` é o array 2D do critério k.
+    Retorna um array 2D de posições, com a ordem das colunas como desempate final.
+    """
+    n_rounds, n_teams = np.shape(grid[keys[0]])
+    round_idx = np.repeat(np.arange(n_rounds), n_teams)
+    positions = rank_within_groups(round_idx, [np.ravel(grid[k]) for k in keys], ascending)
+    return positions.reshape(n_rounds, n_teams)
+
+
+def cumulative_grid(df, team_col, round_col, value_columns):
+    """
+    Monta a grade (rodadas x times) de cada coluna acumulada. Rodadas em que o time não
+    jogou repetem o último valor conhecido (ffill) e, antes do primeiro jogo, valem 0.
+    Retorna (times, rodadas, {coluna: array 2D}).
+    """
+    import pandas as pd
+
+    teams = pd.unique(df[team_col])  # Ordem de aparição (mesmo desempate do esqueleto do notebook)
+    rounds = np.arange(1, int(df[round_col].max()) + 1)
+
+    team_idx = pd.Index(teams).get_indexer(df[team_col])
+    round_idx = df[round_col].to_numpy(dtype=np.int64) - 1
+
+    # Para cada célula, o índice da última rodada (<= atual) com jogo do time
+    has_game = np.zeros((len(rounds), len(teams)), dtype=bool)
+    has_game[round_idx, team_idx] = True
+    last_seen = np.where(has_game, np.arange(len(rounds))[:, None], -1)
+    np.maximum.accumulate(last_seen, axis=0, out=last_seen)
+    seen = last_seen >= 0
+    columns = np.broadcast_to(np.arange(len(teams)), last_seen.shape)
+
+    grid = {}
+    for col in value_columns:
+        values = np.zeros((len(rounds), len(teams)), dtype=np.asarray(df[col]).dtype)
+        values[round_idx, team_idx] = df[col].to_numpy()
+        grid[col] = np.where(seen, values[np.maximum(last_seen, 0), columns], 0)
+    return teams, rounds, grid
+
+
+def round_positions(df, team_col, round_col, tiebreak='notebook', columns=None):
+    """
+    Calcula a posição de cada linha (time, rodada) do DataFrame considerando a tabela
+    completa de cada rodada. Substitui o esqueleto + ffill + groupby().apply do notebook.
+    """
+    import pandas as pd
+
+    keys = TIEBREAK_PRESETS[tiebreak] if isinstance(tiebreak, str) else list(tiebreak)
+    columns = columns or ACCUMULATED_COLUMNS
+    value_columns = [columns[k] for k in keys]
+
+    teams, rounds, grid = cumulative_grid(df, team_col, round_col, value_columns)
+    positions = rank_grid(grid, value_columns)
+
+    team_idx = pd.Index(teams).get_indexer(df[team_col])
+    round_idx = df[round_col].to_numpy(dtype=np.int64) - 1
+    return pd.Series(positions[round_idx, team_idx], index=df.index, name='Posicao_Jogo')
@@ -0,0 +1,112 @@
+"""
+Renderização da tabela de ranking em HTML (logo + posição + métricas) e o cache das
+tabelas já renderizadas, para que trocar de filtro na página seja só uma consulta.
+"""
+import threading
+
+# Colunas exibidas e seus cabeçalhos
+RANKING_DISPLAY_COLUMNS = ['Pos_Time_HTML', 'P', 'J', 'PPJ', 'V', 'E', 'D', 'GM', 'GC', 'SG', 'GPJ', 'AP']
+RANKING_COLUMN_NAMES = {
+    'Pos_Time_HTML': 'Pos | Time', # Novo cabeçalho combinado
+    'P': 'Pts', 'J': 'Jogos', 'PPJ': 'PPJ', 'V': 'V', 'E': 'E', 'D': 'D',
+    'GM': 'GM', 'GC': 'GC', 'SG': 'SG', 'GPJ': 'GPJ', 'AP': 'Aprv. (%)'
+}
+
+# Logo exibido quando o time não está no dicionário de logos
+PLACEHOLDER_LOGO = 'https://placehold.co/20x20/cccccc/333333?text=?'
+
+# Opção de ranking que usa as tabelas de forma em vez do cubo de classificação
+FORM_OPTION = 'Tabela de Forma (Últimos Jogos)'
+
+
+def create_ranking_dataframe(cube, form_table, round_number, local_filter=None, ranking_option=None, form_window=None):
+    """
+    Cria o DataFrame de ranking da rodada a partir do cubo de classificação ou, na tabela
+    de forma, das janelas pré-calculadas (consulta + ordenação, sem reagregar as partidas).
+    """
+    if ranking_option == FORM_OPTION:
+        ranking_df = form_table.table(form_window, round_number, local_filter)
+    else:
+        ranking_df = cube.table(round_number, local_filter, ranking_option)
+    ranking_df['AP'] = ranking_df['AP'].round(1) # Arredonda o aproveitamento
+    return ranking_df
+
+
+def add_logo_html(team_name, position, logo_url):
+    """Gera o HTML com o logo, a POSIÇÃO e o nome do time."""
+    return f"""
+    <div style="display: flex; align-items: center; white-space: nowrap;">
+        <span style="font-weight: bold; width: 30px;">{position}</span> 
+        <img src="{logo_url}" style="width: 20px; height: 20px; margin-right: 8px; object-fit: contain;">
+        <span>{team_name}</span>
+    </div>
+    """
+
+
+def ranking_html(ranking_df, team_logos):
+    """Converte a tabela de ranking (já ordenada) na tabela HTML exibida pela página."""
+    # A posição exibida é a ordem das linhas (1-based), independente do índice recebido
+    ranking_df_display = ranking_df.reset_index(drop=True)
+    ranking_df_display['Pos_Time_HTML'] = [
+        add_logo_html(team, position, team_logos.get(team, PLACEHOLDER_LOGO))
+        for position, team in enumerate(ranking_df_display['Time'], start=1)
+    ]
+
+    styled_df = ranking_df_display[RANKING_DISPLAY_COLUMNS].rename(columns=RANKING_COLUMN_NAMES).style.format({
+        'Pos | Time': lambda x: x,
+        'Aprv. (%)': "{:.1f}%",
+        'PPJ': "{:.1f}",
+        'GPJ': "{:.1f}"
+    })
+
+    # Remove o índice lateral (a posição já está na primeira coluna) e fixa o id da tabela
+    # (o Styler sortearia um uuid a cada chamada, e o mesmo ranking geraria HTML diferente)
+    styled_df = styled_df.hide(axis='index').set_uuid('ranking')
+    return styled_df.to_html(escape=False)
+
+
+class RenderCache:
+    """
+    Memoiza o HTML renderizado por chave (ex.: tipo de ranking, local, rodada, janela).
+    `build(*key)` só é chamado na primeira vez que a chave é pedida; o cache é seguro para
+    várias sessões usando a mesma instância.
+    """
+
+    def __init__(self, build):
+        self._build = build
+        self._html = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, *key):
+        html = self._html.get(key)
+        if html is not None:
+            self.hits += 1
+            return html
+        with self._lock:
+            if key not in self._html:
+                self.misses += 1
+                self._html[key] = self._build(*key)
+            return self._html[key]
+
+    def prebuild(self, keys):
+        """Renderiza antecipadamente as chaves informadas (ex.: as combinações padrão)."""
+        for key in keys:
+            self.get(*key)
+
+    def __len__(self):
+        return len(self._html)
+
+
+def ranking_render_cache(cube, form_table, team_logos):
+    """
+    Cache do HTML do ranking por (tipo de ranking, local, rodada, janela da forma).
+    Cada combinação é renderizada uma única vez por versão do dataset; depois disso trocar
+    o selectbox/radio/slider é só uma consulta ao dicionário.
+    """
+    def build(ranking_option, local_filter, round_number, form_window):
+        ranking_df = create_ranking_dataframe(cube, form_table, round_number, local_filter, ranking_option, form_window)
+        return ranking_html(ranking_df, team_logos)
+
+    return RenderCache(build)
@@ -0,0 +1,228 @@
+"""
+Agregados entre temporadas (tabela de todos os tempos, retrospecto de um confronto em
+várias temporadas) a partir de parciais materializadas por temporada.
+
+Para cada partição (temporada, divisão) do histórico ficam guardadas as somas P/J/V/E/D/GM/GC
+por time e por par (time, adversário), separadas em Casa/Fora. Uma consulta de todos os tempos
+só soma essas parciais: custa O(temporadas x times), sem reler nenhum jogo. Quando uma
+temporada muda (arquivo da partição com outro tamanho/data), apenas ela é relida e suas
+parciais são substituídas.
+
+Os agregados ficam em <raiz do histórico>/_agregados (times.parquet, pares.parquet, versoes.json).
+
+Atualizar e consultar: python -m brasileirao.rollups [--confronto TIME_A TIME_B] [--divisao serie-a]
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from brasileirao.metrics import SUM_COLUMNS, metrics_from_local_sums, ranking_table
+from brasileirao.partitions import (DEFAULT_DIVISION, PARTITION_DIR, PARTITION_FILE, available_partitions,
+                                    partition_path, read_fixtures)
+
+ROLLUP_DIR_NAME = '_agregados'
+
+SEASON_KEYS = ['temporada', 'divisao']
+TEAM_KEYS = SEASON_KEYS + ['Local', 'Time']
+# Pares indexados pelo confronto primeiro: o retrospecto de A x B é uma fatia contígua
+PAIR_KEYS = ['Time', 'Adversario'] + SEASON_KEYS + ['Local']
+
+# Colunas lidas de cada partição para montar as parciais
+FIXTURE_COLUMNS = ['Mandante', 'Visitante', 'Gols_Mandante', 'Gols_Visitante']
+
+
+def partition_version(path):
+    """Versão do arquivo da partição (tamanho + data de modificação): muda quando a temporada é regravada."""
+    stat = os.stat(path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def season_pair_partials(fixtures):
+    """Somas P/J/V/E/D/GM/GC por (Local, Time, Adversario) dos jogos de uma temporada."""
+    home_goals = fixtures['Gols_Mandante'].to_numpy(dtype=np.int64)
+    away_goals = fixtures['Gols_Visitante'].to_numpy(dtype=np.int64)
+
+    def side(local, team, opponent, goals_for, goals_against):
+        return pd.DataFrame({
+            'Local': local,
+            'Time': np.asarray(fixtures[team], dtype=object),
+            'Adversario': np.asarray(fixtures[opponent], dtype=object),
+            'J': 1,
+            'V': (goals_for > goals_against).astype(np.int64),
+            'E': (goals_for == goals_against).astype(np.int64),
+            'D': (goals_for < goals_against).astype(np.int64),
+            'GM': goals_for,
+            'GC': goals_against,
+        })
+
+    parts = pd.concat([
+        side('C', 'Mandante', 'Visitante', home_goals, away_goals),
+        side('F', 'Visitante', 'Mandante', away_goals, home_goals),
+    ], ignore_index=True)
+    parts['P'] = 3 * parts['V'] + parts['E']
+    return parts.groupby(['Local', 'Time', 'Adversario'])[SUM_COLUMNS].sum().astype(np.int32)
+
+
+def _empty(keys):
+    index = pd.MultiIndex.from_arrays([np.array([], dtype=np.int64 if key == 'temporada' else object) for key in keys],
+                                      names=keys)
+    return pd.DataFrame({column: pd.Series(dtype=np.int32) for column in SUM_COLUMNS}, index=index)
+
+
+class AllTimeRollup:
+    """
+    `teams`: parciais por (temporada, divisao, Local, Time); `pairs`: por (Time, Adversario,
+    temporada, divisao, Local); `versions`: {(temporada, divisao): versão da partição lida}.
+    """
+
+    def __init__(self, teams=None, pairs=None, versions=None):
+        self.teams = teams if teams is not None else _empty(TEAM_KEYS)
+        self.pairs = pairs if pairs is not None else _empty(PAIR_KEYS)
+        self.versions = versions or {}
+
+    # --- Manutenção incremental ---
+
+    def remove_season(self, temporada, divisao=DEFAULT_DIVISION):
+        """Descarta as parciais de uma temporada (O(parciais), sem ler jogos)."""
+        keep_teams = ~((self.teams.index.get_level_values('temporada') == temporada)
+                       & (self.teams.index.get_level_values('divisao') == divisao))
+        keep_pairs = ~((self.pairs.index.get_level_values('temporada') == temporada)
+                       & (self.pairs.index.get_level_values('divisao') == divisao))
+        self.teams = self.teams[keep_teams]
+        self.pairs = self.pairs[keep_pairs]
+        self.versions.pop((temporada, divisao), None)
+
+    def update_season(self, temporada, divisao, fixtures, version=None):
+        """Substitui as parciais de uma temporada pelas dos jogos `fixtures` (só ela é relida)."""
+        self.remove_season(temporada, divisao)
+        pairs = season_pair_partials(fixtures)
+        teams = pairs.groupby(level=['Local', 'Time']).sum()
+
+        def with_season(partials, keys):
+            partials = partials.reset_index().assign(temporada=temporada, divisao=divisao)
+            return partials.set_index(keys)[SUM_COLUMNS]
+
+        self.teams = pd.concat([self.teams, with_season(teams, TEAM_KEYS)]).sort_index()
+        self.pairs = pd.concat([self.pairs, with_season(pairs, PAIR_KEYS)]).sort_index()
+        self.versions[(temporada, divisao)] = version
+
+    def refresh(self, root=None):
+        """
+        Sincroniza com o histórico particionado: relê só as temporadas novas ou regravadas e
+        descarta as removidas. Retorna a lista de (temporada, divisao) que mudaram.
+        """
+        root = root or PARTITION_DIR
+        current = {
+            (temporada, divisao): partition_version(os.path.join(partition_path(temporada, divisao, root), PARTITION_FILE))
+            for temporada, divisao in available_partitions(root)
+        }
+        updated = [key for key in self.versions if key not in current]
+        for key in updated:
+            self.remove_season(*key)
+
+        for (temporada, divisao), version in current.items():
+            if self.versions.get((temporada, divisao)) != version:
+                fixtures = read_fixtures(root, [temporada], [divisao], columns=FIXTURE_COLUMNS)
+                self.update_season(temporada, divisao, fixtures, version)
+                updated.append((temporada, divisao))
+        return updated
+
+    # --- Consultas (somas das parciais) ---
+
+    def seasons(self, divisao=DEFAULT_DIVISION):
+        return sorted(temporada for temporada, division in self.versions if division == divisao)
+
+    def _select(self, partials, divisao, temporadas):
+        mask = partials.index.get_level_values('divisao') == divisao
+        if temporadas is not None:
+            mask &= partials.index.get_level_values('temporada').isin(list(temporadas))
+        return partials[mask]
+
+    def metrics_table(self, divisao=DEFAULT_DIVISION, temporadas=None):
+        """
+        Métricas de todos os tempos (ou das `temporadas`) no formato de
+        calculate_all_team_metrics: índice (Local, Time), pronto para ranking_table.
+        """
+        teams = self._select(self.teams, divisao, temporadas)
+        by_local = teams.groupby(level=['Local', 'Time']).sum()
+        all_teams = np.sort(by_local.index.get_level_values('Time').unique())
+        return metrics_from_local_sums(by_local, all_teams)
+
+    def all_time_table(self, divisao=DEFAULT_DIVISION, temporadas=None, local_filter=None, ranking_option=None):
+        """Tabela de todos os tempos ordenada como a classificação (índice 'Pos')."""
+        return ranking_table(self.metrics_table(divisao, temporadas), local_filter, ranking_option)
+
+    def head_to_head(self, team_a, team_b, divisao=DEFAULT_DIVISION, temporadas=None):
+        """
+        Retrospecto de team_a contra team_b somado nas temporadas (índice (Local, Time) com
+        uma linha por Local, como o metrics_table; use metrics.team_metrics para ler).
+        """
+        try:
+            pair = self.pairs.loc[(team_a, team_b)] # índice ordenado: busca binária
+        except KeyError:
+            pair = _empty(SEASON_KEYS + ['Local'])
+        pair = self._select(pair, divisao, temporadas)
+        by_local = pair.groupby(level='Local').sum()
+        by_local.index = pd.MultiIndex.from_arrays([by_local.index, [team_a] * len(by_local)], names=['Local', 'Time'])
+        return metrics_from_local_sums(by_local, [team_a])
+
+    # --- Persistência ---
+
+    def save(self, directory):
+        """Grava as parciais e as versões lidas (arquivos temporários + rename)."""
+        os.makedirs(directory, exist_ok=True)
+        for name, partials in (('times', self.teams), ('pares', self.pairs)):
+            path = os.path.join(directory, f'{name}.parquet')
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            partials.reset_index().to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        path = os.path.join(directory, 'versoes.json')
+        with open(f"{path}.{os.getpid()}.tmp", 'w', encoding='utf-8') as f:
+            json.dump([[temporada, divisao, version] for (temporada, divisao), version in self.versions.items()], f)
+        os.replace(f"{path}.{os.getpid()}.tmp", path)
+
+    @classmethod
+    def load(cls, directory):
+        """Parciais gravadas por `save` (agregado vazio se não houver ou estiverem ilegíveis)."""
+        try:
+            teams = pd.read_parquet(os.path.join(directory, 'times.parquet')).set_index(TEAM_KEYS)
+            pairs = pd.read_parquet(os.path.join(directory, 'pares.parquet')).set_index(PAIR_KEYS)
+            with open(os.path.join(directory, 'versoes.json'), encoding='utf-8') as f:
+                versions = {(temporada, divisao): version for temporada, divisao, version in json.load(f)}
+        except (OSError, ValueError, KeyError):
+            return cls()
+        return cls(teams.sort_index(), pairs.sort_index(), versions)
+
+
+def rollup_dir(root=None):
+    return os.path.join(root or PARTITION_DIR, ROLLUP_DIR_NAME)
+
+
+def load_rollup(root=None):
+    """Agregados do histórico, atualizados incrementalmente (e regravados se algo mudou)."""
+    rollup = AllTimeRollup.load(rollup_dir(root))
+    if rollup.refresh(root):
+        try:
+            rollup.save(rollup_dir(root))
+        except OSError:
+            pass # Sem permissão de escrita: os agregados valem só para este processo
+    return rollup
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Atualiza e consulta os agregados de todos os tempos.")
+    parser.add_argument('--raiz', default=PARTITION_DIR, help='raiz do histórico particionado')
+    parser.add_argument('--divisao', default=DEFAULT_DIVISION)
+    parser.add_argument('--confronto', nargs=2, metavar=('TIME_A', 'TIME_B'))
+    args = parser.parse_args()
+
+    rollup = load_rollup(args.raiz)
+    seasons = rollup.seasons(args.divisao)
+    print(f"{len(seasons)} temporada(s) em {args.divisao}: {', '.join(map(str, seasons))}")
+    if args.confronto:
+        print(rollup.head_to_head(*args.confronto, divisao=args.divisao).to_string())
+    else:
+        print(rollup.all_time_table(args.divisao).head(20).to_string())
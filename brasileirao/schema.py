@@ -0,0 +1,101 @@
+"""
+Esquema canônico e compacto do dataset de partidas, aplicado na carga.
+
+Times, Local e Resultado viram categorias (códigos inteiros); gols, rodadas e acumulados
+viram inteiros pequenos. Os códigos de Time1/Time2 compartilham a mesma tabela de times
+(ordem alfabética), então filtrar por time é uma comparação de inteiros.
+"""
+import numpy as np
+import pandas as pd
+
+# Colunas de times (mesma tabela de IDs)
+TEAM_COLUMNS = ['Time1', 'Time2']
+
+# Categorias fixas
+CATEGORY_VALUES = {
+    'Local': ['C', 'F'],
+    'Resultado': ['V', 'E', 'D'],
+}
+
+# Tipo inteiro de cada coluna numérica
+INTEGER_DTYPES = {
+    'Time_Foco_ID': np.int32,
+    'Ordem_Jogo': np.int16,
+    'Gols1': np.int8,
+    'Gols2': np.int8,
+    'Pontos_Acumulados': np.int16,
+    'Vitorias_Acumuladas': np.int16,
+    'Saldo_Gols_Acumulado': np.int16,
+    'Posicao_Jogo': np.int8,
+}
+
+# Colunas descartadas (índice gravado pelo to_excel do notebook)
+DROPPED_COLUMNS = ['Unnamed: 0']
+
+
+def team_dtype(df):
+    """Tipo categórico com todos os times de Time1/Time2, em ordem alfabética."""
+    names = pd.unique(np.concatenate([np.asarray(df[col], dtype=object) for col in TEAM_COLUMNS if col in df.columns]))
+    return pd.CategoricalDtype(np.sort(names.astype(str)))
+
+
+def _fit_integer(series, dtype):
+    """Converte para o inteiro compacto; se houver nulos ou valores fora da faixa, mantém a coluna."""
+    if series.isna().any():
+        return series
+    values = series.to_numpy()
+    limits = np.iinfo(dtype)
+    if len(values) and (values.min() < limits.min or values.max() > limits.max):
+        return series.astype(np.int64)
+    return series.astype(dtype)
+
+
+def conforms(df):
+    """True se o DataFrame já está no esquema compacto (ex.: lido do snapshot Parquet)."""
+    if any(col in df.columns for col in DROPPED_COLUMNS):
+        return False
+    team_dtypes = [df[col].dtype for col in TEAM_COLUMNS if col in df.columns]
+    if any(not isinstance(dtype, pd.CategoricalDtype) for dtype in team_dtypes):
+        return False
+    if team_dtypes and not (all(dtype == team_dtypes[0] for dtype in team_dtypes)
+                            and team_dtypes[0].categories.is_monotonic_increasing):
+        return False
+    for col in df.columns:
+        if col in CATEGORY_VALUES and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            return False
+        if col in INTEGER_DTYPES and df[col].dtype not in (INTEGER_DTYPES[col], np.int64):
+            return False
+    return True
+
+
+def apply_schema(df):
+    """Retorna o DataFrame no esquema compacto (idempotente: pode ser aplicado de novo)."""
+    if conforms(df):
+        return df
+    df = df.drop(columns=[col for col in DROPPED_COLUMNS if col in df.columns])
+    teams = team_dtype(df)
+
+    columns = {}
+    for col in df.columns:
+        if col in TEAM_COLUMNS:
+            columns[col] = df[col].astype(object).astype(teams)
+        elif col in CATEGORY_VALUES:
+            # Valores inesperados entram como categorias extras em vez de virarem nulos
+            values = df[col].astype(object)
+            extra = sorted(set(values.dropna()) - set(CATEGORY_VALUES[col]))
+            columns[col] = values.astype(pd.CategoricalDtype(CATEGORY_VALUES[col] + extra))
+        elif col in INTEGER_DTYPES:
+            columns[col] = _fit_integer(df[col], INTEGER_DTYPES[col])
+        else:
+            columns[col] = df[col]
+    return pd.DataFrame(columns, index=df.index)
+
+
+def team_table(df):
+    """Tabela de times: Time_ID (código das categorias) -> nome e ID da CBF (Time_Foco_ID)."""
+    teams = df['Time1'].dtype.categories if isinstance(df['Time1'].dtype, pd.CategoricalDtype) else team_dtype(df).categories
+    table = pd.DataFrame({'Time': teams}, index=pd.RangeIndex(len(teams), name='Time_ID'))
+    if 'Time_Foco_ID' in df.columns:
+        cbf_ids = df.drop_duplicates('Time1').set_index('Time1')['Time_Foco_ID']
+        table['Time_Foco_ID'] = table['Time'].map(cbf_ids).astype('Int64')
+    return table
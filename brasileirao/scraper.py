@@ -0,0 +1,288 @@
+"""
+Coleta do histórico de partidas dos times no site da CBF.
+
+As páginas são buscadas em paralelo (pool de threads) sob um limite de taxa (token
+bucket), com novas tentativas, backoff exponencial e prazo por time. O parse de cada
+página roda assim que a resposta chega, enquanto as demais ainda estão em andamento.
+"""
+import random
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+
+from brasileirao.parser import extrair_placares
+
+# A CBF usa a divisão e o ano no link
+TEMPORADA = 2025
+DIVISAO = 'serie-a'
+
+
+def url_tabela(temporada=TEMPORADA, divisao=DIVISAO):
+    """URL da tabela do campeonato de uma temporada/divisão."""
+    return f"https://www.cbf.com.br/futebol-brasileiro/tabelas/campeonato-brasileiro/{divisao}/{temporada}"
+
+
+def url_historico(temporada=TEMPORADA, divisao=DIVISAO):
+    """Base URL do histórico de partidas de uma temporada/divisão. O ID será inserido em {id_time}."""
+    return (f"https://www.cbf.com.br/futebol-brasileiro/times/campeonato-brasileiro/{divisao}/{temporada}"
+            "/{id_time}?tab=historico-de-partidas")
+
+
+URL_CBF = url_tabela()
+# Base URL da CBF para histórico de partidas. O ID será inserido aqui.
+BASE_URL_HISTORICO = url_historico()
+
+# Status HTTP que valem uma nova tentativa (limite de taxa e erros temporários do servidor)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# Colunas do DataFrame de histórico de cada time
+COLUNAS_FINAIS = [
+    'Time_Foco_ID', 'Time_Foco_Nome', 'Ordem_Jogo', 'Local',
+    'Time1', 'Gols1', 'Gols2', 'Time2', 'Resultado',
+    'Pontos_Obtidos', 'Saldo_Gols',
+    'Pontos_Acumulados', 'Saldo_Gols_Acumulado', 'Vitorias_Acumuladas'
+]
+
+# Desativar avisos de requisição não verificada para a URL da CBF
+warnings.filterwarnings('ignore', message='Unverified HTTPS request')
+
+
+class TokenBucket:
+    """Limite de taxa compartilhado entre threads: `rate` requisições/s com rajada de `capacity`."""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Reserva um token, esperando (fora do lock) o tempo necessário para ele existir."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+_thread_local = threading.local()
+
+
+def _session():
+    """Uma requests.Session por thread (reaproveita conexões sem compartilhar estado)."""
+    if not hasattr(_thread_local, 'session'):
+        _thread_local.session = requests.Session()
+    return _thread_local.session
+
+
+def fetch_url(url, bucket=None, timeout=10, retries=3, backoff=2.0, team_timeout=None, session=None,
+              cache=None):
+    """
+    Faz o GET respeitando o limite de taxa, com novas tentativas (backoff exponencial com
+    jitter) para erros de rede e RETRY_STATUS. `team_timeout` limita o tempo total gasto
+    com a URL, contado a partir da primeira requisição.
+
+    Com um `cache` (HTTPCache), a requisição é condicional e o retorno é uma CachedPage
+    (em um 304, o corpo é a cópia lida junto com os cabeçalhos condicionais).
+    """
+    session = session or _session()
+    headers, snapshot = cache.conditional_request(url) if cache is not None else (None, None)
+    deadline = None
+
+    for attempt in range(retries + 1):
+        if bucket is not None:
+            bucket.acquire()
+        if deadline is None and team_timeout is not None:
+            deadline = time.monotonic() + team_timeout
+
+        request_timeout = timeout
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise requests.Timeout(f"Prazo de {team_timeout}s esgotado para {url}")
+            request_timeout = min(timeout, remaining)
+
+        try:
+            response = session.get(url, verify=False, timeout=request_timeout, headers=headers)
+            if response.status_code in RETRY_STATUS:
+                raise requests.HTTPError(f"{response.status_code} para {url}", response=response)
+            response.raise_for_status()  # Lança exceção para os demais códigos de erro (4xx)
+            if cache is None:
+                return response
+            page = cache.store_response(url, response, snapshot)
+            if page is None:
+                # 304 sem cópia local: não há corpo a devolver (e um corpo vazio sumiria com o time)
+                raise requests.HTTPError(f"304 sem cópia em cache para {url}", response=response)
+            return page
+        except requests.RequestException as e:
+            status = e.response.status_code if e.response is not None else None
+            if attempt == retries or (status is not None and status not in RETRY_STATUS):
+                raise
+
+            # Respeita o Retry-After do servidor quando houver; senão, backoff exponencial
+            retry_after = e.response.headers.get('Retry-After') if e.response is not None else None
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else backoff * (2 ** attempt)
+            delay += random.uniform(0, backoff)
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+
+def extrair_dicionario_times(html):
+    """Extrai o dicionário {id_do_time: nome_do_time} da página da tabela do campeonato."""
+    soup = BeautifulSoup(html, 'html.parser')
+    dicionario_times = {}
+
+    # O link do time está na tag <a> dentro de uma célula <td>
+    links_times = soup.find_all('a', href=lambda href: href and '/futebol-brasileiro/times/' in href)
+
+    for link in links_times:
+        # O nome está na tag <strong> que é filha direta da tag <a>
+        nome_tag = link.find('strong')
+        if not nome_tag:
+            continue
+        nome_do_time = nome_tag.get_text(strip=True)
+
+        # O ID é o último elemento numérico do 'href' (ex: ".../20002"), evitando o ano
+        id_do_time = None
+        for parte in reversed(link.get('href').split('/')):
+            if parte.isdigit():
+                id_do_time = int(parte)
+                break
+
+        if id_do_time and nome_do_time:
+            dicionario_times[id_do_time] = nome_do_time
+
+    return dicionario_times
+
+
+def buscar_dicionario_times(url=URL_CBF, cache=None, **fetch_kwargs):
+    """Busca a tabela do campeonato e retorna o dicionário {id: nome} dos times."""
+    page = fetch_url(url, cache=cache, **fetch_kwargs)
+    if cache is not None:
+        return cache.parse(page, extrair_dicionario_times, suffix='times')
+    return extrair_dicionario_times(page.content)
+
+
+def montar_historico_time(dados_placares, id_time, nome_time):
+    """Transforma os placares extraídos no DataFrame padronizado do time em foco."""
+    df_partidas = pd.DataFrame(dados_placares)
+
+    total_jogos = len(df_partidas)
+    # Garante que a ordem seja do mais antigo (1) para o mais recente (total_jogos)
+    df_partidas['Ordem_Jogo'] = np.arange(total_jogos, 0, -1)
+
+    NOME_TIME_FOCO = nome_time
+
+    # --- Renomeando e Padronizando ---
+    df_partidas['Time_Foco_ID'] = id_time  # Adiciona o ID do time processado
+    df_partidas['Time_Foco_Nome'] = NOME_TIME_FOCO
+
+    em_casa = df_partidas['Time_Casa'] == NOME_TIME_FOCO
+
+    # Time1 (Time Foco), Time2 (Adversário)
+    df_partidas['Time1'] = np.where(em_casa, df_partidas['Time_Casa'], df_partidas['Time_Fora'])
+    df_partidas['Time2'] = np.where(em_casa, df_partidas['Time_Fora'], df_partidas['Time_Casa'])
+
+    # Gols1 (Time Foco), Gols2 (Adversário)
+    df_partidas['Gols1'] = np.where(em_casa, df_partidas['Placar_Casa'], df_partidas['Placar_Fora'])
+    df_partidas['Gols2'] = np.where(em_casa, df_partidas['Placar_Fora'], df_partidas['Placar_Casa'])
+
+    # Local
+    df_partidas['Local'] = np.where(em_casa, 'C', 'F')
+
+    # Pontos, Saldo e Acumulados
+    condicoes = [(df_partidas['Gols1'] > df_partidas['Gols2']), (df_partidas['Gols1'] == df_partidas['Gols2'])]
+
+    df_partidas['Pontos_Obtidos'] = np.select(condicoes, [3, 1], default=0)
+    df_partidas['Resultado'] = np.select(condicoes, ['V', 'E'], default='D')
+
+    df_partidas['Saldo_Gols'] = df_partidas['Gols1'] - df_partidas['Gols2']
+    df_partidas['Vitoria_Obtida'] = np.where(df_partidas['Resultado'] == 'V', 1, 0)
+
+    # Ordena pelo mais antigo para calcular Acumulados
+    df_partidas.sort_values(by='Ordem_Jogo', ascending=True, inplace=True)
+    df_partidas['Pontos_Acumulados'] = df_partidas['Pontos_Obtidos'].cumsum()
+    df_partidas['Saldo_Gols_Acumulado'] = df_partidas['Saldo_Gols'].cumsum()
+    df_partidas['Vitorias_Acumuladas'] = df_partidas['Vitoria_Obtida'].cumsum()
+
+    return df_partidas[COLUNAS_FINAIS]
+
+
+def processar_pagina_time(html, id_time, nome_time):
+    """Extrai e transforma a página de histórico de um time. Retorna None se não houver placares."""
+    dados_placares = extrair_placares(html)
+    if not dados_placares:
+        print(f"Nenhum dado de placar encontrado para {nome_time}.")
+        return None
+    return montar_historico_time(dados_placares, id_time, nome_time)
+
+
+def processar_resposta_time(response, id_time, nome_time, cache=None):
+    """Processa a resposta de um time; com cache, o parse é reutilizado quando o conteúdo não mudou."""
+    if cache is None:
+        return processar_pagina_time(response.content, id_time, nome_time)
+    return cache.parse(response, lambda html: processar_pagina_time(html, id_time, nome_time), suffix=str(id_time))
+
+
+def processar_historico_time(id_time, nome_time, base_url=BASE_URL_HISTORICO, cache=None, **fetch_kwargs):
+    """
+    Busca, extrai e transforma o histórico de partidas de um time específico.
+    Retorna um DataFrame processado (ou None em caso de erro).
+    """
+    print(f"Buscando e processando histórico para: {nome_time} (ID: {id_time})...")
+    try:
+        response = fetch_url(base_url.format(id_time=id_time), cache=cache, **fetch_kwargs)
+    except requests.exceptions.RequestException as e:
+        print(f"Erro ao acessar {nome_time} ({id_time}): {e}")
+        return None
+    return processar_resposta_time(response, id_time, nome_time, cache)
+
+
+def buscar_historicos(dicionario_times, base_url=BASE_URL_HISTORICO, max_workers=4,
+                      requests_per_second=1.0, burst=1, timeout=10, retries=3,
+                      backoff=2.0, team_timeout=60, cache=None):
+    """
+    Busca o histórico de todos os times do dicionário {id: nome} com até `max_workers`
+    requisições em andamento, limitadas a `requests_per_second`. Cada página é processada
+    assim que chega (ou o parse é reutilizado do `cache`, se o conteúdo não mudou).
+    Retorna a lista de DataFrames na ordem do dicionário (times com erro ou sem placares
+    ficam de fora).
+    """
+    bucket = TokenBucket(requests_per_second, burst)
+    resultados = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(
+                fetch_url, base_url.format(id_time=id_time), bucket=bucket, timeout=timeout,
+                retries=retries, backoff=backoff, team_timeout=team_timeout, cache=cache
+            ): (id_time, nome_time)
+            for id_time, nome_time in dicionario_times.items()
+        }
+
+        # Parse em pipeline: processa cada resposta enquanto as outras seguem em andamento
+        for future in as_completed(futures):
+            id_time, nome_time = futures[future]
+            try:
+                response = future.result()
+            except requests.exceptions.RequestException as e:
+                print(f"Erro ao acessar {nome_time} ({id_time}): {e}")
+                continue
+
+            print(f"Processando histórico para: {nome_time} (ID: {id_time})...")
+            df_time = processar_resposta_time(response, id_time, nome_time, cache)
+            if df_time is not None:
+                resultados[id_time] = df_time
+
+    return [resultados[id_time] for id_time in dicionario_times if id_time in resultados]
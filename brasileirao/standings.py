@@ -0,0 +1,101 @@
+"""
+Cubo de classificação: somas acumuladas (prefix-sum) de cada time a cada rodada,
+separadas por Casa/Fora. A tabela de qualquer rodada vira uma consulta O(times) + ordenação.
+"""
+import numpy as np
+import pandas as pd
+
+from brasileirao.cube import CUBE_FIELDS, LOCAL_AXIS, cube_totals, load_cube, save_cube, standings_columns
+from brasileirao.dataset import read_only
+from brasileirao.metrics import LOCAL_KEYS, METRIC_COLUMNS, sort_ranking, team_games
+from brasileirao.ranking import TIEBREAK_PRESETS, rank_grid
+
+
+class StandingsCube:
+    """
+    Acumulados por (rodada, time, local). `values[r, t, l, k]` é o total do campo
+    CUBE_FIELDS[k] do time t, no local l, considerando os jogos com Ordem_Jogo <= r.
+    A rodada 0 representa o início do campeonato (tudo zerado).
+    """
+
+    def __init__(self, teams, values):
+        self.teams = teams
+        self.values = read_only(values)
+        self.max_round = values.shape[0] - 1
+
+    @classmethod
+    def from_matches(cls, df, all_teams=None):
+        """Constrói o cubo a partir do DataFrame de partidas (uma linha por time/jogo)."""
+        games = team_games(df)
+
+        if all_teams is None:
+            all_teams = np.sort(pd.unique(df[['Time1', 'Time2']].values.ravel('K')))
+        teams = np.asarray(all_teams)
+
+        # 1. Índices de cada jogo no cubo
+        round_idx = games['Ordem_Jogo'].to_numpy(dtype=np.int64)
+        team_idx = pd.Index(teams).get_indexer(games['Time1'])
+        local_idx = (games['Local'].to_numpy() == 'F').astype(np.int64)
+
+        resultado = games['Resultado'].to_numpy()
+        deltas = np.column_stack([
+            resultado == 'V',
+            resultado == 'E',
+            resultado == 'D',
+            games['Gols1'].to_numpy(),
+            games['Gols2'].to_numpy(),
+        ]).astype(np.int64)
+
+        # 2. Espalha os jogos por rodada e acumula (prefix-sum no eixo das rodadas)
+        max_round = int(round_idx.max()) if len(round_idx) else 0
+        values = np.zeros((max_round + 1, len(teams), 2, len(CUBE_FIELDS)), dtype=np.int64)
+        np.add.at(values, (round_idx, team_idx, local_idx), deltas)
+        np.cumsum(values, axis=0, out=values)
+
+        return cls(teams, values)
+
+    @classmethod
+    def load(cls, path):
+        """Cubo gravado por `save` (snapshot .npz, brasileirao.cube)."""
+        teams, values = load_cube(path)
+        return cls(teams.astype(object), values)
+
+    def save(self, path):
+        save_cube(path, self.teams, self.values)
+
+    def totals(self, round_number=None, local_filter=None):
+        """Acumulados (times x CUBE_FIELDS) até a rodada informada (padrão: última)."""
+        return cube_totals(self.values, round_number, local_filter)
+
+    def positions(self, local_filter=None, tiebreak='completo'):
+        """
+        Posições de todos os times em todas as rodadas (rodadas+1 x times), calculadas de
+        uma vez com um único lexsort. Empates completos seguem a ordem alfabética dos times.
+        """
+        keys = TIEBREAK_PRESETS[tiebreak] if isinstance(tiebreak, str) else list(tiebreak)
+        totals = self.values.sum(axis=2) if local_filter is None else self.values[:, :, LOCAL_AXIS[local_filter]]
+        fields = {name: totals[..., k] for k, name in enumerate(CUBE_FIELDS)}
+        grid = {
+            'P': fields['V'] * 3 + fields['E'],
+            'J': fields['V'] + fields['E'] + fields['D'],
+            'SG': fields['GM'] - fields['GC'],
+            **fields,
+        }
+        return rank_grid(grid, keys)
+
+    def metrics(self, round_number=None, local_filter=None):
+        """Métricas completas (P/J/V/E/D/GM/GC/SG/AP/GPJ/PPJ) de todos os times na rodada."""
+        return pd.DataFrame(standings_columns(self.values, round_number, local_filter),
+                            index=pd.Index(self.teams, name='Time'))
+
+    def table(self, round_number=None, local_filter=None, ranking_option=None):
+        """Tabela de classificação 'como estava' na rodada, com filtro de Local e tipo de ranking."""
+        ranking_df = self.metrics(round_number, local_filter).reset_index()
+        return sort_ranking(ranking_df[METRIC_COLUMNS + ['Time']], ranking_option)
+
+    def metrics_table(self, round_number=None):
+        """Tabela de métricas indexada por (Local, Time), no formato de calculate_all_team_metrics."""
+        return pd.concat(
+            {LOCAL_KEYS[local]: self.metrics(round_number, local) for local in (None, 'C', 'F')},
+            names=['Local']
+        )
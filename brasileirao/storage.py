@@ -0,0 +1,99 @@
+"""
+Leitura do dataset de partidas com snapshot colunar (Parquet) na frente do df.xlsx.
+
+pandas e o leitor de Excel só são importados quando o arquivo é lido: o hash e os caminhos
+dos snapshots servem também à CLI, que responde a partir do snapshot do cubo sem pandas.
+"""
+import hashlib
+import os
+import re
+
+# Diretório padrão dos snapshots (fica na raiz do projeto, fora do controle de versão)
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache')
+
+
+def file_hash(file_path, chunk_size=1 << 20):
+    """Retorna o SHA-256 do conteúdo do arquivo. Funciona como a 'versão' do dataset."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_excel_typed(file_path):
+    """Lê o Excel pelo caminho antigo (openpyxl) e aplica as conversões de tipo das páginas."""
+    import pandas as pd
+
+    df = pd.read_excel(file_path)
+    # Conversão de tipos importantes
+    df['Ordem_Jogo'] = df['Ordem_Jogo'].astype(int)
+    df['Posicao_Jogo'] = df['Posicao_Jogo'].astype(int)
+    return df
+
+
+def snapshot_path(file_path, content_hash, snapshot_dir=None, suffix='.fixtures.parquet'):
+    """Monta o caminho do snapshot (Parquet, por padrão) para um arquivo e um hash de conteúdo."""
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(snapshot_dir or SNAPSHOT_DIR, f"{stem}-{content_hash[:16]}{suffix}")
+
+
+def remove_stale_snapshots(current_path, suffix='.fixtures.parquet'):
+    """Apaga snapshots antigos do mesmo arquivo (hashes que não valem mais)."""
+    directory = os.path.dirname(current_path)
+    stem = os.path.basename(current_path)[:-len(suffix)].rsplit('-', 1)[0]
+    # Só `<stem>-<hash>{suffix}`: outra fonte cujo nome começa com o mesmo stem não é tocada
+    pattern = re.compile(rf"^{re.escape(stem)}-[0-9a-f]{{16}}{re.escape(suffix)}$")
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if pattern.match(name) and path != current_path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def write_snapshot(df, path):
+    """Grava o snapshot de forma atômica (arquivo temporário + rename)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    remove_stale_snapshots(path)
+
+
+def load_fixtures(file_path, snapshot_dir=None):
+    """
+    Carrega a tabela canônica de partidas (uma linha por jogo, brasileirao.fixtures). O Excel
+    só é lido novamente quando o conteúdo do arquivo muda; nas demais cargas o snapshot
+    Parquet (chaveado pelo hash) é usado. Levanta ValueError se as duas perspectivas de
+    algum jogo no Excel não baterem.
+    """
+    import pandas as pd
+
+    from brasileirao.fixtures import fixtures_from_perspective
+    from brasileirao.schema import apply_schema
+
+    content_hash = file_hash(file_path)
+    path = snapshot_path(file_path, content_hash, snapshot_dir)
+
+    if os.path.exists(path):
+        try:
+            return pd.read_parquet(path)
+        except Exception:
+            pass  # Snapshot corrompido ou ilegível: refaz a partir do Excel
+
+    fixtures = fixtures_from_perspective(apply_schema(read_excel_typed(file_path)))
+    try:
+        write_snapshot(fixtures, path)
+    except (OSError, ImportError):
+        # Sem permissão de escrita ou sem pyarrow: segue apenas com o Excel
+        pass
+    return fixtures
+
+
+def load_matches(file_path, snapshot_dir=None):
+    """Carrega o dataset de partidas na visão por time (formato do df.xlsx, esquema compacto)."""
+    from brasileirao.fixtures import team_perspective
+
+    return team_perspective(load_fixtures(file_path, snapshot_dir))
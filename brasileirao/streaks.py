@@ -0,0 +1,146 @@
+"""
+Índice de sequências (streaks) de todos os times, calculado uma vez por versão do dataset
+com run-length encoding em NumPy. Consultas por (time, tipo, local) são O(1).
+"""
+import numpy as np
+import pandas as pd
+
+from brasileirao.dataset import read_only
+from brasileirao.metrics import team_games
+
+# Tipos de sequência: nome exibido e resultados que a mantêm
+STREAK_TYPES = {
+    'V': ('Vitórias', ('V',)),
+    'E': ('Empates', ('E',)),
+    'D': ('Derrotas', ('D',)),
+    'invicto': ('Invicto', ('V', 'E')),
+    'sem_vencer': ('Sem Vencer', ('E', 'D')),
+}
+
+# Escopos do índice (Geral, Casa, Fora), na ordem do eixo
+SCOPES = (None, 'C', 'F')
+
+# Campos de cada registro: tamanho, rodada inicial e rodada final
+STREAK_FIELDS = ['Jogos', 'Inicio', 'Fim']
+
+
+def _run_lengths(team_idx, condition):
+    """
+    Run-length encoding das sequências em que `condition` é verdadeira, sem atravessar
+    a troca de time. Retorna (time, posição inicial, tamanho) de cada sequência.
+    """
+    n = len(condition)
+    new_team = np.ones(n, dtype=bool)
+    new_team[1:] = team_idx[1:] != team_idx[:-1]
+
+    # Uma sequência começa onde a condição liga ou onde começa outro time
+    previous = np.zeros(n, dtype=bool)
+    previous[1:] = condition[:-1]
+    starts = np.flatnonzero(condition & (~previous | new_team))
+
+    # Termina antes da próxima posição falsa ou da troca de time
+    breaks = np.flatnonzero(~condition | new_team)
+    next_break = np.searchsorted(breaks, starts, side='right')
+    ends = np.append(breaks, n)[next_break]
+    return team_idx[starts], starts, ends - starts
+
+
+class StreakIndex:
+    """
+    `longest_values[t, s, k]` e `current_values[t, s, k]` guardam (Jogos, Inicio, Fim) da
+    maior sequência e da sequência atual do time t, no escopo SCOPES[s] e tipo k
+    (ordem de STREAK_TYPES). Sem sequência: (0, 0, 0). Empates de tamanho ficam com a
+    sequência mais antiga.
+    """
+
+    def __init__(self, teams, longest_values, current_values):
+        self.teams = teams
+        self.longest_values = read_only(longest_values)
+        self.current_values = read_only(current_values)
+        self._team_pos = {team: i for i, team in enumerate(teams)}
+        self._kind_pos = {kind: k for k, kind in enumerate(STREAK_TYPES)}
+
+    @classmethod
+    def from_matches(cls, df, all_teams=None):
+        """Constrói o índice a partir do DataFrame de partidas (uma linha por time/jogo)."""
+        games = team_games(df)
+
+        if all_teams is None:
+            all_teams = np.sort(pd.unique(df[['Time1', 'Time2']].values.ravel('K')))
+        teams = np.asarray(all_teams)
+
+        # 1. Jogos ordenados por (time, rodada)
+        team_idx = pd.Index(teams).get_indexer(games['Time1'])
+        rounds = games['Ordem_Jogo'].to_numpy(dtype=np.int64)
+        order = np.lexsort((rounds, team_idx))
+        team_idx, rounds = team_idx[order], rounds[order]
+        resultado = games['Resultado'].to_numpy()[order]
+        local = games['Local'].to_numpy()[order]
+
+        shape = (len(teams), len(SCOPES), len(STREAK_TYPES), len(STREAK_FIELDS))
+        longest = np.zeros(shape, dtype=np.int64)
+        current = np.zeros(shape, dtype=np.int64)
+
+        for s, scope in enumerate(SCOPES):
+            in_scope = np.ones(len(rounds), dtype=bool) if scope is None else local == scope
+            scope_teams, scope_rounds = team_idx[in_scope], rounds[in_scope]
+            if not len(scope_teams):
+                continue
+
+            # Último jogo de cada time no escopo (para a sequência atual)
+            last = np.flatnonzero(np.append(scope_teams[1:] != scope_teams[:-1], True))
+
+            for k, (_, results) in enumerate(STREAK_TYPES.values()):
+                condition = np.isin(resultado[in_scope], results)
+                run_team, run_start, run_size = _run_lengths(scope_teams, condition)
+                if not len(run_team):
+                    continue
+                run_values = np.column_stack([
+                    run_size, scope_rounds[run_start], scope_rounds[run_start + run_size - 1]
+                ])
+
+                # 2. Maior sequência: ordena por (time, -tamanho, início) e fica com a primeira
+                best = np.lexsort((run_start, -run_size, run_team))
+                first = best[np.append(True, run_team[best][1:] != run_team[best][:-1])]
+                longest[run_team[first], s, k] = run_values[first]
+
+                # 3. Sequência atual: a última sequência do time, se terminar no último jogo
+                tail = np.flatnonzero(np.append(run_team[1:] != run_team[:-1], True))
+                ends_last = np.isin(run_start[tail] + run_size[tail] - 1, last)
+                current[run_team[tail[ends_last]], s, k] = run_values[tail[ends_last]]
+
+        return cls(teams, longest, current)
+
+    def _lookup(self, values, team, kind, local_filter):
+        if team not in self._team_pos:
+            return 0, None, None
+        size, start, end = values[self._team_pos[team], SCOPES.index(local_filter), self._kind_pos[kind]]
+        if size == 0:
+            return 0, None, None
+        return int(size), int(start), int(end)
+
+    def longest(self, team, kind, local_filter=None):
+        """(tamanho, rodada inicial, rodada final) da maior sequência; (0, None, None) se não houver."""
+        return self._lookup(self.longest_values, team, kind, local_filter)
+
+    def current(self, team, kind, local_filter=None):
+        """(tamanho, rodada inicial, rodada final) da sequência em andamento; (0, None, None) se não houver."""
+        return self._lookup(self.current_values, team, kind, local_filter)
+
+    def leaderboard(self, kind, local_filter=None, current=False, top=None):
+        """
+        Maiores sequências da liga para um tipo: uma linha por time (Time, Jogos, Inicio, Fim),
+        da maior para a menor, desempatando pela sequência mais antiga e pelo nome do time.
+        """
+        values = (self.current_values if current else self.longest_values)[
+            :, SCOPES.index(local_filter), self._kind_pos[kind]
+        ]
+        board = pd.DataFrame(values, columns=STREAK_FIELDS)
+        board.insert(0, 'Time', self.teams)
+        board = board[board['Jogos'] > 0].sort_values(
+            ['Jogos', 'Inicio', 'Time'], ascending=[False, True, True], kind='mergesort'
+        )
+        if top is not None:
+            board = board.head(top)
+        board.index = pd.RangeIndex(1, len(board) + 1, name='Pos')
+        return board
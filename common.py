@@ -0,0 +1,167 @@
+"""
+Funções compartilhadas entre as páginas do Streamlit.
+
+O dataset e as estruturas derivadas dele são somente leitura e ficam em st.cache_resource:
+uma única cópia por processo, compartilhada por todas as sessões e reruns (st.cache_data
+devolveria uma cópia desserializada a cada chamada). Os cálculos ficam no motor sem
+Streamlit (brasileirao.engine): os loaders daqui só guardam o motor de cada fonte e
+expõem as estruturas dele.
+"""
+import os
+
+import pandas as pd
+import streamlit as st
+
+from brasileirao.dataset import MatchDataset
+from brasileirao.engine import LeagueEngine, load_source
+from brasileirao.logos import LogoCatalog
+from brasileirao.partitions import DEFAULT_DIVISION, PARTITION_DIR, available_seasons, partition_path
+from brasileirao.profiling import DEFAULT_LOG, MemoryProfiler, RerunTimer, append_record
+from brasileirao.render import ranking_render_cache
+
+FILE_PATH = 'df.xlsx'
+
+# Histórico particionado por temporada/divisão (brasileirao.partitions); sem ele, o df.xlsx
+DATA_DIR = os.environ.get('BRASILEIRAO_DATA_DIR', PARTITION_DIR)
+
+# Log JSON-lines dos tempos por rerun (gravado com o modo debug ou se a variável estiver definida)
+TIMING_LOG = os.environ.get('BRASILEIRAO_TIMING_LOG', DEFAULT_LOG)
+
+# Modo de perfil de memória (BRASILEIRAO_MEMORY=1): atribui pico/retido a cada carga em cache
+memory_profiler = MemoryProfiler().start() if os.environ.get('BRASILEIRAO_MEMORY') == '1' else MemoryProfiler()
+
+
+def select_season():
+    """
+    Fonte de dados da temporada escolhida na barra lateral: a pasta da partição (só ela é
+    lida). Sem histórico particionado, o df.xlsx. A fonte é a chave de todos os caches.
+    """
+    seasons = available_seasons(DATA_DIR, DEFAULT_DIVISION)
+    if not seasons:
+        return FILE_PATH
+    season = st.sidebar.selectbox("Temporada:", seasons[::-1], key='temporada')
+    return partition_path(season, DEFAULT_DIVISION, DATA_DIR)
+
+
+@st.cache_resource
+def load_dataset(file_path):
+    """Carrega os dados da partição da temporada ou do Excel (via snapshot Parquet) com tratamento de erros."""
+    if not os.path.exists(file_path):
+        st.error(f"Erro: O arquivo não foi encontrado no caminho especificado: `{file_path}`. Por favor, verifique o caminho.")
+        # Dataset vazio para evitar que o resto do código quebre.
+        return MatchDataset(pd.DataFrame())
+
+    try:
+        return memory_profiler.measure('load_data', load_source, file_path)
+    except Exception as e:
+        st.error(f"Erro ao carregar ou processar os dados do Excel: {e}. Verifique a estrutura do arquivo.")
+        return MatchDataset(pd.DataFrame())
+
+
+def load_data(file_path):
+    """DataFrame somente leitura do dataset compartilhado (sem cópia por sessão)."""
+    return load_dataset(file_path).frame
+
+
+@st.cache_resource
+def load_engine(file_path):
+    """Motor de consultas (brasileirao.engine) sobre o dataset compartilhado da fonte."""
+    return LeagueEngine(load_dataset(file_path), file_path)
+
+
+@st.cache_resource
+def load_metrics_table(file_path):
+    """Métricas Geral/Casa/Fora de todos os times, calculadas uma vez por versão do dataset."""
+    return load_engine(file_path).metrics_table
+
+
+@st.cache_resource
+def load_positions(file_path):
+    """Colocação atual (Geral) de cada time: {time: posição}, uma vez por versão do dataset."""
+    return load_engine(file_path).positions
+
+
+@st.cache_resource
+def load_standings_cube(file_path):
+    """Constrói (uma vez por versão do dataset) o cubo de classificação por rodada."""
+    return memory_profiler.measure('ranking: cubo', lambda: load_engine(file_path).cube)
+
+
+@st.cache_resource
+def load_streak_index(file_path):
+    """Constrói (uma vez por versão do dataset) o índice de sequências de todos os times."""
+    return load_engine(file_path).streaks
+
+
+@st.cache_resource
+def load_head_to_head(file_path):
+    """Constrói (uma vez por versão do dataset) o índice de confrontos diretos."""
+    return load_engine(file_path).head_to_head
+
+
+@st.cache_resource
+def load_form_table(file_path):
+    """Constrói (uma vez por versão do dataset) as tabelas de forma (últimos N jogos)."""
+    return memory_profiler.measure('ranking: forma', lambda: load_engine(file_path).form)
+
+
+@st.cache_resource
+def load_logos():
+    """Logos dos times (miniaturas locais em data URI, com fallback remoto), uma vez por processo."""
+    return LogoCatalog.from_directory()
+
+
+@st.cache_resource
+def load_ranking_renders(file_path):
+    """Cache (por versão do dataset) do HTML já renderizado de cada combinação de ranking."""
+    return ranking_render_cache(load_standings_cube(file_path), load_form_table(file_path), load_logos().mapping(20))
+
+
+@st.cache_resource
+def load_team_charts(file_path, team):
+    """Specs Vega-Lite (enxutos) dos gráficos de evolução do time, gerados uma vez por versão do dataset."""
+    return memory_profiler.measure(f'gráficos: {team}', load_engine(file_path).team_chart_specs, team)
+
+
+def debug_enabled():
+    """Modo debug (painel de tempos): `?debug=1` na URL ou BRASILEIRAO_DEBUG=1."""
+    return os.environ.get('BRASILEIRAO_DEBUG') == '1' or st.query_params.get('debug') == '1'
+
+
+def start_rerun(page):
+    """Cronômetro do rerun atual da página (fases marcadas com `lap`)."""
+    return RerunTimer(page)
+
+
+def finish_rerun(timer, panel=True, **selection):
+    """
+    Fecha o rerun: com o modo debug, mostra a divisão do tempo na barra lateral; grava o
+    registro (página, seleção, fases) no log JSON-lines quando debug ou log estão ativos.
+    Dentro de um st.fragment use `panel=False` (o fragmento não escreve na barra lateral).
+    """
+    record = timer.record(selection)
+    if memory_profiler.stats:
+        record['memoria'] = dict(memory_profiler.stats)
+    debug = debug_enabled()
+
+    if debug and panel:
+        phases = pd.DataFrame(list(record['fases'].items()), columns=['Fase', 'ms'])
+        phases['%'] = (phases['ms'] / record['total_ms'] * 100).round(1)
+        st.sidebar.markdown("### ⏱️ Tempo do Rerun")
+        st.sidebar.caption(f"Total: {record['total_ms']:.1f} ms")
+        st.sidebar.dataframe(phases.round({'ms': 1}), hide_index=True, use_container_width=True)
+        if record['detalhes']:
+            details = pd.DataFrame(list(record['detalhes'].items()), columns=['Detalhe', 'ms'])
+            st.sidebar.dataframe(details.round({'ms': 1}), hide_index=True, use_container_width=True)
+        if memory_profiler.stats:
+            memory = pd.DataFrame.from_dict(memory_profiler.stats, orient='index')
+            st.sidebar.markdown("### 🧠 Memória (tracemalloc)")
+            st.sidebar.dataframe(memory.rename(columns={'pico_kib': 'Pico (KiB)', 'retido_kib': 'Retido (KiB)'}),
+                                 use_container_width=True)
+
+    if debug or 'BRASILEIRAO_TIMING_LOG' in os.environ:
+        try:
+            append_record(record, TIMING_LOG)
+        except OSError:
+            pass # O log é só diagnóstico: falha de escrita não pode derrubar a página
+    return record
@@ -1,192 +1,27 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import os
+
+from brasileirao.form import FORM_WINDOWS
+from common import (finish_rerun, load_engine, load_form_table, load_head_to_head, load_logos,
+                    load_metrics_table, load_positions, select_season, start_rerun)
 
 # --- Configurações de Página ---
 st.set_page_config(layout="wide", page_title="⚔️ Duelo Times - Análise Comparativa")
 
-# --- Variáveis Globais (Ajuste o caminho se necessário) ---
-FILE_PATH = 'df.xlsx' 
-
-# Dicionário de Logos dos Times (REPLICADO)
-TEAM_LOGOS = {
-    'Fortaleza Ec Saf': 'https://upload.wikimedia.org/wikipedia/commons/e/e9/Fortaleza_EC_2018.png',
-    'Juventude': 'https://upload.wikimedia.org/wikipedia/de/c/cd/Juventude_logo.svg',
-    'Cruzeiro Saf': 'https://upload.wikimedia.org/wikipedia/commons/thumb/9/90/Cruzeiro_Esporte_Clube_%28logo%29.svg/250px-Cruzeiro_Esporte_Clube_%28logo%29.svg.png',
-    'Vasco da Gama S.a.f.': 'https://upload.wikimedia.org/wikipedia/pt/thumb/8/8b/EscudoDoVascoDaGama.svg/950px-EscudoDoVascoDaGama.svg.png',
-    'Grêmio': 'https://upload.wikimedia.org/wikipedia/commons/thumb/0/08/Gremio_logo.svg/250px-Gremio_logo.svg.png',
-    'Palmeiras': 'https://upload.wikimedia.org/wikipedia/commons/thumb/1/10/Palmeiras_logo.svg/250px-Palmeiras_logo.svg.png',
-    'Flamengo': 'https://upload.wikimedia.org/wikipedia/commons/thumb/2/2e/Flamengo_braz_logo.svg/250px-Flamengo_braz_logo.svg.png',
-    'Bahia': 'https://upload.wikimedia.org/wikipedia/pt/thumb/9/90/ECBahia.png/250px-ECBahia.png',
-    'Botafogo': 'https://upload.wikimedia.org/wikipedia/commons/thumb/5/52/Botafogo_de_Futebol_e_Regatas_logo.svg/1064px-Botafogo_de_Futebol_e_Regatas_logo.svg.png',
-    'São Paulo': 'https://upload.wikimedia.org/wikipedia/commons/thumb/6/6f/Brasao_do_Sao_Paulo_Futebol_Clube.svg/1024px-Brasao_do_Sao_Paulo_Futebol_Clube.svg.png',
-    'Corinthians': 'https://upload.wikimedia.org/wikipedia/pt/thumb/b/b4/Corinthians_simbolo.png/250px-Corinthians_simbolo.png',
-    'Ceará': 'https://upload.wikimedia.org/wikipedia/commons/thumb/3/38/Cear%C3%A1_Sporting_Club_logo.svg/1081px-Cear%C3%A1_Sporting_Club_logo.svg.png',
-    'Red Bull Bragantino': 'https://upload.wikimedia.org/wikipedia/pt/thumb/9/9e/RedBullBragantino.png/250px-RedBullBragantino.png',
-    'Internacional': 'https://upload.wikimedia.org/wikipedia/commons/thumb/a/ae/SC_Internacional_Brazil_Logo.svg/250px-SC_Internacional_Brazil_Logo.svg.png',
-    'Sport Recife': 'https://upload.wikimedia.org/wikipedia/pt/1/17/Sport_Club_do_Recife.png',
-    'Mirassol': 'https://upload.wikimedia.org/wikipedia/commons/5/5b/Mirassol_FC_logo.png',
-    'Atlético Mineiro Saf': 'https://upload.wikimedia.org/wikipedia/commons/thumb/5/5f/Atletico_mineiro_galo.png/250px-Atletico_mineiro_galo.png',
-    'Santos Fc': 'https://upload.wikimedia.org/wikipedia/commons/thumb/3/35/Santos_logo.svg/1045px-Santos_logo.svg.png',
-    'Fluminense': 'https://upload.wikimedia.org/wikipedia/commons/thumb/1/12/Fluminense_Football_Club.svg/250px-Fluminense_Football_Club.svg.png',
-    'Vitória': 'https://upload.wikimedia.org/wikipedia/pt/3/34/Esporte_Clube_Vit%C3%B3ria_logo.png'
-}
-
-
-@st.cache_data
-def load_data(file_path):
-    """Carrega os dados do Excel com tratamento de erros."""
-    if not os.path.exists(file_path):
-          st.error(f"Erro: O arquivo não foi encontrado no caminho especificado: `{file_path}`.")
-          return pd.DataFrame() 
-    
-    try:
-        df = pd.read_excel(file_path)
-        # Conversão de tipos importantes
-        df['Ordem_Jogo'] = df['Ordem_Jogo'].astype(int)
-        df['Posicao_Jogo'] = df['Posicao_Jogo'].astype(int)
-        return df
-    except Exception as e:
-        st.error(f"Erro ao carregar ou processar os dados do Excel: {e}. Verifique a estrutura do arquivo.")
-        return pd.DataFrame()
-    
-# --- NOVO: Função para Desempenho Recente ---
-def get_recent_performance(df, team_name, local_filter=None, n_games=3):
-    """
-    Calcula o desempenho nos últimos N jogos, com filtro opcional por Local.
-    Retorna um dicionário com V, E, D, Pts, AP e uma lista com os resultados (V/E/D).
-    """
-    # 1. Filtra os jogos onde o time é Time1 (Time1 foi padronizado para o time em foco)
-    df_team = df[(df['Time1'] == team_name)].copy()
-    df_team.drop_duplicates(subset=['Ordem_Jogo'], keep='first', inplace=True)
-
-    # 2. Aplica filtro de Local
-    if local_filter:
-        df_team = df_team[df_team['Local'] == local_filter]
-        
-    # 3. Ordena e pega os N jogos mais recentes
-    # 'Ordem_Jogo' é a chave para o mais recente (maior valor)
-    df_recent = df_team.sort_values(by='Ordem_Jogo', ascending=False).head(n_games)
-
-    if df_recent.empty:
-        return {'V': 0, 'E': 0, 'D': 0, 'P': 0, 'AP': 0.0, 'Results': []}
-
-    total_games = len(df_recent)
-    
-    # 4. Resultados V/E/D
-    results_count = df_recent['Resultado'].value_counts().to_dict()
-    victories = results_count.get('V', 0)
-    draws = results_count.get('E', 0)
-    defeats = results_count.get('D', 0)
-    
-    # 5. Pontos e Aproveitamento
-    total_points = (victories * 3) + (draws * 1)
-    aproveitamento = (total_points / (total_games * 3)) * 100 if total_games > 0 else 0
-    
-    # 6. Lista dos resultados (para exibição)
-    results_list = df_recent['Resultado'].tolist() # Lista de ['V', 'E', 'D']
-
-    return {
-        'V': victories,
-        'E': draws,
-        'D': defeats,
-        'P': total_points,
-        'AP': aproveitamento,
-        'Results': results_list
-    }
-
+# Cronômetro do rerun (fases de carga, cálculo e renderização; painel com ?debug=1)
+timer = start_rerun('Duelo Times')
 
-# --- Funções de Cálculo (Reutilizada da página anterior) ---
+# --- Variáveis Globais (Ajuste o caminho se necessário) ---
+# Logos dos times (mapeamento único em brasileirao/logos.py; miniaturas locais em data URI)
+logos = load_logos()
 
-def calculate_team_metrics(df, team_name, local_filter=None):
-    """
-    Calcula as métricas de V/E/D, Gols Marcados/Sofridos, Pontos Acumulados 
-    e as novas métricas GPJ e PPJ para um time, com filtro opcional por Local.
-    """
-    df_team = df[(df['Time1'] == team_name)].copy() 
-    df_team.drop_duplicates(subset=['Ordem_Jogo'], keep='first', inplace=True) 
-    
-    # 1. Calcular GS, GC, Saldo, Pontos_Jogo
-    df_team['GS'] = df_team.apply(
-        lambda row: row['Gols1'] if row['Time1'] == team_name else row['Gols2'], axis=1
-    )
-    df_team['GC'] = df_team.apply(
-        lambda row: row['Gols2'] if row['Time1'] == team_name else row['Gols1'], axis=1
-    )
-    df_team['Saldo_Jogo'] = df_team['GS'] - df_team['GC']
-    df_team['Pontos_Jogo'] = df_team['Resultado'].map({'V': 3, 'E': 1, 'D': 0})
-    
-    if local_filter:
-        df_team = df_team[df_team['Local'] == local_filter]
-
-    # 2. Resumir as métricas
-    if df_team.empty or len(df_team) == 0:
-        return {
-            'P': 0, 'J': 0, 'V': 0, 'E': 0, 'D': 0, 
-            'GM': 0, 'GC': 0, 'SG': 0, 'AP': 0.0,
-            'GPJ': 0.0, 'PPJ': 0.0
-        }
-
-    total_games = len(df_team)
-    total_points = df_team['Pontos_Jogo'].sum()
-    total_gm = df_team['GS'].sum()
-    total_gc = df_team['GC'].sum()
-    
-    # Cálculos Avançados
-    aproveitamento = (total_points / (total_games * 3)) * 100 if total_games > 0 else 0
-    gols_por_jogo = total_gm / total_games if total_games > 0 else 0
-    pontos_por_jogo = total_points / total_games if total_games > 0 else 0
-    
-    results_count = df_team['Resultado'].value_counts().to_dict()
-
-    # NOVO: Cálculo do Desempenho Recente
-    recent_performance = get_recent_performance(df, team_name, local_filter=local_filter, n_games=3)
-
-    return {
-        'P': total_points,
-        'J': total_games,
-        'V': results_count.get('V', 0),
-        'E': results_count.get('E', 0),
-        'D': results_count.get('D', 0),
-        'GM': total_gm,
-        'GC': total_gc,
-        'SG': df_team['Saldo_Jogo'].sum(),
-        'AP': aproveitamento,
-        'GPJ': gols_por_jogo,
-        'PPJ': pontos_por_jogo,
-        'RECENT': recent_performance
-    }
-
-def create_ranking_dataframe(df, all_teams):
-    """
-    Cria um DataFrame de ranking GERAL para determinar a colocação atual.
-    """
-    ranking_list = []
-    
-    for team in all_teams:
-        metrics = calculate_team_metrics(df, team)
-        metrics['Time'] = team
-        ranking_list.append(metrics)
-        
-    ranking_df = pd.DataFrame(ranking_list)
-    
-    # Ordenação padrão para Classificação Geral
-    ranking_df = ranking_df.sort_values(
-        by=['P', 'V', 'SG', 'GM'], 
-        ascending=[False, False, False, False]
-    ).reset_index(drop=True)
-    
-    ranking_df.index = ranking_df.index + 1 # Posição começando em 1
-    ranking_df.index.name = 'Pos'
-    
-    return ranking_df
 
 # --- Funções de Componentes Visuais ---
 
 def display_team_header(team_name, role):
     """Exibe o logo e o nome do time com a função (Casa/Fora)."""
-    logo_url = TEAM_LOGOS.get(team_name, 'https://placehold.co/50x50/cccccc/333333?text=?')
+    logo_url = logos.url(team_name, 50)
     
     # Renderiza o logo e o nome
     st.markdown(f"""
@@ -278,6 +113,7 @@ def display_metrics(metrics, current_pos, df_head_to_head):
             gols_time2 = row['Gols2']
             local = row['Local']
             ordem_jogo = row['Ordem_Jogo']
+            turno = row['Turno']
 
             # Inicializa a string de placar e a cor
             score_text = ""
@@ -305,7 +141,7 @@ def display_metrics(metrics, current_pos, df_head_to_head):
             # Formata o texto do resultado com a cor e negrito usando HTML/Markdown
             # Usamos <b> para negrito e o estilo de cor diretamente no span
             st.markdown(
-                f'<span style="color: {color_hex};"><b>Resultado: {score} - Jogo {ordem_jogo} - Local {local}</b></span>', 
+                f'<span style="color: {color_hex};"><b>Resultado: {score} - {turno}º Turno - Jogo {ordem_jogo} - Local {local}</b></span>', 
                 unsafe_allow_html=True
             )
 
@@ -317,7 +153,10 @@ def display_metrics(metrics, current_pos, df_head_to_head):
 # --- Lógica Principal da Página ---
 
 # 1. Carregamento e Verificação de Dados
-df = load_data(FILE_PATH)
+# Temporada escolhida na barra lateral (só a partição dela é lida)
+data_source = select_season()
+engine = load_engine(data_source)
+df = engine.frame
 
 if df.empty:
     st.warning("Não foi possível carregar os dados. Verifique o caminho do arquivo.")
@@ -326,71 +165,98 @@ if df.empty:
 all_teams = pd.unique(df[['Time1', 'Time2']].values.ravel('K'))
 all_teams.sort()
 
-# Prepara o Ranking Geral para Colocação Atual
-ranking_geral = create_ranking_dataframe(df, all_teams)
+# Estruturas consultadas pelo duelo, montadas na carga (uma vez por versão do dataset):
+# métricas Geral/Casa/Fora, tabelas de forma (últimos 3/5/10 jogos), colocação atual e o
+# índice de confrontos diretos. O fragmento só consulta o motor.
+load_metrics_table(data_source)
+load_form_table(data_source)
+load_positions(data_source)
+load_head_to_head(data_source)
+timer.lap('carga')
 
 
 st.title("⚔️ Duelo Times: Análise Comparativa")
 st.markdown("---")
 
-# 2. Seleção dos Times
-st.header("Selecione os Times para o Duelo")
-col_t1, col_t2 = st.columns(2)
-
-# Time 1 (Casa)
-team1_name = col_t1.selectbox(
-    "Time da Casa (Time 1):",
-    all_teams,  
-    index=0
-)
-
-# Time 2 (Fora)
-# Garante que o time 2 não seja o mesmo que o time 1
-filtered_teams = all_teams[all_teams != team1_name]
-team2_name = col_t2.selectbox(
-    "Time Visitante (Time 2):",
+
+@st.fragment
+def duel(all_teams, engine):
+    """
+    Seleção dos times + as duas colunas do duelo. Trocar um time ou a janela de jogos reroda
+    só este fragmento (carga e título ficam de fora). Dependência: o motor em cache da
+    fonte, com as estruturas já montadas. As duas colunas ficam juntas porque o histórico
+    do confronto de cada uma depende dos dois times.
+    """
+    fragment_timer = start_rerun('Duelo Times › duelo')
+
+    # 2. Seleção dos Times
+    st.header("Selecione os Times para o Duelo")
+    col_t1, col_t2 = st.columns(2)
+
+    # Time 1 (Casa)
+    team1_name = col_t1.selectbox(
+        "Time da Casa (Time 1):",
         all_teams,
-    index=0
-)
+        index=0
+    )
 
-st.markdown("---")
+    # Time 2 (Fora)
+    team2_name = col_t2.selectbox(
+        "Time Visitante (Time 2):",
+        all_teams,
+        index=0
+    )
+
+    # Janela do desempenho recente (número de jogos)
+    n_recent_games = st.radio(
+        "Desempenho Recente (Últimos Jogos):",
+        FORM_WINDOWS,
+        index=0,
+        horizontal=True
+    )
+
+    st.markdown("---")
+    fragment_timer.lap('seleção')
+
+    # 3. Cálculo das Métricas e Preparação dos Dados
+
+    # Métricas Time 1 (Casa): Apenas jogos em CASA ('C')
+    metrics_t1_home = engine.duel_metrics(team1_name, local_filter='C', n_games=n_recent_games)
+    metrics_t1_home['Time'] = team1_name
+    pos_t1 = engine.positions.get(team1_name, 'N/A')
+
+    # Métricas Time 2 (Fora): Apenas jogos FORA ('F')
+    metrics_t2_away = engine.duel_metrics(team2_name, local_filter='F', n_games=n_recent_games)
+    metrics_t2_away['Time'] = team2_name
+    pos_t2 = engine.positions.get(team2_name, 'N/A')
+
+    # Histórico de Jogos entre os dois times, na perspectiva de cada um (índice de confrontos diretos)
+    df_head_to_head_t1 = engine.meetings(team1_name, team2_name).iloc[::-1]
+    df_head_to_head_t2 = engine.meetings(team2_name, team1_name).iloc[::-1]
+    fragment_timer.lap('cálculo')
+
+    # 4. Exibição do Duelo
+    col_display_t1, col_vs, col_display_t2 = st.columns([2, 0.5, 2])
+
+    # --- Coluna Time 1 (Casa) ---
+    with col_display_t1:
+        display_team_header(team1_name, "Joga em Casa")
+        display_metrics(metrics_t1_home, pos_t1, df_head_to_head_t1)
+
+    # --- Coluna VS ---
+    with col_vs:
+        st.markdown("<h1 style='text-align: center; margin-top: 100px;'>VS</h1>", unsafe_allow_html=True)
+
+    # --- Coluna Time 2 (Fora) ---
+    with col_display_t2:
+        display_team_header(team2_name, "Joga Fora")
+        display_metrics(metrics_t2_away, pos_t2, df_head_to_head_t2)
+    fragment_timer.lap('render')
+
+    finish_rerun(fragment_timer, panel=False, fonte=data_source, time1=team1_name, time2=team2_name, jogos=n_recent_games)
+
+
+duel(all_teams, engine)
+timer.lap('duelo')
 
-# 3. Cálculo das Métricas e Preparação dos Dados
-
-# Métricas Time 1 (Casa): Apenas jogos em CASA ('C')
-metrics_t1_home = calculate_team_metrics(df, team1_name, local_filter='C')
-metrics_t1_home['Time'] = team1_name # <-- ADICIONE A CHAVE 'Time' AQUI
-pos_t1 = ranking_geral.loc[ranking_geral['Time'] == team1_name].index[0] if not ranking_geral[ranking_geral['Time'] == team1_name].empty else 'N/A'
-
-# Métricas Time 2 (Fora): Apenas jogos FORA ('F')
-metrics_t2_away = calculate_team_metrics(df, team2_name, local_filter='F')
-metrics_t2_away['Time'] = team2_name # <-- ADICIONE A CHAVE 'Time' AQUI
-pos_t2 = ranking_geral.loc[ranking_geral['Time'] == team2_name].index[0] if not ranking_geral[ranking_geral['Time'] == team2_name].empty else 'N/A'
-
-# Histórico de Jogos entre os dois times
-df_head_to_head = df[
-    ((df['Time1'] == team1_name) & (df['Time2'] == team2_name)) 
-    # | ((df['Time1'] == team2_name) & (df['Time2'] == team1_name))
-].sort_values(by='Ordem_Jogo', ascending=False)
-
-
-# 4. Exibição do Duelo
-col_display_t1, col_vs, col_display_t2 = st.columns([2, 0.5, 2])
-
-# --- Coluna Time 1 (Casa) ---
-with col_display_t1:
-    display_team_header(team1_name, "Joga em Casa")
-    display_metrics(metrics_t1_home, pos_t1, 
-                    df_head_to_head[(df_head_to_head['Time1'] == team1_name) | 
-                                    (df_head_to_head['Time2'] == team1_name)])
-
-# --- Coluna VS ---
-with col_vs:
-    st.markdown("<h1 style='text-align: center; margin-top: 100px;'>VS</h1>", unsafe_allow_html=True)
-
-# --- Coluna Time 2 (Fora) ---
-with col_display_t2:
-    display_team_header(team2_name, "Joga Fora")
-    display_metrics(metrics_t2_away, pos_t2, 
-                    df_head_to_head[(df_head_to_head['Time1'] == team2_name) | 
-                                    (df_head_to_head['Time2'] == team2_name)])
\ No newline at end of file
+finish_rerun(timer, fonte=data_source)